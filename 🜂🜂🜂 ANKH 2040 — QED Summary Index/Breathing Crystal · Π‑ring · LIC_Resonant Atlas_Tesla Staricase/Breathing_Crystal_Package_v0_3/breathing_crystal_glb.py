@@ -0,0 +1,233 @@
+
+# Breathing Crystal GLB — breathing_crystal_glb_spec_v0_3.json → binary glTF 2.0 (.glb), numpy only
+# Usage: python3 breathing_crystal_glb.py                                  # → breathing_crystal_v0_3.glb
+#        python3 breathing_crystal_glb.py --torus-segments 1024 256 --sphere-segments 256 128 --out hires.glb
+#
+# Meshes are built as whole numpy vertex / index buffers (no per-vertex Python): tori and the I-AN sphere on
+# (u, v) grids with wrap-around indices, the RA / TH flows as tubes swept along Archimedean spirals.
+# Membranes with the same radius / tube share one set of POSITION / NORMAL / index accessors (one mesh per
+# membrane only to carry its own material), placed by node translations. The timeline CSV is baked into
+# animation samplers sharing one time accessor: `<name>[i].x|y|z` channels become translation tracks,
+# `.emissive` channels animate the material's emissiveFactor through KHR_animation_pointer (core glTF can
+# only animate node transforms), values mapped from [−1, 1] to [0, 1].
+import argparse, json, os, re, struct
+import numpy as np
+
+SPEC = "breathing_crystal_glb_spec_v0_3.json"
+MEMBRANE_COLORS = [(1.0, 0.45, 0.2), (1.0, 0.8, 0.25), (0.55, 0.85, 1.0)]
+REGULATOR_COLOR = (1.0, 0.92, 0.6)
+FLOW_COLORS = {"RA": (0.3, 0.9, 1.0), "TH": (1.0, 0.35, 0.75)}
+ARRAY_BUFFER, ELEMENT_ARRAY_BUFFER = 34962, 34963
+FLOAT, UINT32 = 5126, 5125
+
+# ---------- meshes ----------
+def _grid_indices(nu, nv, wrap_v=True):
+    # two triangles per (u, v) cell of an nu × nv vertex grid, u wrapping around (v too if wrap_v)
+    u, v = np.meshgrid(np.arange(nu), np.arange(nv if wrap_v else nv - 1), indexing="ij")
+    u1, v1 = (u + 1) % nu, (v + 1) % nv
+    a, b, c, d = u*nv + v, u1*nv + v, u1*nv + v1, u*nv + v1
+    return np.stack([a, b, c, a, c, d], axis=-1).reshape(-1, 3).astype(np.uint32)
+
+def torus(radius=1.0, tube=0.05, nu=256, nv=64):
+    # (positions, normals, indices) of a torus around z
+    u = np.linspace(0, 2*np.pi, nu, endpoint=False)[:, None]
+    v = np.linspace(0, 2*np.pi, nv, endpoint=False)[None, :]
+    n = np.stack(np.broadcast_arrays(np.cos(u)*np.cos(v), np.sin(u)*np.cos(v), np.sin(v)*np.ones_like(u)), -1)
+    ring = np.stack(np.broadcast_arrays(np.cos(u), np.sin(u), np.zeros_like(v)), -1)
+    pos = radius*ring + tube*n
+    return pos.reshape(-1, 3).astype(np.float32), n.reshape(-1, 3).astype(np.float32), _grid_indices(nu, nv)
+
+def sphere(radius=0.2, nu=128, nv=64):
+    # UV sphere; rows of latitude from pole to pole (no wrap in latitude, zero-area pole triangles dropped)
+    u = np.linspace(0, 2*np.pi, nu, endpoint=False)[:, None]
+    th = np.linspace(0, np.pi, nv)[None, :]
+    n = np.stack(np.broadcast_arrays(np.cos(u)*np.sin(th), np.sin(u)*np.sin(th), np.cos(th)*np.ones_like(u)), -1)
+    idx = _grid_indices(nu, nv, wrap_v=False)[:, ::-1]                   # counter-clockwise seen from outside
+    v = idx % nv
+    pole = ((v == 0) | (v == nv - 1)).sum(axis=1) >= 2
+    return ((radius*n).reshape(-1, 3).astype(np.float32), n.reshape(-1, 3).astype(np.float32),
+            np.ascontiguousarray(idx[~pole]))
+
+def spiral_tube(turns=3, r_end=1.0, tube=0.015, n=1024, nv=12, z_sign=1.0):
+    # tube around the Archimedean spiral ρ = r_end·s, φ = 2π·turns·s (s ∈ [0, 1]) in the z = 0 plane;
+    # open ends, ring frame (tangent-normal in plane, z)
+    s = np.linspace(0, 1, n)
+    phi = 2*np.pi*turns*s*z_sign
+    c = np.stack([r_end*s*np.cos(phi), r_end*s*np.sin(phi), np.zeros(n)], -1)
+    t = np.gradient(c, axis=0)
+    t /= np.linalg.norm(t, axis=1, keepdims=True)
+    side = np.cross(t, [0.0, 0.0, 1.0])
+    side /= np.linalg.norm(side, axis=1, keepdims=True)
+    a = np.linspace(0, 2*np.pi, nv, endpoint=False)
+    nrm = np.cos(a)[None, :, None]*side[:, None, :] + np.sin(a)[None, :, None]*np.array([0.0, 0.0, 1.0])
+    pos = c[:, None, :] + tube*nrm
+    u, v = np.meshgrid(np.arange(n - 1), np.arange(nv), indexing="ij")
+    a0, b0, c0, d0 = u*nv + v, (u+1)*nv + v, (u+1)*nv + (v+1) % nv, u*nv + (v+1) % nv
+    idx = np.stack([a0, b0, c0, a0, c0, d0], axis=-1).reshape(-1, 3).astype(np.uint32)
+    return pos.reshape(-1, 3).astype(np.float32), nrm.reshape(-1, 3).astype(np.float32), idx
+
+# ---------- glTF assembly ----------
+class GLB:
+    # accumulates one binary buffer plus the JSON tables that index into it
+    def __init__(self):
+        self.blob, self.gltf = bytearray(), dict(asset=dict(version="2.0", generator="breathing_crystal_glb.py"),
+            scene=0, scenes=[dict(nodes=[])], nodes=[], meshes=[], materials=[], accessors=[], bufferViews=[],
+            buffers=[], animations=[])
+
+    def view(self, arr, target=None):
+        while len(self.blob) % 4: self.blob.append(0)
+        bv = dict(buffer=0, byteOffset=len(self.blob), byteLength=arr.nbytes)
+        if target: bv["target"] = target
+        self.blob += arr.tobytes()
+        self.gltf["bufferViews"].append(bv)
+        return len(self.gltf["bufferViews"]) - 1
+
+    def accessor(self, arr, kind, target=None, bounds=False):
+        # kind: SCALAR / VEC3 / …; arr float32 or uint32, one row per element
+        arr = np.ascontiguousarray(arr)
+        acc = dict(bufferView=self.view(arr, target), componentType=UINT32 if arr.dtype == np.uint32 else FLOAT,
+                   count=len(arr), type=kind)
+        if bounds:
+            flat = arr.reshape(len(arr), -1)
+            acc["min"], acc["max"] = flat.min(axis=0).tolist(), flat.max(axis=0).tolist()
+        self.gltf["accessors"].append(acc)
+        return len(self.gltf["accessors"]) - 1
+
+    def geometry(self, pos, nrm, idx):
+        # shared attribute set: {POSITION, NORMAL} accessors + index accessor
+        return (dict(POSITION=self.accessor(pos, "VEC3", ARRAY_BUFFER, bounds=True),
+                     NORMAL=self.accessor(nrm, "VEC3", ARRAY_BUFFER)),
+                self.accessor(idx.reshape(-1), "SCALAR", ELEMENT_ARRAY_BUFFER))
+
+    def material(self, name, color, emissive=(0.0, 0.0, 0.0), metallic=0.1, roughness=0.4, alpha=1.0):
+        mat = dict(name=name, pbrMetallicRoughness=dict(baseColorFactor=list(color) + [alpha],
+                   metallicFactor=metallic, roughnessFactor=roughness), emissiveFactor=list(emissive))
+        if alpha < 1: mat["alphaMode"] = "BLEND"; mat["doubleSided"] = True
+        self.gltf["materials"].append(mat)
+        return len(self.gltf["materials"]) - 1
+
+    def node(self, name, geom, material, translation=(0, 0, 0)):
+        attrs, ind = geom
+        self.gltf["meshes"].append(dict(name=name, primitives=[dict(attributes=attrs, indices=ind, material=material)]))
+        self.gltf["nodes"].append(dict(name=name, mesh=len(self.gltf["meshes"]) - 1,
+                                       translation=[float(x) for x in translation]))
+        self.gltf["scenes"][0]["nodes"].append(len(self.gltf["nodes"]) - 1)
+        return len(self.gltf["nodes"]) - 1
+
+    def tobytes(self):
+        g = {k: v for k, v in self.gltf.items() if v != []}
+        while len(self.blob) % 4: self.blob.append(0)
+        g["buffers"] = [dict(byteLength=len(self.blob))]
+        js = json.dumps(g, separators=(",", ":")).encode()
+        js += b" "*(-len(js) % 4)
+        total = 12 + 8 + len(js) + 8 + len(self.blob)
+        return (struct.pack("<III", 0x46546C67, 2, total) + struct.pack("<II", len(js), 0x4E4F534A) + js
+                + struct.pack("<II", len(self.blob), 0x004E4942) + bytes(self.blob))
+
+# ---------- animation ----------
+def read_timeline(path):
+    # {column: float array} of a timeline CSV (triad_bands_param_app.py output)
+    with open(path) as f:
+        header = f.readline().strip().split(",")
+    data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+    return {h: data[:, i] for i, h in enumerate(header)}
+
+_TARGET = re.compile(r"^(\w+)(?:\[(\d+)\])?\.(\w+)$")
+
+def bake_animation(glb, spec, cols, targets):
+    # spec["animation"]["channels"] → one glTF animation; targets: {"membrane": [(node, material)], …}
+    chans = spec.get("animation", {}).get("channels", [])
+    if not chans: return None
+    t = cols[next(iter(cols))].astype(np.float32)            # first CSV column is time
+    t_acc = glb.accessor(t, "SCALAR", bounds=True)
+    samplers, channels, moves = [], [], {}
+    for ch in chans:
+        m = _TARGET.match(ch["target"])
+        if not m: raise ValueError(f"bad channel target {ch['target']!r}")
+        name, i, prop = m.group(1), int(m.group(2) or 0), m.group(3)
+        node, mat = targets[name][i]
+        v = cols[ch["source"]]*ch.get("scale", 1.0)
+        if prop == "emissive":
+            color = np.array(glb.gltf["materials"][mat]["pbrMetallicRoughness"]["baseColorFactor"][:3])
+            out = (np.clip((v + 1)/2, 0, 1)[:, None]*color[None, :]).astype(np.float32)
+            samplers.append(dict(input=t_acc, output=glb.accessor(out, "VEC3"), interpolation="LINEAR"))
+            channels.append(dict(sampler=len(samplers) - 1, target=dict(path="pointer", extensions=dict(
+                KHR_animation_pointer=dict(pointer=f"/materials/{mat}/emissiveFactor")))))
+        elif prop in "xyz":
+            moves.setdefault(node, {})["xyz".index(prop)] = v
+        else:
+            raise ValueError(f"unsupported channel property {prop!r}")
+    for node, axes in moves.items():                          # one translation track per moved node
+        out = np.tile(np.array(glb.gltf["nodes"][node]["translation"], dtype=np.float64), (len(t), 1))
+        for k, v in axes.items(): out[:, k] += v
+        samplers.append(dict(input=t_acc, output=glb.accessor(out.astype(np.float32), "VEC3"), interpolation="LINEAR"))
+        channels.append(dict(sampler=len(samplers) - 1, target=dict(node=node, path="translation")))
+    glb.gltf["animations"].append(dict(name="breathing", samplers=samplers, channels=channels))
+    if any(c["target"].get("path") == "pointer" for c in channels):
+        glb.gltf["extensionsUsed"] = ["KHR_animation_pointer"]
+    return len(glb.gltf["animations"]) - 1
+
+# ---------- scene ----------
+def build(spec, timeline=None, torus_segments=(256, 64), sphere_segments=(128, 64), spiral_segments=(1024, 12),
+          flow_tube=0.015):
+    glb = GLB()
+    geo = spec["geometry"]
+    targets = {"membrane": [], "regulator": [], "flows": []}
+    shared = {}
+    for i, m in enumerate(geo.get("membranes", [])):
+        key = (m["radius"], m["tube"])
+        if key not in shared: shared[key] = glb.geometry(*torus(m["radius"], m["tube"], *torus_segments))
+        mat = glb.material(f"membrane_{m.get('band_center', i)}", MEMBRANE_COLORS[i % len(MEMBRANE_COLORS)],
+                           alpha=0.85)
+        node = glb.node(f"membrane[{i}]", shared[key], mat, (0, 0, m.get("z", 0.0)))
+        targets["membrane"].append((node, mat))
+    if "regulator" in geo:
+        r = geo["regulator"]
+        mat = glb.material(r.get("name", "regulator"), REGULATOR_COLOR, emissive=(0.25, 0.2, 0.1), metallic=0.6)
+        node = glb.node(r.get("name", "regulator"), glb.geometry(*sphere(r["radius"], *sphere_segments)), mat)
+        targets["regulator"].append((node, mat))
+    r_end = max([m["radius"] for m in geo.get("membranes", [])] or [1.0])
+    for f in geo.get("flows", []):
+        o = f.get("origin", [0, 0, 0])
+        mat = glb.material(f["name"], FLOW_COLORS.get(f["name"], (0.8, 0.8, 0.8)), emissive=(0.1, 0.1, 0.1))
+        tube = spiral_tube(f.get("turns", 3), r_end, flow_tube, *spiral_segments, z_sign=1.0 if o[2] >= 0 else -1.0)
+        node = glb.node(f["name"], glb.geometry(*tube), mat, o)
+        targets["flows"].append((node, mat))
+    if timeline is not None:
+        bake_animation(glb, spec, timeline, targets)
+    return glb
+
+def export(spec_path=SPEC, out="breathing_crystal_v0_3.glb", timeline_csv=None, **kw):
+    with open(spec_path) as f:
+        spec = json.load(f)
+    csv = timeline_csv or spec.get("animation", {}).get("timeline_csv")
+    if csv and not os.path.isabs(csv) and not os.path.exists(csv):
+        csv = os.path.join(os.path.dirname(os.path.abspath(spec_path)), csv)
+    glb = build(spec, read_timeline(csv) if csv and os.path.exists(csv) else None, **kw)
+    data = glb.tobytes()
+    with open(out, "wb") as f:
+        f.write(data)
+    return out, len(data), glb
+
+def main(argv=None):
+    import time
+    ap = argparse.ArgumentParser(prog="breathing_crystal_glb.py")
+    ap.add_argument("--spec", type=str, default=SPEC)
+    ap.add_argument("--timeline", type=str, default=None, help="timeline CSV (default: the spec's timeline_csv)")
+    ap.add_argument("--out", type=str, default="breathing_crystal_v0_3.glb")
+    ap.add_argument("--torus-segments", nargs=2, type=int, default=[256, 64], metavar=("U", "V"))
+    ap.add_argument("--sphere-segments", nargs=2, type=int, default=[128, 64], metavar=("U", "V"))
+    ap.add_argument("--spiral-segments", nargs=2, type=int, default=[1024, 12], metavar=("ALONG", "AROUND"))
+    ap.add_argument("--flow-tube", type=float, default=0.015, help="radius of the RA / TH flow tubes")
+    args = ap.parse_args(argv)
+    t0 = time.perf_counter()
+    out, size, glb = export(args.spec, args.out, args.timeline, torus_segments=tuple(args.torus_segments),
+                            sphere_segments=tuple(args.sphere_segments), spiral_segments=tuple(args.spiral_segments),
+                            flow_tube=args.flow_tube)
+    verts = sum(a["count"] for a in glb.gltf["accessors"] if "min" in a and a["type"] == "VEC3")
+    print(f"{out}: {size/2**20:.2f} MiB, {len(glb.gltf['nodes'])} nodes, {verts} unique vertices, "
+          f"{len(glb.gltf['animations'])} animation(s) [{time.perf_counter() - t0:.2f}s]")
+    return out
+
+if __name__ == "__main__":
+    main()
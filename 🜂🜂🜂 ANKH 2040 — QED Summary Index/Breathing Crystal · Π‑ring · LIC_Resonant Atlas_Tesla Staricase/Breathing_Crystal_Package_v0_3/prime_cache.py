@@ -0,0 +1,168 @@
+
+# Prime Cache — persistent memory-mapped wheel bitsets (primality + twin flags)
+# Usage: from prime_cache import PrimeCache; pc = PrimeCache("~/.cache/vendessimal"); pc.primes_upto(10**8)
+#        or `export VENDESSIMAL_CACHE=~/.cache/vendessimal` and the toolkits pick it up.
+#
+# The number line is cut into fixed blocks of block_bytes wheel bytes (30 integers per byte). Block k is
+# stored as primes_<lo>_<hi>.npy (prime_sieve layout) and twins_<lo>_<hi>.npy (twin-low flags), so a
+# larger N only sieves the missing tail blocks. Files are written under a temp name and renamed into place:
+# readers (np.load mmap_mode='r') never see a partial block and share pages across processes.
+# Every access refreshes the block's mtime; past max_bytes the least-recently-used blocks are deleted.
+import os, glob, tempfile
+import numpy as np
+import prime_sieve
+from prime_sieve import SPAN
+
+BLOCK_BYTES = 1 << 20            # 31.5M integers per block
+MAX_BYTES = 2 << 30
+KINDS = ("primes", "twins")
+
+class PrimeCache:
+    def __init__(self, root, block_bytes=BLOCK_BYTES, max_bytes=MAX_BYTES):
+        self.root = os.path.join(os.path.expanduser(root), f"wheel30_b{block_bytes}")
+        os.makedirs(self.root, exist_ok=True)
+        self.block_bytes = block_bytes
+        self.max_bytes = max_bytes
+        self.span = SPAN*block_bytes
+
+    # ---------- blocks ----------
+    def _key(self, k):
+        lo = k*self.span
+        return f"{lo:015d}_{lo + self.span:015d}"
+
+    def _path(self, kind, k):
+        return os.path.join(self.root, f"{kind}_{self._key(k)}.npy")
+
+    def _write(self, path, arr):
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f: np.save(f, arr)
+        os.replace(tmp, path)
+
+    def _build(self, k):
+        base = k*self.span
+        seg = prime_sieve.sieve_segment(base, self.block_bytes)
+        nxt = prime_sieve.sieve_segment(base + self.span, 1)[0]
+        self._write(self._path("twins", k), prime_sieve.twin_bits(seg, nxt))
+        self._write(self._path("primes", k), seg)
+        self.evict(keep={self._key(k)})
+
+    def block(self, kind, k):
+        # read-only mmap of block k, sieved and stored on first use
+        path = self._path(kind, k)
+        for _ in range(2):
+            if not os.path.exists(path): self._build(k)
+            try:
+                os.utime(path)
+                return np.load(path, mmap_mode="r")
+            except FileNotFoundError:            # evicted by a concurrent writer; rebuild once
+                pass
+        raise RuntimeError(f"could not load cache block {path}")
+
+    def evict(self, keep=()):
+        blocks = {}
+        for path in glob.glob(os.path.join(self.root, "*.npy")):
+            try: st = os.stat(path)
+            except FileNotFoundError: continue
+            key = os.path.basename(path)[:-4].split("_", 1)[1]
+            size, mtime = blocks.get(key, (0, 0.0))
+            blocks[key] = (size + st.st_size, max(mtime, st.st_mtime))
+        total = sum(size for size, _ in blocks.values())
+        for key, (size, _) in sorted(blocks.items(), key=lambda kv: kv[1][1]):
+            if total <= self.max_bytes: break
+            if key in keep: continue
+            for kind in KINDS:
+                try: os.remove(os.path.join(self.root, f"{kind}_{key}.npy"))
+                except FileNotFoundError: pass
+            total -= size
+
+    # ---------- streaming API (mirrors prime_sieve) ----------
+    def iter_segments(self, lo, hi, kind="primes"):
+        lo, hi = max(int(lo), 0), int(hi)
+        if hi <= lo: return
+        for k in range(lo // self.span, (hi - 1) // self.span + 1):
+            base = k*self.span
+            b0 = max(lo - base, 0) // SPAN
+            b1 = min(-(-(hi - base) // SPAN), self.block_bytes)
+            seg, sbase = self.block(kind, k)[b0:b1], base + SPAN*b0
+            if sbase < lo or sbase + SPAN*len(seg) > hi:
+                seg = prime_sieve.clip_segment(sbase, np.array(seg), lo, hi)
+            yield sbase, seg
+
+    def iter_primes(self, lo, hi):
+        head = prime_sieve.small_primes(lo, hi)
+        if len(head): yield head
+        for base, seg in self.iter_segments(lo, hi):
+            ps = prime_sieve.unpack_segment(base, seg)
+            if len(ps): yield ps
+
+    def iter_twin_lows(self, n):
+        n = int(n)
+        head = np.array([3, 5], dtype=np.int64)
+        head = head[head + 2 <= n]
+        if len(head): yield head
+        for base, seg in self.iter_segments(0, n - 1, kind="twins"):
+            lows = prime_sieve.unpack_segment(base, seg)
+            if len(lows): yield lows
+
+    def primes_upto(self, n):
+        chunks = list(self.iter_primes(0, int(n) + 1))
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+    def twin_lows(self, n):
+        chunks = list(self.iter_twin_lows(n))
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+    def prime_bits(self, n):
+        segs = [np.array(seg) for _, seg in self.iter_segments(0, int(n) + 1)]
+        return np.concatenate(segs) if segs else np.zeros(0, dtype=np.uint8)
+
+    def count_primes(self, n):
+        n = int(n)
+        total = len(prime_sieve.small_primes(0, n + 1))
+        for _, seg in self.iter_segments(0, n + 1):
+            total += int(prime_sieve.POPCOUNT[seg].sum(dtype=np.int64))
+        return total
+
+# ---------- process-wide default (VENDESSIMAL_CACHE) ----------
+_default = None
+
+def set_default_cache(root, **kw):
+    global _default
+    _default = PrimeCache(root, **kw) if root else None
+    return _default
+
+def default_cache():
+    if _default is None and os.environ.get("VENDESSIMAL_CACHE"):
+        mb = os.environ.get("VENDESSIMAL_CACHE_MAX_MB")
+        set_default_cache(os.environ["VENDESSIMAL_CACHE"],
+                          **({"max_bytes": int(mb) << 20} if mb else {}))
+    return _default
+
+def primes_upto(n):
+    pc = default_cache()
+    return pc.primes_upto(n) if pc else prime_sieve.primes_upto(n)
+
+def twin_lows(n):
+    pc = default_cache()
+    return pc.twin_lows(n) if pc else prime_sieve.twin_lows(n)
+
+def prime_bits(n):
+    pc = default_cache()
+    return pc.prime_bits(n) if pc else prime_sieve.prime_bits(n)
+
+def count_primes(n):
+    pc = default_cache()
+    return pc.count_primes(n) if pc else prime_sieve.count_primes(n)
+
+def iter_primes(lo, hi):
+    pc = default_cache()
+    return pc.iter_primes(lo, hi) if pc else prime_sieve.iter_primes(lo, hi)
+
+def iter_segments(lo, hi):
+    # (base, bits) wheel segments of [lo, hi); cached blocks are read-only mmaps
+    pc = default_cache()
+    return pc.iter_segments(lo, hi) if pc else prime_sieve.iter_segments(lo, hi)
+
+def iter_twin_lows(n):
+    pc = default_cache()
+    return pc.iter_twin_lows(n) if pc else prime_sieve.iter_twin_lows(n)
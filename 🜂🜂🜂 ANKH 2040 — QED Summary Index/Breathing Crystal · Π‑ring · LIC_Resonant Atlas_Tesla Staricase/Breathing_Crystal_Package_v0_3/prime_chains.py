@@ -0,0 +1,242 @@
+
+# Prime Chains — digit-transform links between primes (emirps, rotations, digit concatenation, base change)
+# Usage: import prime_chains as pch; pch.run_chains(10**7, ("rev", "rot", "pre"), outdir="chains_1e7")
+#        python3 vendessimal_prime_toolkit.py chains --N 1e9 --transforms rev rot --outdir chains_1e9
+#        python3 vendessimal_prime_toolkit.py chains --N 1e6 --transforms rev pre app b9 --follow 1009
+#
+# Every prime p ≤ N is pushed through each transform as whole-array integer arithmetic (no strings):
+#   rev   digit reversal (1009 → 9001)            rot / rotr  rotate the digits left / right
+#   appK  append digit K (p → 10p + K)            preK        prepend digit K (9001 → 69001)
+#   app / pre  all admissible digits              bB          p written in base B (2 … 9), read as decimal
+# and a result y ≠ p is a link p → y when y is prime: y ≤ N is looked up in the packed wheel bitset (the
+# primality index, prime_cache), larger y go through prime_mr. Links stream from the prime segments to disk
+# (edges/: src, dst, transform). The graph is a sorted-array join: the sorted unique link endpoints are the
+# node table and searchsorted maps each endpoint to its id. Chains follow increasing links (1009 → 9001 →
+# 69001 style), which makes the graph a DAG: the longest chain from every node comes from vectorized
+# relaxation rounds (one np.maximum.reduceat over the edges per round, as many rounds as the longest chain).
+# Chains ≥ --min-len are walked for all heads at once and written longest first; motifs.csv counts the
+# transform pairs along two-step increasing paths.
+import argparse, gzip, json, os, re, time
+import numpy as np
+import prime_cache, prime_sieve
+
+POW10 = 10**np.arange(19, dtype=np.int64)
+DIGITS = dict(app=(1, 3, 7, 9), pre=(1, 2, 3, 4, 5, 6, 7, 8, 9))
+MIN_LEN = 4
+BLOCK = 1 << 16
+
+# ---------- transforms ----------
+def parse_transforms(specs):
+    # ("rev", "app", "b9") → ("rev", "app1", "app3", "app7", "app9", "b9")
+    names = []
+    for spec in specs:
+        if spec in DIGITS: names += [f"{spec}{k}" for k in DIGITS[spec]]
+        elif spec in ("rev", "rot", "rotr") or re.fullmatch(r"(app|pre)[0-9]|b[2-9]", spec): names.append(spec)
+        else: raise ValueError(f"unknown transform {spec!r} (rev, rot, rotr, app[K], pre[K], b2 … b9)")
+    return tuple(dict.fromkeys(names))
+
+def ndigits(p):
+    return np.searchsorted(POW10, p, side="right")
+
+def _reverse(p):
+    x, y = p.copy(), np.zeros_like(p)
+    while True:
+        live = x > 0
+        if not live.any(): return y
+        q, r = np.divmod(x, 10)
+        y = np.where(live, y*10 + r, y)
+        x = q
+
+def _rebase(p, b):
+    # digits of p in base b read as decimal; invalid past 19 digits (int64)
+    x, y, place = p.copy(), np.zeros_like(p), 1
+    for _ in range(19):
+        q, r = np.divmod(x, b)
+        y += r*place
+        x, place = q, place*10
+        if not x.any(): break
+    return y, x == 0
+
+def apply_transform(name, p):
+    # (y, ok) for an int64 array of primes
+    nd = ndigits(p)
+    if name == "rev": return _reverse(p), np.ones(len(p), dtype=bool)
+    if name in ("rot", "rotr"):
+        h = POW10[np.maximum(nd - 1, 0)]
+        y = (p % h)*10 + p//h if name == "rot" else (p % 10)*h + p//10
+        return y, y >= h                                      # no leading zero after the rotation
+    if name[:3] == "app": return 10*p + int(name[3]), nd < 18
+    if name[:3] == "pre": return int(name[3])*POW10[np.minimum(nd, 18)] + p, nd < 18
+    return _rebase(p, int(name[1]))
+
+# ---------- links ----------
+def is_prime_index(y, bits, limit):
+    # primality of y: packed bitset below limit, Miller–Rabin above
+    out = np.zeros(len(y), dtype=bool)
+    inside = y <= limit
+    out[inside] = prime_sieve.lookup_bits(bits, y[inside])
+    if not inside.all():
+        import prime_mr
+        out[~inside] = prime_mr.is_prime_array(y[~inside].astype(np.uint64))
+    return out
+
+def iter_links(N, transforms=("rev", "rot"), lo=2, bits=None):
+    # (src, dst, transform id) blocks per prime segment of [lo, N]
+    names = parse_transforms(transforms)
+    bits = prime_cache.prime_bits(N) if bits is None else bits
+    for ps in prime_cache.iter_primes(lo, N + 1):
+        src, dst, tid = [], [], []
+        for k, name in enumerate(names):
+            y, ok = apply_transform(name, ps)
+            ok &= y != ps
+            ok[ok] = is_prime_index(y[ok], bits, N)
+            src.append(ps[ok]); dst.append(y[ok]); tid.append(np.full(int(ok.sum()), k, dtype=np.uint8))
+        yield np.concatenate(src), np.concatenate(dst), np.concatenate(tid)
+
+def build_graph(src, dst):
+    # sorted-array join: node table = sorted unique endpoints, ids by searchsorted
+    v = np.sort(np.concatenate([src, dst]))
+    nodes = v[np.concatenate([[True], v[1:] != v[:-1]])] if len(v) else v
+    return nodes, np.searchsorted(nodes, src), np.searchsorted(nodes, dst)
+
+# ---------- chains ----------
+def chain_lengths(s, d, t, n):
+    # increasing links only: L[v] = links on the longest chain from v, nxt / nxt_t = its first step (−1 at ends)
+    up = d > s
+    s, d, t = s[up], d[up], t[up]
+    order = np.lexsort((d, s))
+    s, d, t = s[order], d[order], t[order]
+    heads, first = np.unique(s, return_index=True)
+    L = np.zeros(n, dtype=np.int32)
+    rounds = 0
+    while len(heads):
+        best = np.maximum.reduceat(L[d] + 1, first)
+        rounds += 1
+        if (best == L[heads]).all(): break
+        L[heads] = best
+    step = np.flatnonzero(L[d] + 1 == L[s])
+    at = np.unique(s[step], return_index=True)[1]               # smallest next value among the longest
+    nxt, nxt_t = np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int16)
+    nxt[s[step[at]]], nxt_t[s[step[at]]] = d[step[at]], t[step[at]]
+    indeg = np.bincount(d, minlength=n)
+    return L, nxt, nxt_t, indeg, rounds
+
+def iter_chains(nodes, L, nxt, nxt_t, indeg, min_len=MIN_LEN, block=BLOCK):
+    # (values (k, len), transform ids (k, len−1)) blocks of chain heads, longest first
+    heads = np.flatnonzero((indeg == 0) & (L + 1 >= min_len))
+    heads = heads[np.lexsort((nodes[heads], -L[heads]))]
+    for i in range(0, len(heads), block):
+        cur = heads[i:i + block]
+        width = int(L[cur].max()) + 1
+        vals = np.full((len(cur), width), -1, dtype=np.int64)
+        tids = np.full((len(cur), width - 1), -1, dtype=np.int16)
+        for j in range(width):
+            live = cur >= 0
+            vals[live, j] = nodes[cur[live]]
+            if j < width - 1: tids[live, j] = nxt_t[cur[live]]
+            cur = np.where(live, nxt[np.maximum(cur, 0)], -1)
+        yield vals, tids
+
+def follow(value, nodes, nxt, nxt_t):
+    # the longest increasing chain from one prime: [(value, transform into it or None)]
+    i = int(np.searchsorted(nodes, value))
+    if i == len(nodes) or nodes[i] != value: return [(value, None)]
+    chain, t = [], None
+    while i >= 0:
+        chain.append((int(nodes[i]), t))
+        i, t = int(nxt[i]), int(nxt_t[i])
+    return chain
+
+def motifs(s, d, t, n, ntrans):
+    # (ntrans, ntrans) counts of transform pairs a →t1→ b →t2→ c over increasing links, + one example each
+    up = d > s
+    s, d, t = s[up], d[up], t[up]
+    order = np.argsort(s, kind="stable")
+    s, d, t = s[order], d[order], t[order]
+    start = np.searchsorted(s, np.arange(n + 1))
+    outdeg = np.diff(start)
+    k = outdeg[d]                                              # second steps available after each first step
+    e1 = np.repeat(np.arange(len(s)), k)
+    e2 = start[d[e1]] + (np.arange(len(e1)) - np.repeat(np.cumsum(k) - k, k))
+    key = t[e1].astype(np.int64)*ntrans + t[e2]
+    counts = np.bincount(key, minlength=ntrans*ntrans).reshape(ntrans, ntrans)
+    keys, first = np.unique(key, return_index=True)
+    examples = {int(kk): (int(s[e1[f]]), int(d[e1[f]]), int(d[e2[f]])) for kk, f in zip(keys, first)}
+    return counts, examples
+
+# ---------- driver ----------
+def _open(path):
+    return gzip.open(path, "wt", compresslevel=6) if path.endswith(".gz") else open(path, "w")
+
+def run_chains(N, transforms=("rev", "rot"), outdir=None, min_len=MIN_LEN, lo=2, log=None):
+    from vendessimal_export import write_table
+    names = parse_transforms(transforms)
+    t0 = time.perf_counter()
+    blocks = []
+    def links():
+        for blk in iter_links(N, names, lo):
+            blocks.append(blk); yield blk
+    if outdir:
+        os.makedirs(outdir, exist_ok=True)
+        write_table(os.path.join(outdir, "edges"), ["src", "dst", "transform"], links())
+    else:
+        for _ in links(): pass
+    src, dst, tid = ((np.concatenate(c) for c in zip(*blocks)) if blocks else
+                     (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint8)))
+    t_links = time.perf_counter() - t0
+    nodes, s, d = build_graph(src, dst)
+    L, nxt, nxt_t, indeg, rounds = chain_lengths(s, d, tid, len(nodes))
+    counts, examples = motifs(s, d, tid, len(nodes), len(names))
+    summary = dict(N=N, transforms=list(names), links=int(len(src)), nodes=int(len(nodes)),
+                   per_transform={nm: int(c) for nm, c in zip(names, np.bincount(tid, minlength=len(names)))},
+                   longest=int(L.max()) + 1 if len(L) else 0, relax_rounds=rounds,
+                   seconds=dict(links=round(t_links, 2), total=None))
+    chains = 0
+    if outdir:
+        with _open(os.path.join(outdir, "chains.csv.gz" if N > 10**8 else "chains.csv")) as f:
+            f.write("length,transforms,chain\n")
+            for vals, tids in iter_chains(nodes, L, nxt, nxt_t, indeg, min_len):
+                for v, tt in zip(vals.tolist(), tids.tolist()):
+                    v = [x for x in v if x >= 0]
+                    f.write(f"{len(v)},{'>'.join(names[x] for x in tt[:len(v) - 1])},{' '.join(map(str, v))}\n")
+                chains += len(vals)
+        with open(os.path.join(outdir, "motifs.csv"), "w") as f:
+            f.write("first,second,count,example\n")
+            for k in np.argsort(-counts, axis=None, kind="stable").tolist():
+                if not counts.flat[k]: break
+                a, b, c = nodes[list(examples[k])].tolist()
+                f.write(f"{names[k // len(names)]},{names[k % len(names)]},{int(counts.flat[k])},{a} {b} {c}\n")
+    summary["chains_written"] = chains
+    summary["seconds"]["total"] = round(time.perf_counter() - t0, 2)
+    if outdir:
+        with open(os.path.join(outdir, "chains.json"), "w") as f: json.dump(summary, f, indent=2)
+    if log: print(json.dumps(summary), file=log)
+    return summary, (nodes, L, nxt, nxt_t, indeg), counts
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py chains")
+    ap.add_argument("--N", type=lambda s: int(float(s)), default=10**6, help="primes up to N (accepts 1e9)")
+    ap.add_argument("--transforms", nargs="+", default=["rev", "rot"],
+                    help="rev, rot, rotr, app (app1 app3 app7 app9), pre (pre1 … pre9), b2 … b9")
+    ap.add_argument("--min-len", type=int, default=MIN_LEN, help="shortest chain (in primes) written")
+    ap.add_argument("--follow", nargs="+", type=int, default=[], help="print the longest chain from these primes")
+    ap.add_argument("--top", type=int, default=10, help="longest chains printed")
+    ap.add_argument("--outdir", type=str, default=None, help="edges/ (npy columns), chains.csv[.gz], motifs.csv")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    if args.cache: prime_cache.set_default_cache(args.cache)
+    summary, (nodes, L, nxt, nxt_t, indeg), counts = run_chains(args.N, args.transforms, args.outdir, args.min_len)
+    names = summary["transforms"]
+    print(f"{summary['links']} links between {summary['nodes']} primes (N = {args.N}), longest increasing chain "
+          f"{summary['longest']} primes [{summary['seconds']['total']}s]")
+    print("  " + "  ".join(f"{k}: {v}" for k, v in summary["per_transform"].items()))
+    for vals, tids in iter_chains(nodes, L, nxt, nxt_t, indeg, min_len=1, block=args.top):
+        for v, tt in zip(vals.tolist(), tids.tolist()):
+            v = [x for x in v if x >= 0]
+            print("  " + str(v[0]) + "".join(f" →{names[t]}→ {x}" for t, x in zip(tt, v[1:])))
+        break
+    for p in args.follow:
+        chain = follow(p, nodes, nxt, nxt_t)
+        print(f"  from {p}: " + str(chain[0][0]) + "".join(f" →{names[t]}→ {x}" for x, t in chain[1:]))
+    if args.outdir: print(f"→ {args.outdir}/ ({summary['chains_written']} chains ≥ {args.min_len})")
+    return summary
@@ -0,0 +1,150 @@
+
+# Prime Constellations — admissible offset patterns (twins, cousins, sexy, triplets, quadruplets, …)
+# found with shifted ANDs on the packed mod-30 primality bitset
+# Usage: import prime_constellations as pc; pc.matches(10**6, "triplet"); pc.count(10**9, (0,4,6,10))
+#        python3 vendessimal_prime_toolkit.py constellations --N 1e9 --pattern twin cousin sexy quadruplet
+#        python3 vendessimal_prime_toolkit.py --pattern triplet            # overlay in place of the twin layer
+#
+# For a pattern (0, d1, …, dk) and a wheel residue r, p ≡ r (mod 30) matches iff bit r of byte b and bit
+# (r+di) mod 30 of byte b + (r+di)//30 are all set. Each residue is one AND of byte-shifted copies of the
+# segment, so a whole segment is tested in 8·k vector ops and the result is again a wheel bitset of first
+# members (prime_sieve.twin_bits is the (0, 2) case). Segments stream from prime_cache (or the sieve) with
+# as many segments of look-ahead as the bytes the largest offset reaches past a segment need (one for any
+# pattern narrower than a segment). 2, 3, 5 are checked directly.
+import argparse
+import numpy as np
+import prime_cache
+from prime_sieve import SPAN, WHEEL, POPCOUNT, base_primes, clip_segment, is_prime, unpack_segment, _BIT30
+
+PATTERNS = {
+    "twin": (0, 2),
+    "cousin": (0, 4),
+    "sexy": (0, 6),
+    "triplet": (0, 2, 6),
+    "triplet2": (0, 4, 6),
+    "quadruplet": (0, 2, 6, 8),
+    "sexy_quadruplet": (0, 6, 12, 18),
+    "quintuplet": (0, 2, 6, 8, 12),
+    "quintuplet2": (0, 4, 6, 10, 12),
+}
+
+def parse_pattern(spec):
+    # "triplet" → (0, 2, 6); "0,4,6,10" → (0, 4, 6, 10); tuples pass through (normalised to start at 0)
+    if isinstance(spec, str):
+        offs = PATTERNS[spec] if spec in PATTERNS else tuple(int(x) for x in spec.split(","))
+    else:
+        offs = tuple(int(x) for x in spec)
+    offs = tuple(sorted(set(offs)))
+    return tuple(d - offs[0] for d in offs)
+
+def pattern_name(offsets):
+    offsets = parse_pattern(offsets)
+    for name, offs in PATTERNS.items():
+        if offs == offsets: return name
+    return ",".join(map(str, offsets))
+
+def admissible(offsets):
+    # no prime q ≤ len(offsets) sees every residue class mod q (otherwise only finitely many matches)
+    offsets = parse_pattern(offsets)
+    return all(len({d % q for d in offsets}) < q for q in base_primes(len(offsets)).tolist())
+
+# ---------- bitset kernel ----------
+def tail_bytes(offsets):
+    # bytes past a segment the largest offset can reach
+    return (WHEEL[-1] + max(parse_pattern(offsets))) // SPAN
+
+def pattern_bits(seg, offsets, tail=None):
+    # wheel bitset of first members p ≥ 7 whose whole pattern is prime; tail = the tail_bytes() bytes
+    # following seg (zeros past the range)
+    offsets = parse_pattern(offsets)
+    n, t = len(seg), tail_bytes(offsets)
+    ext = np.zeros(n + t, dtype=np.uint8); ext[:n] = seg
+    if tail is not None: ext[n:n + len(tail[:t])] = tail[:t]
+    out = np.zeros(n, dtype=np.uint8)
+    for k, r in enumerate(WHEEL.tolist()):
+        acc = seg & np.uint8(1 << k)
+        for d in offsets[1:]:
+            j = _BIT30[(r + d) % SPAN]
+            if j < 0: acc = None; break                       # r + d divisible by 2, 3 or 5
+            s = (r + d) // SPAN
+            hit = (ext[s:s + n] >> np.uint8(j)) & np.uint8(1)
+            acc &= hit << np.uint8(k)
+        if acc is not None: out |= acc
+    return out
+
+def _small_matches(n, offsets):
+    return np.array([p for p in (2, 3, 5) if p + offsets[-1] <= n and all(is_prime(p + d) for d in offsets)],
+                    dtype=np.int64)
+
+# ---------- streaming API ----------
+def iter_segments(n, offsets):
+    # (base, bits) of first members p ≥ 7 with p + max(offsets) ≤ n, segment by segment (the following
+    # segments supply the tail_bytes(offsets) tail bytes)
+    offsets = parse_pattern(offsets)
+    n = int(n)
+    hi = n - offsets[-1] + 1                                    # first members live in [0, hi)
+    if hi <= 0: return
+    t = tail_bytes(offsets)
+    segs = prime_cache.iter_segments(0, n + 1)
+    cur, ahead = next(segs, None), []
+    while cur is not None and cur[0] < hi:
+        while not ahead or sum(len(s) for _, s in ahead) < t:   # wide patterns reach past several segments
+            nxt = next(segs, None)
+            if nxt is None: break
+            ahead.append(nxt)
+        base, seg = cur
+        tail = np.concatenate([s for _, s in ahead])[:t] if ahead else None
+        bits = pattern_bits(seg, offsets, tail)
+        bits = bits[:-(-(hi - base) // SPAN)]
+        yield base, clip_segment(base, bits, 0, hi)
+        cur = ahead.pop(0) if ahead else None
+
+def iter_matches(n, offsets):
+    # numpy chunks of first members p (ascending) with every p + d prime and p + max(offsets) ≤ n
+    offsets = parse_pattern(offsets)
+    head = _small_matches(int(n), offsets)
+    if len(head): yield head
+    for base, bits in iter_segments(n, offsets):
+        ps = unpack_segment(base, bits)
+        if len(ps): yield ps
+
+def matches(n, offsets):
+    chunks = list(iter_matches(n, offsets))
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+def members(n, offsets):
+    # sorted array of every prime ≤ n that belongs to some match (the overlay layer; twin_members for (0, 2))
+    offsets = parse_pattern(offsets)
+    first = matches(n, offsets)
+    return np.unique(np.concatenate([first + d for d in offsets])) if len(first) else first
+
+def count(n, offsets):
+    offsets = parse_pattern(offsets)
+    total = len(_small_matches(int(n), offsets))
+    for _, bits in iter_segments(n, offsets):
+        total += int(POPCOUNT[bits].sum(dtype=np.int64))
+    return total
+
+# ---------- CLI (`vendessimal_prime_toolkit.py constellations …`) ----------
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py constellations")
+    ap.add_argument("--N", type=lambda s: int(float(s)), default=10**6, help="upper bound (accepts 1e9)")
+    ap.add_argument("--pattern", nargs="+", default=["twin", "cousin", "sexy", "triplet", "quadruplet"],
+                    help=f"names ({', '.join(PATTERNS)}) or offsets like 0,4,6,10")
+    ap.add_argument("--out", type=str, default=None, help="write first members of the (single) pattern: .csv/.gz/npy dir")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    if args.cache: prime_cache.set_default_cache(args.cache)
+    if args.out:
+        from vendessimal_export import write_table
+        offs = parse_pattern(args.pattern[0])
+        header = ["p"] + [f"p+{d}" for d in offs[1:]]
+        rows = write_table(args.out, header, ([ps + d for d in offs] for ps in iter_matches(args.N, offs)))
+        print(f"{args.out}: {rows} rows")
+        return args.out
+    counts = {}
+    for spec in args.pattern:
+        offs = parse_pattern(spec)
+        counts[pattern_name(offs)] = c = count(args.N, offs)
+        print(f"{pattern_name(offs):>16} {str(offs):<20} {c:>12}" + ("" if admissible(offs) else "  (inadmissible)"))
+    return counts
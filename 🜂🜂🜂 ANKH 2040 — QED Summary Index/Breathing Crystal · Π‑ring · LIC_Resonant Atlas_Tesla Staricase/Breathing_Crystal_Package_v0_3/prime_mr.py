@@ -0,0 +1,231 @@
+
+# Prime MR — batched deterministic Miller–Rabin on uint64 arrays (numpy only)
+# Usage: import prime_mr; prime_mr.is_prime_array([1009, 9001, 69001, 7801, 2**61 - 1, 18446744073709551557])
+#        python3 vendessimal_prime_toolkit.py isprime 1009 9001 69001 7801 1e15+37
+#
+# Values below the sieve limit are looked up in a packed wheel bitset (prime_cache / prime_sieve, grown to
+# the largest small value seen). Larger values first lose multiples of 2 … 251 through residue tables (one
+# modulo + one gather per table), then run strong-probable-prime rounds, base 2 first and the remaining
+# bases only on survivors, the base set chosen by magnitude (2, 7, 61 below 4.76·10⁹; Jaeschke's four
+# below 1.12·10¹²; Sinclair's seven for all of 2⁶⁴). n < 2³² uses plain uint64 products; larger n use
+# Montgomery multiplication with the 128-bit products assembled from 32-bit limbs, so every step is a
+# whole-array uint64 operation (base 2 by squaring and doubling, other bases with 4-bit windows).
+import re
+import numpy as np
+import prime_cache, prime_sieve
+
+SIEVE_LIMIT = 1 << 24
+# (bound, bases): deterministic for every n < bound (Jaeschke; Sinclair's set covers all of 2⁶⁴)
+BASE_SETS = ((4759123141, (2, 7, 61)),
+             (1122004669633, (2, 13, 23, 1662803)),
+             (1 << 64, (2, 325, 9375, 28178, 450775, 9780504, 1795265022)))
+WHEEL_TABLES = ((3, 5, 7, 11, 13, 17, 19), (23, 29, 31, 37), (41, 43, 47, 53), (59, 61, 67), (71, 73, 79),
+                (83, 89, 97), (101, 103), (107, 109), (113, 127), (131, 137), (139, 149), (151, 157), (163, 167),
+                (173, 179), (181, 191), (193, 197), (199, 211), (223, 227), (229, 233), (239, 241), (251,))
+WINDOW = 4
+
+_U = np.uint64
+_M32, _S32, _ONE = _U(0xFFFFFFFF), _U(32), _U(1)
+_bits = np.zeros(0, dtype=np.uint8)
+_tables = None
+
+# ---------- small values: sieve bitset ----------
+def sieve_lookup(values):
+    # bool array for values < SIEVE_LIMIT; the shared bitset grows (doubling) to the largest value seen
+    global _bits
+    v = np.asarray(values, dtype=np.int64)
+    vmax = int(v.max()) if v.size else 0
+    if vmax >= prime_sieve.SPAN*len(_bits):
+        _bits = prime_cache.prime_bits(min(max(vmax, 2*prime_sieve.SPAN*len(_bits), 1 << 16), SIEVE_LIMIT))
+    return prime_sieve.lookup_bits(_bits, v)
+
+# ---------- wheel pre-filter ----------
+def _wheel_tables():
+    # (modulus, bool table: residue coprime to every prime of the group)
+    global _tables
+    if _tables is None:
+        _tables = []
+        for ps in WHEEL_TABLES:
+            m = int(np.prod(ps))
+            r = np.arange(m)
+            ok = np.ones(m, dtype=bool)
+            for p in ps: ok &= r % p != 0
+            _tables.append((_U(m), ok))
+    return _tables
+
+def wheel_survivors(n):
+    # odd n > 251 with no prime factor ≤ 251 (the survivors are re-indexed as they shrink)
+    idx = np.flatnonzero(n & _ONE)
+    for m, ok in _wheel_tables():
+        idx = idx[ok[(n[idx] % m).astype(np.int64)]]
+    keep = np.zeros(n.shape, dtype=bool); keep[idx] = True
+    return keep
+
+# ---------- 64-bit arithmetic ----------
+def _mulhi(a, b):
+    # high 64 bits of the 128-bit product, from four 32×32 → 64 partial products
+    a0, a1, b0, b1 = a & _M32, a >> _S32, b & _M32, b >> _S32
+    p01, p10 = a0*b1, a1*b0
+    mid = ((a0*b0) >> _S32) + (p01 & _M32) + (p10 & _M32)
+    return a1*b1 + (p01 >> _S32) + (p10 >> _S32) + (mid >> _S32)
+
+class Montgomery:
+    # arithmetic mod an array of odd n < 2⁶⁴ with R = 2⁶⁴; mul(a, b) = a·b·R⁻¹ mod n
+    def __init__(self, n):
+        self.n, self.n0, self.n1 = n, n & _M32, n >> _S32
+        x = n.copy()
+        for _ in range(5): x *= _U(2) - n*x                    # Newton: n⁻¹ mod 2⁶⁴
+        self.ninv = x
+        self.one = (_U(0) - n) % n                             # R mod n
+        self._r2 = None
+
+    def _reduce(self, hi, lo):
+        # (hi·R + lo)·R⁻¹ mod n: m·n has the same low word as lo, so the result is hi − mulhi(m, n)
+        m = lo*self.ninv
+        m0, m1 = m & _M32, m >> _S32
+        p01, p10 = m0*self.n1, m1*self.n0
+        mid = ((m0*self.n0) >> _S32) + (p01 & _M32) + (p10 & _M32)
+        mh = m1*self.n1 + (p01 >> _S32) + (p10 >> _S32) + (mid >> _S32)
+        r = hi - mh
+        return np.where(hi < mh, r + self.n, r)
+
+    def mul(self, a, b):
+        return self._reduce(_mulhi(a, b), a*b)
+
+    def sqr(self, a):
+        a0, a1 = a & _M32, a >> _S32
+        p01 = a0*a1
+        mid = ((a0*a0) >> _S32) + ((p01 & _M32) << _ONE)
+        return self._reduce(a1*a1 + ((p01 >> _S32) << _ONE) + (mid >> _S32), a*a)
+
+    def double(self, a):
+        d = a << _ONE
+        return np.where((a >> _U(63)).astype(bool) | (d >= self.n), d - self.n, d)
+
+    def to_mont(self, a):
+        if self._r2 is None:                                   # R² mod n: 2R, then six squarings → 2⁶⁴·R
+            r = self.double(self.one)
+            for _ in range(6): r = self.sqr(r)
+            self._r2 = r
+        return self.mul(a % self.n, self._r2)
+
+def _decompose(n):
+    # n − 1 = d·2^s (s from the lowest set bit)
+    m = n - _ONE
+    s = np.log2((m & (_U(0) - m)).astype(np.float64)).astype(np.int64)
+    return m >> s.astype(np.uint64), s
+
+def _sprp32(n, a):
+    # strong probable prime to base a, n < 2³² (uint64 products cannot overflow)
+    d, s = _decompose(n)
+    a = _U(a) % n
+    x, base, e = np.ones_like(n), a.copy(), d.copy()
+    while (e != 0).any():
+        x = np.where((e & _ONE).astype(bool), x*base % n, x)
+        base, e = base*base % n, e >> _ONE
+    ok = (a == 0) | (x == 1) | (x == n - _ONE)
+    for j in range(1, int(s.max()) if s.size else 0):
+        x = x*x % n
+        ok |= (j < s) & (x == n - _ONE)
+    return ok
+
+def _sprp64(n, a):
+    # strong probable prime to base a, odd n < 2⁶⁴, in Montgomery form: base 2 by squaring and doubling,
+    # other bases with fixed WINDOW-bit windows over a table of base powers
+    d, s = _decompose(n)
+    mt = Montgomery(n)
+    nbits = int(d.max()).bit_length()
+    if a == 2:
+        x = mt.one.copy()
+        for k in range(nbits - 1, -1, -1):
+            x = mt.sqr(x)
+            x = np.where(((d >> _U(k)) & _ONE).astype(bool), mt.double(x), x)
+        zero = np.zeros(n.shape, dtype=bool)
+    else:
+        zero = _U(a) % n == 0
+        base = mt.to_mont(np.full(n.shape, a, dtype=np.uint64))
+        table = [mt.one, base]
+        for _ in range(2, 1 << WINDOW): table.append(mt.mul(table[-1], base))
+        table = np.stack(table)
+        cols = np.arange(len(n))
+        x = mt.one.copy()
+        for k in range(-(-nbits // WINDOW)*WINDOW - WINDOW, -1, -WINDOW):
+            for _ in range(WINDOW): x = mt.sqr(x)
+            x = mt.mul(x, table[((d >> _U(k)) & _U((1 << WINDOW) - 1)).astype(np.int64), cols])
+    minus_one = n - mt.one
+    ok = zero | (x == mt.one) | (x == minus_one)
+    for j in range(1, int(s.max()) if s.size else 0):
+        x = mt.sqr(x)
+        ok |= (j < s) & (x == minus_one)
+    return ok
+
+def miller_rabin(n):
+    # deterministic for odd n > 251 without small factors: base 2 on all, the bound's other bases on survivors
+    n = np.asarray(n, dtype=np.uint64)
+    out = np.zeros(n.shape, dtype=bool)
+    small = n < _U(1 << 32)
+    idx = np.flatnonzero(small)
+    idx = idx[_sprp32(n[idx], 2)] if len(idx) else idx
+    big = np.flatnonzero(~small)
+    idx = np.concatenate([idx, big[_sprp64(n[big], 2)] if len(big) else big])
+    tier = np.zeros(len(idx), dtype=np.int64)
+    for bound, _ in BASE_SETS[:-1]: tier += n[idx] >= _U(bound)
+    for k, (_, bases) in enumerate(BASE_SETS):
+        sel = idx[tier == k]
+        for a in bases[1:]:
+            if not len(sel): break
+            nn = n[sel]
+            sel = sel[_sprp32(nn, a) if nn.max() < 1 << 32 else _sprp64(nn, a)]
+        out[sel] = True
+    return out
+
+# ---------- public API ----------
+def is_prime_array(values, sieve_limit=None):
+    # bool array: primality of every value (any shape; int64 / uint64 / Python ints up to 2⁶⁴ − 1)
+    limit = SIEVE_LIMIT if sieve_limit is None else sieve_limit
+    raw = np.asarray(values)
+    neg = raw < 0 if raw.dtype.kind in "if" or raw.dtype == object else np.zeros(raw.shape, dtype=bool)
+    v = np.where(neg, 0, raw).astype(np.uint64).ravel()
+    out = np.zeros(v.shape, dtype=bool)
+    small = v < _U(limit)
+    if small.any(): out[small] = sieve_lookup(v[small].astype(np.int64))
+    big = np.flatnonzero(~small)
+    if len(big):
+        vb = v[big]
+        cand = big[wheel_survivors(vb) & (vb > _U(251))]
+        out[cand] = miller_rabin(v[cand])
+        out[big[vb <= _U(251)]] = sieve_lookup(vb[vb <= _U(251)].astype(np.int64))
+    return out.reshape(raw.shape)
+
+def is_prime(n):
+    return bool(is_prime_array(np.array([n], dtype=np.uint64 if n >= 1 << 63 else np.int64))[0])
+
+# ---------- CLI (`vendessimal_prime_toolkit.py isprime …`) ----------
+_INT = re.compile(r"^(\d+)(?:\*\*(\d+)|[eE](\d+))?([+-]\d+)?$")
+
+def _parse_int(s):
+    # "17399", "1e15+37", "2**61-1" → exact int
+    m = _INT.match(s.replace("_", ""))
+    if not m: raise ValueError(f"not an integer: {s!r}")
+    base, power, exp10, offset = m.groups()
+    v = int(base)**int(power) if power else int(base)*10**int(exp10) if exp10 else int(base)
+    return v + int(offset or 0)
+
+def main(argv=None):
+    import argparse, time
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py isprime")
+    ap.add_argument("values", nargs="*", help="integers (also 1e15+37, 2**61-1)")
+    ap.add_argument("--random", type=int, default=0, help="benchmark: test this many random 64-bit values")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    if args.values:
+        vals = [_parse_int(s) for s in args.values]
+        for v, p in zip(vals, is_prime_array(np.array(vals, dtype=np.uint64)).tolist()):
+            print(f"{v} {'prime' if p else 'composite'}")
+    if args.random:
+        v = np.random.default_rng(args.seed).integers(0, 2**64 - 1, args.random, dtype=np.uint64, endpoint=True)
+        t0 = time.perf_counter()
+        flags = is_prime_array(v)
+        sec = time.perf_counter() - t0
+        print(f"{args.random} random 64-bit values: {int(flags.sum())} prime  [{sec:.2f}s, {args.random/sec/1e6:.2f} M/s]")
+    return 0
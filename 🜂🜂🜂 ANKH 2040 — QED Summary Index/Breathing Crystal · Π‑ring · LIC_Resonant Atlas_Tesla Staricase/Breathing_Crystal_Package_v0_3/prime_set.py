@@ -0,0 +1,203 @@
+
+# Prime Set — compact sorted integer set: packed bitset + rank/select directory (numpy only)
+# Usage: from prime_set import PrimeSet; P = PrimeSet.upto(10**8)
+#        1061 in P; P.contains([1061, 1063, 1064]); P.rank(1064); P.count(1000, 2000); P[177]; P.select([0, 1, 2])
+#        for chunk in P: ...          # numpy int64 chunks, ascending;  P.tolist() / P.toset(): opt-in Python objects
+#
+# Two bit layouts. "wheel" is prime_sieve's mod-30 bitset (byte b ↔ [30b, 30b+30), bit k ↔ 30b + WHEEL[k]),
+# so PrimeSet.upto(n) wraps the (cached) prime_bits table as is, 2, 3 and 5 held in a small head array;
+# every set of primes (twins, constellation members) fits it. "plain" (bit v ↔ value v) takes arbitrary
+# non-negative ints (rail members). The bits are read as little-endian uint64 words with a two-level
+# directory: an int64 count of set bits before every 512-bit superblock plus a uint16 count before every
+# word inside it (37.5 % of the bitset), so rank(x) is two gathers and one popcount. select(k) starts
+# from a sample (the superblock of every SAMPLE-th element), walks the few superblocks to the right one,
+# picks the word from the uint16 counts and the bit from an in-byte table — constant time for any set
+# whose gaps between samples stay a few superblocks wide (primes: ≤ 3 at 10⁹).
+import numpy as np
+import prime_cache
+from prime_sieve import WHEEL, SPAN, POPCOUNT, _BIT30, unpack_segment
+
+SUPER_WORDS = 8                  # 8 × 64-bit words = 512 bits per superblock
+SAMPLE = 256                     # select samples: superblock of element 0, 256, 512, …
+CHUNK_BYTES = 1 << 18            # iteration chunk (bitset bytes)
+
+_W64 = np.uint64
+_BELOW30 = np.searchsorted(WHEEL, np.arange(SPAN))              # wheel residues < r (value → first bit ≥ it)
+_SELECT8 = np.zeros((256, 8), dtype=np.uint8)                   # j-th set bit of a byte
+for _b in range(256):
+    _pos = [i for i in range(8) if _b >> i & 1]
+    _SELECT8[_b, :len(_pos)] = _pos
+
+def _popcount64(x):
+    # set bits per uint64 through the POPCOUNT byte table (np.bitwise_count needs numpy ≥ 2)
+    x = np.asarray(x, dtype=_W64)
+    b = np.ascontiguousarray(x.reshape(-1)).view(np.uint8)
+    return POPCOUNT[b].reshape(x.shape + (8,)).sum(axis=-1, dtype=np.int64)
+
+class PrimeSet:
+    def __init__(self, bits, n, layout="wheel", head=()):
+        # bits: uint8 bitset in the given layout (wheel / plain); n: inclusive upper bound of the universe
+        self.layout, self.n = layout, int(n)
+        self.head = np.asarray(head, dtype=np.int64)           # wheel: members 2, 3, 5 (outside the bitset)
+        nw = len(bits)//8 + 1                                   # ≥ 1 zero word past the end: rank(n+1) needs it
+        w = np.zeros(nw*8, dtype=np.uint8); w[:len(bits)] = bits
+        self.bits = w[:len(bits)]
+        self.words = w.view("<u8")
+        c = _popcount64(self.words)
+        before = np.cumsum(c) - c
+        self._super = before[::SUPER_WORDS].copy()
+        local = np.full(-(-nw // SUPER_WORDS)*SUPER_WORDS, 0xFFFF, dtype=np.uint16)   # pad: never ≤ an offset
+        local[:nw] = before - np.repeat(self._super, SUPER_WORDS)[:nw]
+        self._local = local
+        self._nbits = int(c.sum())
+        self._samples = np.searchsorted(self._super, np.arange(0, self._nbits, SAMPLE), side="right") - 1
+
+    # ---------- constructors ----------
+    @classmethod
+    def upto(cls, n):
+        # every prime ≤ n, on the (cached) sieve bitset
+        n = max(int(n), 0)
+        return cls(prime_cache.prime_bits(n), n, "wheel",
+                   [p for p in (2, 3, 5) if p <= n])
+
+    @classmethod
+    def from_values(cls, values, n=None, layout=None):
+        # set of non-negative ints; layout None: wheel when every value > 5 is coprime to 30 and the rest ⊂ {2, 3, 5}
+        v = np.asarray(values, dtype=np.int64).ravel()
+        if v.size and int(v.min()) < 0: raise ValueError("PrimeSet holds non-negative integers only")
+        n = (int(v.max()) if v.size else 0) if n is None else int(n)
+        v = v[v <= n]
+        small = v < 7
+        k = _BIT30[v % SPAN]
+        if layout is None:
+            layout = "wheel" if np.isin(v[small], (2, 3, 5)).all() and (k[~small] >= 0).all() else "plain"
+        if layout == "wheel":
+            head = np.intersect1d(v[small], (2, 3, 5))
+            v, k = v[~small], k[~small]
+            if (k < 0).any(): raise ValueError("wheel layout holds 2, 3, 5 and values coprime to 30 only")
+            bits = np.zeros(n//SPAN + 1, dtype=np.uint8)
+            np.bitwise_or.at(bits, v // SPAN, np.left_shift(1, k).astype(np.uint8))
+            return cls(bits, n, "wheel", head)
+        bits = np.zeros(n//8 + 1, dtype=np.uint8)
+        np.bitwise_or.at(bits, v >> 3, np.left_shift(1, v & 7).astype(np.uint8))
+        return cls(bits, n, "plain")
+
+    # ---------- bit ↔ value ----------
+    def _bit_index(self, x):
+        # position of the first bit whose value is ≥ x (x clipped to [0, n+1])
+        x = np.clip(np.asarray(x, dtype=np.int64), 0, self.n + 1)
+        if self.layout == "plain": return x
+        return 8*(x // SPAN) + _BELOW30[x % SPAN]
+
+    def _value(self, g):
+        return g if self.layout == "plain" else SPAN*(g >> 3) + WHEEL[g & 7]
+
+    # ---------- membership / rank / select ----------
+    def contains(self, values):
+        # vectorized membership (bool array, same shape)
+        v = np.asarray(values, dtype=np.int64)
+        ok = (v >= 0) & (v <= self.n)
+        out = np.isin(v, self.head) if len(self.head) else np.zeros(v.shape, dtype=bool)
+        if self.layout == "plain":
+            g, hit = np.where(ok, v, 0), ok
+        else:
+            k = _BIT30[v % SPAN]
+            hit = ok & (k >= 0)
+            g = np.where(hit, 8*(v // SPAN) + k, 0)
+        return out | (hit & ((self.bits[g >> 3] >> (g & 7).astype(np.uint8)) & 1).astype(bool)
+                      if len(self.bits) else out)
+
+    def __contains__(self, x):
+        return bool(self.contains(x))
+
+    def _rank_bits(self, g):
+        w = g >> 6
+        mask = np.left_shift(_W64(1), (g & 63).astype(_W64)) - _W64(1)
+        return (self._super[w // SUPER_WORDS] + self._local[w].astype(np.int64)
+                + _popcount64(self.words[w] & mask))
+
+    def rank(self, x):
+        # number of members < x (vectorized)
+        x = np.asarray(x, dtype=np.int64)
+        r = self._rank_bits(self._bit_index(x)) + np.searchsorted(self.head, x)
+        return int(r) if r.ndim == 0 else r
+
+    def count(self, lo, hi):
+        # members in [lo, hi)
+        return self.rank(hi) - self.rank(lo)
+
+    def select(self, k):
+        # k-th member, 0-based (vectorized; negative k counts from the end)
+        k = np.asarray(k, dtype=np.int64)
+        k = np.where(k < 0, k + len(self), k)
+        if ((k < 0) | (k >= len(self))).any(): raise IndexError("PrimeSet index out of range")
+        nh = len(self.head)
+        j = np.maximum(k - nh, 0)
+        sb = self._samples[np.minimum(j // SAMPLE, len(self._samples) - 1)] if len(self._samples) else j*0
+        top = len(self._super) - 1
+        while True:                                             # walk to the superblock holding element j
+            step = (sb < top) & (self._super[np.minimum(sb + 1, top)] <= j)
+            if not step.any(): break
+            sb = sb + step
+        rem = j - self._super[sb]
+        loc = self._local[(sb*SUPER_WORDS)[..., None] + np.arange(SUPER_WORDS)]
+        w = sb*SUPER_WORDS + (loc <= rem[..., None]).sum(-1) - 1
+        rem = rem - self._local[w]
+        byts = self.words[w][..., None] >> (_W64(8)*np.arange(8, dtype=_W64)) & _W64(0xFF)
+        cum = np.cumsum(POPCOUNT[byts.astype(np.intp)], axis=-1, dtype=np.int64)
+        b = np.minimum((cum <= rem[..., None]).sum(-1), 7)           # (clamped: head-only lanes have no bit)
+        rem = rem - np.where(b > 0, np.take_along_axis(cum, np.maximum(b - 1, 0)[..., None], -1)[..., 0], 0)
+        byte = np.take_along_axis(byts, b[..., None], -1)[..., 0].astype(np.int64)
+        v = self._value(64*w + 8*b + _SELECT8[byte, np.clip(rem, 0, 7)])
+        if nh: v = np.where(k < nh, self.head[np.minimum(k, nh - 1)], v)
+        return int(v) if v.ndim == 0 else v
+
+    nth = select
+
+    def __getitem__(self, key):
+        if isinstance(key, slice): return self.select(np.arange(len(self))[key])
+        return self.select(key)
+
+    def __len__(self):
+        return self._nbits + len(self.head)
+
+    # ---------- iteration / conversion ----------
+    def iter_chunks(self, lo=0, hi=None, chunk_bytes=CHUNK_BYTES):
+        # ascending int64 chunks of the members in [lo, hi)
+        hi = self.n + 1 if hi is None else min(int(hi), self.n + 1)
+        lo = max(int(lo), 0)
+        if hi <= lo: return
+        head = self.head[(self.head >= lo) & (self.head < hi)]
+        if len(head): yield head
+        g0, g1 = int(self._bit_index(lo)) >> 3, -(-int(self._bit_index(hi)) // 8)
+        for b0 in range(g0, g1, chunk_bytes):
+            seg = self.bits[b0:min(b0 + chunk_bytes, g1)]
+            v = (unpack_segment(SPAN*b0, seg) if self.layout == "wheel"
+                 else 8*b0 + np.flatnonzero(np.unpackbits(seg, bitorder="little")))
+            v = v[(v >= lo) & (v < hi)]
+            if len(v): yield v
+
+    def __iter__(self):
+        return self.iter_chunks()
+
+    def to_array(self, lo=0, hi=None):
+        chunks = list(self.iter_chunks(lo, hi))
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+    def __array__(self, dtype=None, copy=None):
+        a = self.to_array()
+        return a if dtype is None else a.astype(dtype)
+
+    def tolist(self):
+        return self.to_array().tolist()
+
+    def toset(self):
+        return set(self.tolist())
+
+    @property
+    def nbytes(self):
+        # bitset + directory (what the layer cache charges)
+        return self.words.nbytes + self._super.nbytes + self._local.nbytes + self._samples.nbytes + self.head.nbytes
+
+    def __repr__(self):
+        return f"PrimeSet({len(self)} members ≤ {self.n}, {self.layout}, {self.nbytes/2**20:.1f} MiB)"
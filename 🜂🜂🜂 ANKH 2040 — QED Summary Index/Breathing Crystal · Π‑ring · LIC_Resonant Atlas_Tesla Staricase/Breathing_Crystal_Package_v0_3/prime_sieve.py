@@ -0,0 +1,156 @@
+
+# Prime Sieve — segmented mod-30 wheel, bit-packed
+# Usage: import prime_sieve as ps; ps.primes_upto(10**6); ps.count_primes(10**10)
+#
+# One byte covers 30 consecutive integers; its 8 bits are the residues coprime to 30
+# (WHEEL below, bit k <-> WHEEL[k]). Segments are SEGMENT_BYTES long (L2-sized by default),
+# so memory stays bounded by the segment size, not by N. 2, 3, 5 are handled outside the wheel.
+import math
+import numpy as np
+
+WHEEL = np.array([1, 7, 11, 13, 17, 19, 23, 29], dtype=np.int64)
+SEGMENT_BYTES = 1 << 18          # 256 KiB ≈ L2; use 1<<15 for L1-sized segments
+SPAN = 30                        # integers per byte
+
+_INV30 = np.zeros(30, dtype=np.int64)   # p^-1 mod 30 for p coprime to 30
+for _r in WHEEL.tolist():
+    _INV30[_r] = pow(_r, -1, 30)
+_BIT30 = np.full(30, -1, dtype=np.int64)   # residue mod 30 → wheel bit (-1: divisible by 2, 3 or 5)
+_BIT30[WHEEL] = np.arange(len(WHEEL))
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+_base = np.array([2, 3, 5, 7], dtype=np.int64)   # grows on demand
+
+# ---------- base primes ----------
+def base_primes(limit):
+    # all primes ≤ limit (plain sieve; limit is √N, so this stays small)
+    global _base
+    limit = int(limit)
+    if limit > _base[-1]:
+        n = max(limit, 2*int(_base[-1]))
+        s = np.ones(n+1, dtype=bool); s[:2] = False
+        for p in range(2, math.isqrt(n)+1):
+            if s[p]: s[p*p::p] = False
+        _base = np.flatnonzero(s).astype(np.int64)
+    return _base[:np.searchsorted(_base, limit, side="right")]
+
+def _sieving_primes(hi):
+    sp = base_primes(math.isqrt(max(hi-1, 0)))
+    return sp[sp > 5]
+
+# ---------- segments ----------
+def sieve_segment(base, nbytes, sp=None):
+    # bit-packed primality of [base, base+30*nbytes); base must be a multiple of 30
+    hi = base + SPAN*nbytes
+    if sp is None: sp = _sieving_primes(hi)
+    sp = sp[sp*sp < hi]
+    seg = np.full(nbytes, 0xFF, dtype=np.uint8)
+    if base == 0: seg[0] &= 0xFE                      # 1 is not prime
+    if len(sp) == 0: return seg
+    inv = _INV30[sp % 30]
+    q0 = np.maximum(sp, -(-base // sp))               # first cofactor with p*q ≥ max(p², base)
+    for k, r in enumerate(WHEEL.tolist()):
+        q = q0 + (r*inv - q0) % 30                    # p*q ≡ r (mod 30)
+        start = (sp*q - base) // SPAN
+        hit = start < nbytes
+        clear = np.uint8(0xFF ^ (1 << k))
+        for p, s in zip(sp[hit].tolist(), start[hit].tolist()):
+            seg[s::p] &= clear                        # next multiple ≡ r is 30p further = p bytes
+    return seg
+
+def _edge_mask(base, byte, lo, hi):
+    v = base + SPAN*byte + WHEEL
+    return np.uint8(np.packbits((v >= lo) & (v < hi), bitorder="little")[0])
+
+def clip_segment(base, seg, lo, hi):
+    # clears the bits of numbers outside [lo, hi) in the first/last byte (in place)
+    if base < lo: seg[0] &= _edge_mask(base, 0, lo, hi)
+    if base + SPAN*len(seg) > hi: seg[-1] &= _edge_mask(base, len(seg)-1, lo, hi)
+    return seg
+
+def iter_segments(lo, hi, segment_bytes=SEGMENT_BYTES):
+    # yields (base, bits) covering [lo, hi); bits outside the range are cleared
+    lo, hi = max(int(lo), 0), int(hi)
+    if hi <= lo: return
+    sp = _sieving_primes(hi)
+    base = lo - lo % SPAN
+    while base < hi:
+        nbytes = min(segment_bytes, -(-(hi - base) // SPAN))
+        yield base, clip_segment(base, sieve_segment(base, nbytes, sp), lo, hi)
+        base += SPAN*nbytes
+
+def unpack_segment(base, bits):
+    byte, k = np.nonzero(np.unpackbits(bits, bitorder="little").reshape(-1, 8))
+    return base + SPAN*byte.astype(np.int64) + WHEEL[k]
+
+def twin_bits(seg, nxt=0):
+    # wheel bitset of twin lows p ≥ 7 (p, p+2 both prime): residue pairs (11,13), (17,19), (29,31);
+    # 31 lives in bit 0 of the following byte, passed as `nxt` for the last one
+    carry = np.empty_like(seg)
+    carry[:-1] = seg[1:] & 1; carry[-1:] = np.uint8(nxt) & 1
+    return (seg & (seg >> 1) & 0b00010100) | (seg & (carry << 7))
+
+def small_primes(lo, hi):
+    small = np.array([2, 3, 5], dtype=np.int64)
+    return small[(small >= lo) & (small < hi)]
+
+# ---------- streaming API ----------
+def iter_primes(lo, hi, segment_bytes=SEGMENT_BYTES):
+    # numpy chunks of the primes in [lo, hi), ascending
+    head = small_primes(lo, hi)
+    if len(head): yield head
+    for base, seg in iter_segments(lo, hi, segment_bytes):
+        ps = unpack_segment(base, seg)
+        if len(ps): yield ps
+
+def iter_twin_lows(n, segment_bytes=SEGMENT_BYTES):
+    # chunks of p with p and p+2 prime and p+2 ≤ n; carries the last prime across segments
+    prev = None
+    for ps in iter_primes(0, n+1, segment_bytes):
+        ext = ps if prev is None else np.concatenate(([prev], ps))
+        lows = ext[:-1][np.diff(ext) == 2]
+        if len(lows): yield lows
+        prev = ps[-1]
+
+def primes_upto(n):
+    chunks = list(iter_primes(0, int(n)+1))
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+def twin_lows(n):
+    chunks = list(iter_twin_lows(int(n)))
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+def prime_flags(lo, hi):
+    # dense bool array, flags[i] ⇔ lo+i is prime
+    flags = np.zeros(max(int(hi) - int(lo), 0), dtype=bool)
+    for ps in iter_primes(lo, hi):
+        flags[ps - lo] = True
+    return flags
+
+def prime_bits(n):
+    # bit-packed primality of [0, n] as one array (byte b ↔ [30b, 30b+30)), for random-access lookups
+    segs = [seg for _, seg in iter_segments(0, int(n)+1)]
+    return np.concatenate(segs) if segs else np.zeros(0, dtype=np.uint8)
+
+def lookup_bits(bits, values):
+    # vectorized primality of arbitrary int64 values against a prime_bits table; values past the table → False
+    v = np.asarray(values, dtype=np.int64)
+    k, byte = _BIT30[v % SPAN], v // SPAN
+    ok = (k >= 0) & (v >= 0) & (byte < len(bits))
+    out = np.zeros(v.shape, dtype=bool)
+    out[ok] = (bits[byte[ok]] >> k[ok].astype(np.uint8)) & 1
+    return out | (v == 2) | (v == 3) | (v == 5)
+
+def count_primes(n, segment_bytes=SEGMENT_BYTES):
+    n = int(n)
+    total = len(small_primes(0, n+1))
+    for _, seg in iter_segments(0, n+1, segment_bytes):
+        total += int(POPCOUNT[seg].sum(dtype=np.int64))
+    return total
+
+def is_prime(n):
+    n = int(n)
+    if n < 2: return False
+    for p in (2, 3, 5):
+        if n % p == 0: return n == p
+    if n < 49: return True
+    return not np.any(n % base_primes(math.isqrt(n)) == 0)
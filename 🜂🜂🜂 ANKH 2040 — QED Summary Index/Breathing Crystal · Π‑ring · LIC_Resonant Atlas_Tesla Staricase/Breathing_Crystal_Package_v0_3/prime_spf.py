@@ -0,0 +1,165 @@
+
+# Prime SPF — compact smallest-prime-factor table, vectorized factorization and threshold windows
+# Usage: import prime_spf; prime_spf.factor_labels([1062, 1064])            # ['2·3²·59', '2³·7·19']
+#        python3 vendessimal_prime_toolkit.py thresholds --N 1e6 --mod-pair 19 29 --out thresholds.csv
+#        python3 vendessimal_prime_toolkit.py --N 3000 --auto-thresholds
+#
+# The table stores spf(n) for odd n only (entry i ↔ n = 2i + 1; even n → 2) as uint32: 2 bytes per
+# integer, 200 MB at N = 10⁸. With a path it is built in a memory-mapped .npy and reopened read-only
+# (shared pages across processes; a file that already covers N is reused). Factorization runs in passes
+# over the whole value array: each pass looks up the spf of every unfinished value and divides that prime
+# out completely, so the number of passes is the largest count of distinct prime factors (≤ 9 below 10⁹),
+# not the number of values. Results are CSR arrays: the factors of values[i] are
+# primes[starts[i]:starts[i+1]] (ascending) with exponents[...].
+# Threshold windows generalize 1061–1064: a twin pair p, p+2 with the even composite c just outside it
+# (c = p+3 after, c = p−1 before) divisible by a prime factor of one of the mod-pair moduli (1064 = 2³·7·19,
+# 19 | 1064). Every window ≤ N comes out as labelled overlay markers (the `thresholds` layer).
+import argparse, math, os, tempfile
+import numpy as np
+import prime_cache
+
+FEATURED = (1061, 1064)           # the hand-annotated window of the posters and the inset
+SUPERSCRIPT = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+_table = np.ones(1, dtype=np.uint32)
+
+# ---------- table ----------
+def _sieve(t, n):
+    # t: zeroed uint32 array (odd n ↔ index n//2); marks every odd composite with its spf, primes with themselves
+    t[0] = 1
+    for p in prime_cache.primes_upto(math.isqrt(n))[1:].tolist():
+        s = t[p*p//2::p]
+        s[s == 0] = p
+    for i0 in range(0, len(t), 1 << 22):
+        blk = t[i0:i0 + (1 << 22)]
+        z = np.flatnonzero(blk == 0)
+        blk[z] = 2*(z + i0) + 1
+    return t
+
+def spf_table(n, path=None):
+    # odd-only uint32 spf table covering 1 … n; path: memory-mapped .npy (reused when it already covers n)
+    size = n//2 + 1
+    if path is None: return _sieve(np.zeros(size, dtype=np.uint32), n)
+    if os.path.exists(path):
+        t = np.load(path, mmap_mode="r")
+        if len(t) >= size: return t
+    d = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=d, suffix=".npy"); os.close(fd)
+    t = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.uint32, shape=(size,))
+    _sieve(t, n); t.flush(); del t
+    os.replace(tmp, path)
+    return np.load(path, mmap_mode="r")
+
+def table_limit(table):
+    return 2*len(table) - 1
+
+def _default_table(vmax):
+    # module-wide table, grown (doubling) to the largest value seen
+    global _table
+    if vmax > table_limit(_table): _table = spf_table(max(vmax, 2*table_limit(_table), 1 << 16))
+    return _table
+
+def spf(values, table=None):
+    # smallest prime factor of every value (1 → 1)
+    v = np.asarray(values, dtype=np.int64)
+    t = _default_table(int(v.max()) if v.size else 0) if table is None else table
+    return np.where(v & 1 == 1, t[v >> 1], 2).astype(np.int64)
+
+# ---------- factorization ----------
+def factorize(values, table=None):
+    # CSR (starts, primes, exponents) over values ≥ 1 (flattened; 1 has no factors)
+    v = np.asarray(values, dtype=np.int64).ravel()
+    t = _default_table(int(v.max()) if v.size else 0) if table is None else table
+    if v.size and int(v.max()) > table_limit(t):
+        raise ValueError(f"values up to {int(v.max())} exceed the spf table limit {table_limit(t)}")
+    rows, ps, es = [], [], []
+    idx, rest = np.flatnonzero(v > 1), v.copy()
+    while len(idx):
+        q = rest[idx]
+        p = spf(q, t)
+        e = np.zeros(len(idx), dtype=np.uint8)
+        m = np.ones(len(idx), dtype=bool)
+        while m.any():                                         # divide p out completely
+            q[m] //= p[m]; e[m] += 1
+            m &= q % p == 0
+        rows.append(idx); ps.append(p); es.append(e)
+        rest[idx] = q
+        idx = idx[q > 1]
+    if not rows: return np.zeros(len(v) + 1, dtype=np.int64), np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.uint8)
+    rows = np.concatenate(rows)
+    order = np.argsort(rows, kind="stable")                   # passes run in ascending prime order
+    starts = np.zeros(len(v) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(v)), out=starts[1:])
+    return starts, np.concatenate(ps)[order].astype(np.uint32), np.concatenate(es)[order]
+
+def factor_grid(N, width=20, table=None):
+    # per-cell factorization of 1 … N in grid order (cell k ↔ n = k+1) plus (rows, width) Ω counts
+    starts, primes, exps = factorize(np.arange(1, N + 1, dtype=np.int64), table)
+    rows = N//width + (1 if N%width else 0)
+    big_omega = np.zeros(rows*width, dtype=np.uint8)
+    big_omega[:N] = np.add.reduceat(np.append(exps, 0).astype(np.uint8), starts[:-1]) * (np.diff(starts) > 0)
+    return (starts, primes, exps), big_omega.reshape(rows, width)
+
+def factor_labels(values, table=None, sup=True):
+    # "2³·7·19" per value (sup=False: "2^3·7·19"); primes print as themselves, 1 as "1"
+    starts, primes, exps = factorize(values, table)
+    primes, exps = primes.tolist(), exps.tolist()
+    power = (lambda e: str(e).translate(SUPERSCRIPT)) if sup else (lambda e: f"^{e}")
+    return ["·".join(f"{primes[j]}{power(exps[j]) if exps[j] > 1 else ''}" for j in range(a, b)) or "1"
+            for a, b in zip(starts[:-1].tolist(), starts[1:].tolist())]
+
+# ---------- threshold windows ----------
+def modulus_primes(mod_pair):
+    _, primes, _ = factorize(list(mod_pair))
+    return sorted(set(primes.tolist()))
+
+def find_thresholds(N, mod_pair=(19,29), side="both", table=None):
+    # (start, p, composite, q) arrays of every window ≤ N, sorted by start: twins p, p+2 and the even composite
+    # c = p+3 (after) / p−1 (before) whose factorization contains q, the smallest prime of the mod-pair moduli
+    lows = prime_cache.twin_lows(N)
+    p = np.concatenate([lows]*(2 if side == "both" else 1))
+    c = np.concatenate(([lows + 3] if side != "before" else []) + ([lows - 1] if side != "after" else []))
+    keep = (c > 2) & (c <= N)
+    p, c = p[keep], c[keep]
+    starts, primes, _ = factorize(c, table)
+    hit = np.isin(primes, modulus_primes(mod_pair))
+    row = np.repeat(np.arange(len(c)), np.diff(starts))[hit]
+    first = np.unique(row, return_index=True)[1]               # factors ascend: first hit = smallest q
+    q, p, c = primes[hit][first].astype(np.int64), p[row[first]], c[row[first]]
+    start = np.minimum(p, c)
+    order = np.argsort(start, kind="stable")
+    return start[order], p[order], c[order], q[order]
+
+def threshold_markers(lows, composites, table=None):
+    # [(value, colour, label)] per window: p, p+2 (prime), c = factors — the style of the 1061–1064 markers
+    labels = factor_labels(composites, table, sup=False)
+    marks = []
+    for p, c, lab in zip(np.asarray(lows).tolist(), np.asarray(composites).tolist(), labels):
+        marks += [(p, 'lime', f'{p}'), (p + 2, 'orange', f'{p + 2} (prime)'), (c, 'red', f'{c}={lab}')]
+    return marks
+
+# ---------- CLI (`vendessimal_prime_toolkit.py thresholds …`) ----------
+def main(argv=None):
+    from vendessimal_export import write_table
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py thresholds")
+    ap.add_argument("--N", type=lambda s: int(float(s)), default=3000, help="upper bound (accepts 1e7)")
+    ap.add_argument("--mod-pair", nargs=2, type=int, default=[19,29])
+    ap.add_argument("--side", choices=["both", "after", "before"], default="both",
+                    help="composite after the twin pair (1061 1063 | 1064) or before it")
+    ap.add_argument("--spf", type=str, default=None, help="memory-mapped spf table (.npy), reused when it covers N")
+    ap.add_argument("--top", type=int, default=20, help="windows printed")
+    ap.add_argument("--out", type=str, default=None, help="csv / csv.gz / npy dir of (start, p, p+2, c, q)")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    if args.cache: prime_cache.set_default_cache(args.cache)
+    table = spf_table(args.N, args.spf)
+    start, p, c, q = find_thresholds(args.N, tuple(args.mod_pair), args.side, table)
+    print(f"{len(start)} windows ≤ {args.N} (mod pair {args.mod_pair[0]}/{args.mod_pair[1]},"
+          f" primes {modulus_primes(args.mod_pair)})")
+    if args.top and len(start):
+        for s, pp, cc, qq, lab in zip(start[:args.top].tolist(), p[:args.top].tolist(), c[:args.top].tolist(),
+                                      q[:args.top].tolist(), factor_labels(c[:args.top], table)):
+            print(f"  {s}–{s + 3}  {pp} {pp + 2} | {cc} = {lab}  ({qq} | {cc})")
+    if args.out:
+        write_table(args.out, ["start", "p", "p+2", "composite", "q"], [(start, p, p + 2, c, q)])
+        print(f"→ {args.out}")
+    return start, p, c, q
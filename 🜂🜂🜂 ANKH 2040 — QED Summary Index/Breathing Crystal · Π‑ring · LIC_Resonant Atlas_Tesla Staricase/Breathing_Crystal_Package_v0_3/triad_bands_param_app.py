@@ -0,0 +1,138 @@
+
+# Triad Bands — Gaussian π-band windows and the breathing-timeline blend, streamed in chunks
+# Usage: python3 triad_bands_param_app.py                      # → triad_bands_{windows,timeline}_generated.csv
+#        python3 triad_bands_param_app.py --centers 0.43 0.456 0.49 --sigma 0.025 --T 54
+#        python3 triad_bands_param_app.py --macro --rate 48000 --timeline-out breath_48k.csv.gz
+#
+# Windows: band_i(x) = exp(−½((x − c_i)/σ)²) over a resonance axis x (default 1000 samples on [0, 1]).
+# Timeline: band i oscillates at harmonic·c_i Hz (Tesla 3–6–9: harmonic 3), comp_i(t) = cos(2π·3·c_i·t),
+# blend = mean over the bands; T = 42 s is the 7-gate cycle (7 breaths × 6 s). --macro runs the whole
+# 7→9→12→17 gate sequence (45 breaths = 270 s) and adds gate / breath / breath-phase columns.
+# --support k evaluates each band only within k·σ of its center (values out there are < e^(−k²/2)); --log
+# writes −½((x − c)/σ)² instead (−inf off-support), so the 1e-45 tails neither underflow nor cost exp;
+# --float32 halves the window arrays. Samples are generated from their integer index (t_i = i·T/(n−1), as
+# np.linspace), a chunk at a time, so a minute-long timeline at audio rates never exists as a whole;
+# csv / csv.gz / npy via vendessimal_export.
+import argparse
+import numpy as np
+from vendessimal_core import gauss_windows
+
+CENTERS = (0.429, 0.456, 0.487)
+SIGMA = 0.03
+HARMONIC = 3
+BREATH_SEC = 6.0
+GATES = (7, 9, 12, 17)
+CHUNK = 1 << 16
+
+# ---------- sample axes ----------
+def _axis(lo, hi, n, i0, i1):
+    # samples i0 … i1−1 of np.linspace(lo, hi, n), bit for bit
+    i = np.arange(i0, i1, dtype=np.float64)
+    x = i*((hi - lo)/(n - 1)) + lo if n > 1 else np.full(len(i), float(lo))
+    if n > 1 and i1 == n: x[-1] = hi
+    return x
+
+def _chunks(n, chunk):
+    for i0 in range(0, n, chunk):
+        yield i0, min(i0 + chunk, n)
+
+# ---------- windows ----------
+def windows(x, centers=CENTERS, sigma=SIGMA, support=None, log=False, dtype=np.float64):
+    # (len(x), len(centers)) Gaussian windows (vendessimal_core.gauss_windows; x ascending)
+    return gauss_windows(x, centers, sigma, support, log, dtype)
+
+def iter_windows(n=1000, lo=0.0, hi=1.0, centers=CENTERS, sigma=SIGMA, support=None, log=False,
+                 dtype=np.float64, chunk=CHUNK):
+    # (x, (chunk, bands)) blocks over np.linspace(lo, hi, n)
+    for i0, i1 in _chunks(n, chunk):
+        x = _axis(lo, hi, n, i0, i1)
+        yield x, windows(x, centers, sigma, support, log, dtype)
+
+# ---------- breathing timeline ----------
+def gate_schedule(gates=GATES, breath_sec=BREATH_SEC):
+    # [(gate, t_start, t_end)] of the 7→9→12→17 sequence
+    ends = np.cumsum([g*breath_sec for g in gates])
+    return [(g, float(e - g*breath_sec), float(e)) for g, e in zip(gates, ends)]
+
+def gate_index(t, gates=GATES, breath_sec=BREATH_SEC):
+    # (gate, breath within the gate, phase in [0, 1]) per sample; t past the end stays in the last gate
+    sched = gate_schedule(gates, breath_sec)
+    starts = np.array([s for _, s, _ in sched])
+    k = np.clip(np.searchsorted(starts, t, side="right") - 1, 0, len(sched) - 1)
+    b = (t - starts[k])/breath_sec
+    breath = np.minimum(np.floor(b), np.asarray(gates)[k] - 1).astype(np.int64)
+    return np.asarray(gates, dtype=np.int64)[k], breath, b - breath
+
+def components(t, centers=CENTERS, harmonic=HARMONIC):
+    # (len(t), bands): cos(2π·harmonic·c_i·t)
+    omega = 2*np.pi*harmonic*np.asarray(centers, dtype=np.float64)
+    return np.cos(omega[None, :]*np.asarray(t, dtype=np.float64)[:, None])
+
+def timeline_samples(T, rate):
+    return int(round(T*rate)) + 1
+
+def iter_timeline(T=GATES[0]*BREATH_SEC, rate=20.0, centers=CENTERS, harmonic=HARMONIC, chunk=CHUNK):
+    # (t, comps, blend) blocks over [0, T] at `rate` samples/s
+    n = timeline_samples(T, rate)
+    for i0, i1 in _chunks(n, chunk):
+        t = _axis(0.0, T, n, i0, i1)
+        comps = components(t, centers, harmonic)
+        yield t, comps, comps.mean(axis=1)
+
+# ---------- tables ----------
+def window_header(centers=CENTERS, log=False):
+    return ["x"] + [f"{'log_' if log else ''}band_{c}" for c in centers]
+
+def window_columns(**kw):
+    for x, w in iter_windows(**kw):
+        yield [x] + list(w.T)
+
+def timeline_header(centers=CENTERS, macro=False):
+    gate_cols = ["gate", "breath", "phase"] if macro else []
+    return ["t"] + gate_cols + [f"comp{i+1}" for i in range(len(centers))] + ["blend"]
+
+def timeline_columns(T, rate=20.0, centers=CENTERS, harmonic=HARMONIC, macro=False, gates=GATES,
+                     breath_sec=BREATH_SEC, chunk=CHUNK):
+    for t, comps, blend in iter_timeline(T, rate, centers, harmonic, chunk):
+        yield [t] + (list(gate_index(t, gates, breath_sec)) if macro else []) + list(comps.T) + [blend]
+
+def main(argv=None):
+    from vendessimal_export import write_table
+    ap = argparse.ArgumentParser(prog="triad_bands_param_app.py")
+    ap.add_argument("--centers", nargs="+", type=float, default=list(CENTERS), help="π-band centers")
+    ap.add_argument("--sigma", type=float, default=SIGMA, help="Gaussian window width")
+    ap.add_argument("--samples", type=int, default=1000, help="window samples over --range")
+    ap.add_argument("--support", type=float, default=None, metavar="K", help="evaluate bands within K·σ only")
+    ap.add_argument("--log", action="store_true", help="windows as log values (−½((x−c)/σ)²)")
+    ap.add_argument("--float32", action="store_true", help="windows in float32")
+    ap.add_argument("--range", nargs=2, type=float, default=[0.0, 1.0], metavar=("LO", "HI"))
+    ap.add_argument("--T", type=float, default=None, help="timeline length in s (default: first gate, 7×6 = 42)")
+    ap.add_argument("--rate", type=float, default=20.0, help="timeline samples per second")
+    ap.add_argument("--harmonic", type=float, default=HARMONIC, help="band i oscillates at harmonic·c_i Hz")
+    ap.add_argument("--gates", nargs="+", type=int, default=list(GATES))
+    ap.add_argument("--breath-sec", type=float, default=BREATH_SEC)
+    ap.add_argument("--macro", action="store_true", help="whole gate sequence + gate/breath/phase columns")
+    ap.add_argument("--windows-out", type=str, default="triad_bands_windows_generated.csv",
+                    help="'' to skip (default name keeps the shipped triad_bands_windows.csv intact)")
+    ap.add_argument("--timeline-out", type=str, default="triad_bands_timeline_generated.csv",
+                    help="'' to skip (default name keeps the shipped triad_bands_timeline.csv intact)")
+    ap.add_argument("--chunk", type=int, default=CHUNK, help="samples per block")
+    args = ap.parse_args(argv)
+    centers = tuple(args.centers)
+    T = args.T if args.T is not None else (sum(args.gates) if args.macro else args.gates[0])*args.breath_sec
+    if args.windows_out:
+        rows = write_table(args.windows_out, window_header(centers, args.log),
+                           window_columns(n=args.samples, lo=args.range[0], hi=args.range[1], centers=centers,
+                                          sigma=args.sigma, support=args.support, log=args.log,
+                                          dtype=np.float32 if args.float32 else np.float64, chunk=args.chunk))
+        print(f"{args.windows_out}: {rows} rows (σ={args.sigma}, centers {centers})")
+    if args.timeline_out:
+        rows = write_table(args.timeline_out, timeline_header(centers, args.macro),
+                           timeline_columns(T, args.rate, centers, args.harmonic, args.macro, tuple(args.gates),
+                                            args.breath_sec, args.chunk))
+        print(f"{args.timeline_out}: {rows} rows (T={T:g}s @ {args.rate:g}/s"
+              + (f", gates {'→'.join(map(str, args.gates))}" if args.macro else "") + ")")
+    return args
+
+if __name__ == "__main__":
+    main()
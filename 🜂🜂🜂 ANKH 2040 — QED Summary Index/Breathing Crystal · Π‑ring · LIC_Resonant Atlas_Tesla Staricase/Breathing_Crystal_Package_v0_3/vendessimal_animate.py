@@ -0,0 +1,168 @@
+
+# Vendessimal Animate — the 7→9→12→17 breathing macro-cycle as a PNG frame sequence
+# Usage: python3 vendessimal_prime_toolkit.py animate --N 3000 --fps 30 --outdir frames --workers 8
+#        python3 vendessimal_prime_toolkit.py animate --seconds 12 --size 1280 720 --drift 1.5
+#        ffmpeg -framerate 30 -i frames/frame_%05d.png -pix_fmt yuv420p breathing.mp4
+#
+# Frame k is time t = start + k/fps on the gate timeline (--timeline 7 9 12 17 breaths × --breath-sec 6 s =
+# 270 s). Within each breath the phase φ runs 0 → 1; the triad overlay breathes with the envelope
+# e = ½(1 − cos 2πφ): opacity alpha_lo → alpha_hi and the outer bands spread ±drift·e columns from the middle
+# one. Every worker builds the poster once (residue, rails, twins, Euler-41, thresholds) and caches that
+# background; a frame restores it, recolours the triad overlay (one full-height bar per column) and the
+# title text in place, draws just those two artists (blitting) and PNG-encodes the buffer. Frames are cut into contiguous
+# batches spread over a process pool, so drawing and encoding both run in parallel.
+import argparse, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+
+BATCH = 32
+
+# ---------- timeline ----------
+def cycle_seconds(timeline=(7,9,12,17), breath_sec=6.0):
+    return sum(timeline)*breath_sec
+
+def frame_states(times, centers=(3,10,17), timeline=(7,9,12,17), breath_sec=6.0, alpha=(0.06, 0.30), drift=1.0):
+    # per frame: gate, breath, phase, triad opacity, triad centers (len(times), len(centers))
+    from triad_bands_param_app import gate_index
+    t = np.asarray(times, dtype=np.float64)
+    gate, breath, phase = gate_index(t, tuple(timeline), breath_sec)
+    env = 0.5 - 0.5*np.cos(2*np.pi*phase)
+    c = np.asarray(centers, dtype=np.float64)
+    spread = np.sign(c - c[len(c)//2]) if len(c) > 1 else np.zeros(1)
+    return gate, breath, phase, alpha[0] + (alpha[1] - alpha[0])*env, c[None, :] + drift*env[:, None]*spread[None, :]
+
+# ---------- worker side ----------
+_scene = None
+
+def build_scene(N=3000, mod_pair=(19,29), sigma=2.4, mode='gauss', delta=2.0, rails_tau=0.55, twin_alpha=0.75,
+                size=(1920,1080), dpi=120, layers=None):
+    # static poster + animated artists; returns the dict frames are drawn from
+    import matplotlib; matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from vendessimal_layers import default_graph
+    g = layers or default_graph()
+    W = 20
+    rows = N//W + (1 if N%W else 0)
+    fig = plt.figure(figsize=(size[0]/dpi, size[1]/dpi), dpi=dpi)
+    ax = fig.add_axes([0.05, 0.06, 0.92, 0.87])
+    ax.imshow(g.get("residue", N=N, mod_pair=mod_pair, width=W), cmap='viridis', aspect='auto', interpolation='nearest')
+    ax.imshow(g.get("rails", N=N, tau=rails_tau, width=W), cmap='cool', alpha=0.12, aspect='auto', interpolation='nearest')
+    Y, X = g.get("twin_xy", N=N, width=W)
+    ax.scatter(X, Y, s=8, c='yellow', alpha=twin_alpha, marker='s', edgecolor='k', linewidths=0.2)
+    Ye, Xe = g.get("euler41", N=N, width=W)
+    if len(Ye): ax.scatter(Xe, Ye, s=14, facecolors='none', edgecolors='white', linewidths=0.8)
+    for r, c, col, lab in g.get("thresholds", N=N, width=W):
+        ax.scatter([c],[r], s=120, facecolors='none', edgecolors=col, linewidths=1.8)
+    ax.set_xlabel("Column (×20)"); ax.set_ylabel("Row")
+    # every grid row carries the same triad windows: one full-height bar per column, a frame only
+    # recolours the 20 bars (a plain fill, far cheaper for Agg than resampling an image over the axes)
+    from matplotlib.collections import PolyCollection
+    from vendessimal_raster import colormap_lut
+    x0 = np.arange(W) - 0.5
+    bars = [[(x, -0.5), (x+1, -0.5), (x+1, rows-0.5), (x, rows-0.5)] for x in x0.tolist()]
+    tri = PolyCollection(bars, linewidths=0, antialiaseds=False, animated=True, zorder=5)
+    ax.add_collection(tri)
+    ax.set_xlim(-0.5, W-0.5); ax.set_ylim(rows-0.5, -0.5)
+    title = ax.set_title("", animated=True)
+    fig.canvas.draw()
+    return dict(fig=fig, ax=ax, tri=tri, title=title, background=fig.canvas.copy_from_bbox(fig.bbox),
+                lut=colormap_lut('autumn')/255.0, N=N, W=W, sigma=sigma, mode=mode, delta=delta)
+
+def draw_frame(scene, t, gate, breath, alpha, centers):
+    # restore the cached background, update the two animated artists in place, return the RGBA buffer
+    from vendessimal_core import triad_row
+    from vendessimal_raster import apply_lut
+    fig, canvas = scene["fig"], scene["fig"].canvas
+    canvas.restore_region(scene["background"])
+    row = triad_row(scene["W"], tuple(centers), scene["sigma"], scene["delta"], scene["mode"])
+    rgba = apply_lut(row, scene["lut"], 0.0, 1.0)
+    rgba[:, 3] = alpha
+    scene["tri"].set_facecolor(rgba)
+    scene["title"].set_text(f"Vendessimal Prime Grid (1…{scene['N']}) — {gate}-gate · breath {breath+1}/{gate}"
+                            f" · t = {t:6.2f} s")
+    scene["ax"].draw_artist(scene["tri"])
+    fig.draw_artist(scene["title"])
+    return np.asarray(canvas.buffer_rgba())
+
+def _init(scene_kw, cache):
+    global _scene
+    if cache:
+        import prime_cache; prime_cache.set_default_cache(cache)
+    _scene = build_scene(**scene_kw)
+
+def render_batch(frames, times, gates, breaths, alphas, centers, outdir, level=1):
+    # frames k … → outdir/frame_%05d.png with the worker's scene
+    from vendessimal_raster import write_png
+    t0 = time.perf_counter()
+    for k, t, gt, br, al, cs in zip(frames, times, gates, breaths, alphas, centers):
+        write_png(os.path.join(outdir, f"frame_{k:05d}.png"), draw_frame(_scene, t, gt, br, al, cs), level)
+    return len(frames), time.perf_counter() - t0
+
+# ---------- driver ----------
+def run_animation(N=3000, outdir="frames", fps=30, seconds=None, start=0.0, centers=(3,10,17), sigma=2.4,
+                  mode='gauss', delta=2.0, rails_tau=0.55, twin_alpha=0.75, mod_pair=(19,29), timeline=(7,9,12,17),
+                  breath_sec=6.0, alpha=(0.06, 0.30), drift=1.0, size=(1920,1080), dpi=120, workers=None,
+                  level=1, batch=BATCH, cache=None, log=sys.stdout):
+    os.makedirs(outdir, exist_ok=True)
+    seconds = cycle_seconds(timeline, breath_sec) - start if seconds is None else seconds
+    n = int(round(seconds*fps))
+    times = start + np.arange(n)/fps
+    gates, breaths, _, alphas, cents = frame_states(times, centers, timeline, breath_sec, alpha, drift)
+    scene_kw = dict(N=N, mod_pair=tuple(mod_pair), sigma=sigma, mode=mode, delta=delta, rails_tau=rails_tau,
+                    twin_alpha=twin_alpha, size=tuple(size), dpi=dpi)
+    jobs = [(list(range(i, min(i+batch, n))),) for i in range(0, n, batch)]
+    args = lambda ks: (ks, times[ks].tolist(), gates[ks].tolist(), breaths[ks].tolist(), alphas[ks].tolist(),
+                       cents[ks].tolist(), outdir, level)
+    t0, done = time.perf_counter(), 0
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init(scene_kw, cache)
+        for (ks,) in jobs:
+            done += render_batch(*args(ks))[0]
+            print(f"[{done}/{n}] frames", file=log, flush=True)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init, initargs=(scene_kw, cache)) as pool:
+            for fut in as_completed([pool.submit(render_batch, *args(ks)) for (ks,) in jobs]):
+                done += fut.result()[0]
+                print(f"[{done}/{n}] frames", file=log, flush=True)
+    wall = time.perf_counter() - t0
+    meta = dict(N=N, frames=n, fps=fps, start=start, seconds=seconds, size=list(size), timeline=list(timeline),
+                breath_sec=breath_sec, workers=workers, wall_seconds=round(wall, 3),
+                render_fps=round(n/wall, 2) if wall > 0 else None, pattern="frame_%05d.png")
+    with open(os.path.join(outdir, "frames.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py animate")
+    ap.add_argument("--N", type=int, default=3000)
+    ap.add_argument("--mod-pair", nargs=2, type=int, default=[19,29])
+    ap.add_argument("--centers", nargs=3, type=float, default=[3.0,10.0,17.0])
+    ap.add_argument("--sigma", type=float, default=2.4)
+    ap.add_argument("--mode", choices=["gauss","hard"], default="gauss")
+    ap.add_argument("--delta", type=float, default=2.0)
+    ap.add_argument("--rails-tau", type=float, default=0.55)
+    ap.add_argument("--twin-alpha", type=float, default=0.75)
+    ap.add_argument("--breath-sec", type=float, default=6.0)
+    ap.add_argument("--timeline", nargs=4, type=int, default=[7,9,12,17])
+    ap.add_argument("--alpha", nargs=2, type=float, default=[0.06, 0.30], metavar=("LO","HI"),
+                    help="triad opacity at exhale / inhale")
+    ap.add_argument("--drift", type=float, default=1.0, help="outer bands spread by up to this many columns")
+    ap.add_argument("--fps", type=float, default=30)
+    ap.add_argument("--start", type=float, default=0.0, help="first frame time (s)")
+    ap.add_argument("--seconds", type=float, default=None, help="default: the whole macro-cycle (270 s)")
+    ap.add_argument("--size", nargs=2, type=int, default=[1920,1080], metavar=("W","H"))
+    ap.add_argument("--dpi", type=int, default=120)
+    ap.add_argument("--png-level", type=int, default=1, help="zlib level of the frame PNGs")
+    ap.add_argument("--workers", type=int, default=None, help="default: os.cpu_count()")
+    ap.add_argument("--outdir", type=str, default="frames")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    meta = run_animation(N=args.N, outdir=args.outdir, fps=args.fps, seconds=args.seconds, start=args.start,
+                         centers=tuple(args.centers), sigma=args.sigma, mode=args.mode, delta=args.delta,
+                         rails_tau=args.rails_tau, twin_alpha=args.twin_alpha, mod_pair=tuple(args.mod_pair),
+                         timeline=tuple(args.timeline), breath_sec=args.breath_sec, alpha=tuple(args.alpha),
+                         drift=args.drift, size=tuple(args.size), dpi=args.dpi, workers=args.workers,
+                         level=args.png_level, cache=args.cache)
+    print(f"{meta['frames']} frames → {args.outdir}/ ({meta['render_fps']} fps, {meta['workers']} workers)")
+    return meta
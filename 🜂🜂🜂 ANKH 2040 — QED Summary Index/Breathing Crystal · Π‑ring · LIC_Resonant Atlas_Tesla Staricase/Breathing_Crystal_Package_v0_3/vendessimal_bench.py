@@ -0,0 +1,149 @@
+
+# Vendessimal Bench — per-stage timings + peak RSS of both toolkits across N scales, with baseline compare
+# Usage: python3 vendessimal_prime_toolkit.py bench --out bench.json                       # N = 1e3 … 1e8
+#        python3 vendessimal_prime_toolkit.py bench --N 1e5 1e6 --baseline bench.json --threshold 0.15
+#
+# Each (toolkit, N) case runs in a fresh spawned process, so ru_maxrss is that case's own high-water mark;
+# stages run in plot_extended order and record the best of --repeat wall times plus the RSS high-water
+# after the stage. Stages: sieve, twins, residue, triad, rails, euler, render (end-to-end plot_extended,
+# skipped above --render-max). Compare mode flags a stage as a regression when it is slower than the
+# baseline by more than --threshold (relative) and --min-delta (absolute seconds), or its peak RSS grew
+# by more than --rss-threshold; the exit status is 1 if anything regressed.
+import argparse, importlib.util, json, math, multiprocessing, os, platform, resource, sys, tempfile, time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TOOLKITS = ("cli", "bundle")
+STAGES = ("sieve", "twins", "residue", "triad", "rails", "euler", "render")
+DEFAULT_N = [10**k for k in range(3, 9)]
+
+# ---------- stage definitions ----------
+def _load_bundle():
+    path = os.path.join(HERE, "prime_suite_bundle", "vendessimal_prime_toolkit.py")
+    spec = importlib.util.spec_from_file_location("bundle_vendessimal_prime_toolkit", path)
+    mod = importlib.util.module_from_spec(spec); spec.loader.exec_module(mod)
+    return mod
+
+def _stages(toolkit, N, render, tmpdir):
+    # (name, thunk) pairs reproducing what plot_extended computes with its defaults
+    import prime_cache
+    W = 20
+    rows = -(-N // W)
+    if toolkit == "cli":
+        import vendessimal_prime_toolkit as vpt
+        from vendessimal_layers import NODES, LayerGraph
+        lg = LayerGraph()                  # node builders called directly: every repeat rebuilds, no memo hits
+        state = {}
+        def twins(): state["twins"] = vpt.twin_members(N)
+        return [("sieve", lambda: prime_cache.primes_upto(N)),
+                ("twins", twins),
+                ("residue", lambda: NODES["residue"](lg, N=N, mod_pair=(19,29), width=W)),
+                ("triad", lambda: NODES["triad"](lg, N=N, centers=(3,10,17), sigma=2.4, mode="gauss", delta=2.0, width=W)),
+                ("rails", lambda: vpt.rails_grid(rows, W, tau=0.55)),
+                ("euler", lambda: vpt.euler41_values(N)),
+                ("render", lambda: vpt.plot_extended(N=N, outpath=os.path.join(tmpdir, "cli.png"), render=render,
+                                                     twins=state.get("twins")))]
+    b = _load_bundle()
+    return [("sieve", lambda: b.primes_upto(N)),
+            ("twins", lambda: b.twin_primes_upto(N)),
+            ("residue", lambda: b.residue_grid(rows*W, W, (19,29), major=1)),
+            ("triad", lambda: b.triad_grid(rows, W)),
+            ("rails", lambda: [b.rail_members(rows, W, s, [0,5,10,15], tau=0.55) for s in (math.sqrt(2), math.sqrt(5))]),
+            ("euler", lambda: b.euler_41_trace(N)),
+            ("render", lambda: b.plot_extended(N=N, outpath=os.path.join(tmpdir, "bundle.png")))]
+
+def _rss_mb():
+    r = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return r/(1 << 20) if sys.platform == "darwin" else r/1024          # bytes on macOS, KiB elsewhere
+
+def run_case(toolkit, N, repeat=3, render="raster", render_max=10**6, cache=None):
+    # runs in the child process; returns {stage: {seconds, rss_mb}} (+ case totals)
+    import matplotlib; matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import prime_cache
+    prime_cache.set_default_cache(cache)
+    out = dict(toolkit=toolkit, N=N, stages={}, start_rss_mb=round(_rss_mb(), 1))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, fn in _stages(toolkit, N, render, tmpdir):
+            if name == "render" and N > render_max:
+                out["stages"][name] = dict(skipped=f"N > render_max ({render_max})"); continue
+            best = math.inf
+            for _ in range(1 if name == "render" else repeat):
+                t0 = time.perf_counter(); fn(); best = min(best, time.perf_counter() - t0)
+                plt.close("all")
+            out["stages"][name] = dict(seconds=round(best, 6), rss_mb=round(_rss_mb(), 1))
+    out["peak_rss_mb"] = round(_rss_mb(), 1)
+    out["total_seconds"] = round(sum(s.get("seconds", 0) for s in out["stages"].values()), 6)
+    return out
+
+# ---------- driver ----------
+def _meta():
+    import numpy as np
+    try:
+        import subprocess
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True,
+                             text=True).stdout.strip() or None
+    except OSError:
+        rev = None
+    return dict(timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"), git=rev, python=platform.python_version(),
+                numpy=np.__version__, machine=platform.machine(), platform=platform.platform(),
+                cpus=os.cpu_count())
+
+def run_bench(Ns=DEFAULT_N, toolkits=TOOLKITS, repeat=3, render="raster", render_max=10**6, cache=None,
+              log=sys.stdout):
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for N in Ns:
+        for tk in toolkits:
+            with ctx.Pool(1) as pool:                               # fresh interpreter: clean ru_maxrss
+                res = pool.apply(run_case, (tk, N, repeat, render, render_max, cache))
+            results.append(res)
+            stages = "  ".join(f"{k}={v['seconds']:.3f}" for k, v in res["stages"].items() if "seconds" in v)
+            print(f"{tk:>6} N={N:<11} {stages}  peak={res['peak_rss_mb']:.0f}MB", file=log, flush=True)
+    return dict(meta=_meta(), config=dict(repeat=repeat, render=render, render_max=render_max), results=results)
+
+def compare(current, baseline, threshold=0.10, min_delta=0.005, rss_threshold=0.20):
+    # list of regression dicts (stage "peak_rss" for memory)
+    base = {(r["toolkit"], r["N"]): r for r in baseline["results"]}
+    found = []
+    for r in current["results"]:
+        b = base.get((r["toolkit"], r["N"]))
+        if b is None: continue
+        for name, s in r["stages"].items():
+            old = b["stages"].get(name, {})
+            if "seconds" not in s or "seconds" not in old: continue
+            delta = s["seconds"] - old["seconds"]
+            if delta > min_delta and delta > threshold*old["seconds"]:
+                found.append(dict(toolkit=r["toolkit"], N=r["N"], stage=name, baseline=old["seconds"],
+                                  current=s["seconds"], change=delta/max(old["seconds"], 1e-9)))
+        if r["peak_rss_mb"] > b["peak_rss_mb"]*(1 + rss_threshold):
+            found.append(dict(toolkit=r["toolkit"], N=r["N"], stage="peak_rss", baseline=b["peak_rss_mb"],
+                              current=r["peak_rss_mb"], change=r["peak_rss_mb"]/b["peak_rss_mb"] - 1))
+    return found
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py bench")
+    ap.add_argument("--N", nargs="+", type=lambda s: int(float(s)), default=DEFAULT_N, help="sizes (accepts 1e8)")
+    ap.add_argument("--toolkits", nargs="+", choices=TOOLKITS, default=list(TOOLKITS))
+    ap.add_argument("--repeat", type=int, default=3, help="best-of repeats per stage (render runs once)")
+    ap.add_argument("--render", choices=["mpl","raster"], default="raster", help="render mode of the cli toolkit")
+    ap.add_argument("--render-max", type=lambda s: int(float(s)), default=10**6, help="skip render above this N")
+    ap.add_argument("--out", type=str, default=None, help="write results JSON (usable as a later --baseline)")
+    ap.add_argument("--baseline", type=str, default=None, help="results JSON to compare against")
+    ap.add_argument("--threshold", type=float, default=0.10, help="relative slowdown counted as a regression")
+    ap.add_argument("--min-delta", type=float, default=0.005, help="ignore slowdowns below this many seconds")
+    ap.add_argument("--rss-threshold", type=float, default=0.20, help="relative peak-RSS growth counted as a regression")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    current = run_bench(args.N, args.toolkits, args.repeat, args.render, args.render_max, args.cache)
+    if args.out:
+        with open(args.out, "w") as f: json.dump(current, f, indent=2)
+        print(args.out)
+    if args.baseline:
+        with open(args.baseline) as f: baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.min_delta, args.rss_threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['toolkit']} N={r['N']} {r['stage']}: {r['baseline']:.4g} → {r['current']:.4g} "
+                  f"({r['change']:+.0%})")
+        print(f"{len(regressions)} regression(s) vs {args.baseline}")
+        if regressions: sys.exit(1)
+    return current
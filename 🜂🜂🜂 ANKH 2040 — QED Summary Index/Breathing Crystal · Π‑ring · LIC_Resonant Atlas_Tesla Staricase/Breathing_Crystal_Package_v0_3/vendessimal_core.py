@@ -0,0 +1,123 @@
+
+# Vendessimal Core — compute API shared by both toolkit copies (numpy only, never imports matplotlib)
+# Usage: import vendessimal_core as vc; vc.twin_members(10**6); vc.residue_grid(3000)
+#
+# vendessimal_prime_toolkit.py (CLI) and prime_suite_bundle/vendessimal_prime_toolkit.py re-export these
+# names; plotting lives in vendessimal_render, which the toolkits import on first plot call, so
+# compute-only runs (export, quadratics, bench stages) never pay matplotlib's import cost.
+import math
+import numpy as np
+import prime_cache
+from prime_sieve import is_prime
+from prime_cache import twin_lows
+from prime_set import PrimeSet
+from vendessimal_grid import residue_grid
+from vendessimal_rails import rail_mask, rail_members
+from vendessimal_quadratics import trace as quad_trace
+import prime_constellations
+
+# ---------- primes / twins ----------
+# PrimeSet (packed bitset + rank/select) by default; python=True returns the plain list / set
+def primes_upto(n, python=False):
+    if python: return prime_cache.primes_upto(n).tolist() if n >= 2 else []
+    return PrimeSet.upto(n)
+
+def twin_primes_upto(n, python=False):
+    # twin lows p ≤ n (p+2 may exceed n)
+    lows = prime_cache.twin_lows(n+2)
+    return lows.tolist() if python else PrimeSet.from_values(lows, max(n, 0))
+
+def twin_pairs_upto(N, python=False):
+    members = twin_members(N)
+    return set(members.tolist()) if python else PrimeSet.from_values(members, max(N, 0))
+
+def twin_members(N, lows=None):
+    # sorted array of every twin-prime member ≤ N (optionally from precomputed twin lows)
+    lows = twin_lows(N) if lows is None else lows[lows+2 <= N]
+    return np.union1d(lows, lows+2)
+
+def constellation_members(N, pattern):
+    # every prime ≤ N in some match of an offset pattern ("triplet", (0,4,6,10), …); (0,2) = twin_members
+    return prime_constellations.members(N, pattern)
+
+def euler41_values(N):
+    return quad_trace(1, 1, 41, N).tolist()
+
+euler_41_trace = euler41_values
+
+# ---------- grid geometry ----------
+def grid_coords(x, width=20):
+    # 1-based x → (row, col) zero-based for imshow-like layouts
+    x0 = x-1
+    row = x0 // width
+    col = x0 % width
+    return row, col
+
+grid_xy = grid_coords
+
+def to_flat_index(row, col, width=20):
+    return row*width+col+1
+
+# ---------- overlay masks ----------
+def gauss_windows(x, centers, sigma, support=None, log=False, dtype=np.float64):
+    # (len(x), len(centers)) windows exp(−½((x − c)/σ)²) over ascending positions x
+    # support=k: only |x − c| ≤ k·σ is evaluated (a searchsorted slice per center), the rest stays 0
+    # log=True: the exponent −½((x − c)/σ)² itself (−inf off-support), nothing underflows
+    x = np.asarray(x, dtype=dtype)
+    out = np.full((len(x), len(centers)), -np.inf if log else 0.0, dtype=dtype)
+    for j, c in enumerate(centers):
+        lo, hi = (0, len(x)) if support is None else \
+            (np.searchsorted(x, c - support*sigma, "left"), np.searchsorted(x, c + support*sigma, "right"))
+        d = (x[lo:hi] - c)/sigma
+        e = -0.5*d*d
+        out[lo:hi, j] = e if log else np.exp(e)
+    return out
+
+def triad_mask(cols, centers, sigma, mode, delta, support=None, log=False, dtype=float):
+    # support=k skips cells beyond k·σ of every center; log=True returns log(mask) (logaddexp, −inf = 0)
+    cols = np.asarray(cols, dtype=dtype)
+    mask = np.full(cols.shape, -np.inf if log else 0.0, dtype=dtype)
+    for c in centers:
+        near = Ellipsis if support is None or mode!='gauss' else np.abs(cols-c) <= support*sigma
+        x = cols[near]
+        if mode=='gauss':
+            e = -0.5*((x-c)/sigma)**2
+        else:
+            e = np.where(np.abs(x-c)<=delta, 0.0, -np.inf).astype(dtype) if log else (np.abs(x-c)<=delta).astype(dtype)
+        if log: mask[near] = np.logaddexp(mask[near], e)
+        else: mask[near] += np.exp(e) if mode=='gauss' else e
+    if log:
+        return mask - mask.max() if np.isfinite(mask.max()) else mask
+    mask = mask / mask.max() if mask.max()>0 else mask
+    return mask
+
+def triad_row(width=20, centers=(3.5,10,16.5), sigma=2.2, delta=2.0, mode='gauss', support=None, log=False,
+              dtype=float):
+    # the triad windows of one grid row (every row is the same)
+    return triad_mask(np.arange(width), centers, sigma, mode, delta, support, log, dtype)
+
+def triad_grid(rows, width=20, centers=(3.5,10,16.5), sigma=2.2, delta=2.0, mode='gauss', support=None,
+               log=False, dtype=float):
+    # (rows, width) triad windows; the bundle's triad_mask signature. One row is computed and broadcast,
+    # so the result is a read-only view
+    return np.broadcast_to(triad_row(width, centers, sigma, delta, mode, support, log, dtype), (rows, width))
+
+def rails_grid(rows, width, tau=0.55, dtype=float):
+    # √2 and √5 rails (two diagonal families) on a (rows, width) grid: rows/cols normalized to [0,1] to be
+    # scale-agnostic, slopes s and 1/s per family (mod 1), cells closer than tau (circular) are on a rail.
+    s2 = math.sqrt(2.0)
+    s5 = math.sqrt(5.0)
+    rail = rail_mask(rows, width, [s2, 1/s2, s5, 1/s5], tau=tau, period=1.0,
+                     row_unit=max(rows-1, 0)+1e-9, col_unit=width-1+1e-9, strict=True)
+    return rail.astype(dtype)
+
+def rails_mask(rows, cols, tau=0.55):
+    # original signature: row / column coordinate arrays (e.g. the poster's R, C grids) → rails at those cells
+    r = np.asarray(rows); c = np.asarray(cols)
+    r, c = np.broadcast_arrays(r - r.min(), c - c.min())
+    r, c = np.rint(r).astype(np.int64), np.rint(c).astype(np.int64)
+    return rails_grid(int(r.max()) + 1, int(c.max()) + 1, tau)[r, c]
+
+def rail_membership(rows, width, slope, b_list, tau=0.6, python=False):
+    members = rail_members(rows, width, slope, b_list, tau=tau)
+    return set(members.tolist()) if python else PrimeSet.from_values(members, rows*width, "plain")
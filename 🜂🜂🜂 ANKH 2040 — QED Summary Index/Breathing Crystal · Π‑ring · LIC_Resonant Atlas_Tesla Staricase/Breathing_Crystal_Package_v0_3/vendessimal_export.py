@@ -0,0 +1,110 @@
+
+# Vendessimal Export — streaming writers for the residue-legend / twin-prime datasets
+# Usage: python3 vendessimal_prime_toolkit.py export legend --N 3000 --out prime_residue_legend_mod19_29.csv
+#        python3 vendessimal_prime_toolkit.py export twins --N 1e9 --out twins.csv.gz
+#        python3 vendessimal_prime_toolkit.py export twins --N 1e10 --out twins_npy --format npy
+#
+# Primes are pulled chunk by chunk from the sieve (or the prime cache), so memory is constant in N.
+# Formats: csv, csv.gz, or npy — a directory with one uint64 (float32/64 for float columns) .npy per column
+# (header patched at the end, each column can be np.load(..., mmap_mode='r')'d). Float columns are
+# written as repr() in the csv formats.
+import argparse, gzip, os
+import numpy as np
+import prime_cache
+
+ROWS_PER_WRITE = 1 << 16
+
+# ---------- datasets ----------
+def legend_chunks(N, mod_pair=(19,29), lo=0):
+    for ps in prime_cache.iter_primes(lo, N+1):
+        yield ps, ps % mod_pair[0], ps % mod_pair[1]
+
+def twin_chunks(N, lo=0):
+    for lows in prime_cache.iter_twin_lows(N):
+        lows = lows[lows >= lo]
+        if len(lows): yield lows, lows + 2
+
+def legend_header(mod_pair=(19,29)):
+    return ["n", f"mod_{mod_pair[0]}", f"mod_{mod_pair[1]}"]
+
+TWIN_HEADER = ["p", "p+2"]
+
+# ---------- writers ----------
+def _write_csv(f, header, chunks):
+    f.write(",".join(header) + "\n")
+    rows = 0
+    for cols in chunks:
+        block = np.column_stack(cols)
+        line = ",".join("%r" if np.asarray(c).dtype.kind == "f" else "%d" for c in cols) + "\n"
+        for i in range(0, len(block), ROWS_PER_WRITE):
+            part = block[i:i+ROWS_PER_WRITE]
+            f.write((line*len(part)) % tuple(part.ravel().tolist()))
+        rows += len(block)
+    return rows
+
+def _npy_header(n, dtype="<u8"):
+    # fixed-width shape so the header can be rewritten in place once n is known
+    h = "{'descr': '%s', 'fortran_order': False, 'shape': (%20d,), }" % (dtype, n)
+    h += " "*(64 - (10 + len(h) + 1) % 64) + "\n"
+    return b"\x93NUMPY\x01\x00" + len(h).to_bytes(2, "little") + h.encode("latin1")
+
+def _npy_dtype(col):
+    return f"<f{col.dtype.itemsize}" if col.dtype.kind == "f" else "<u8"
+
+def _safe_name(col):
+    return col.replace("+", "plus")
+
+def _write_npy_columns(path, header, chunks):
+    os.makedirs(path, exist_ok=True)
+    files = [open(os.path.join(path, _safe_name(c) + ".npy"), "wb") for c in header]
+    dtypes = ["<u8"]*len(files)
+    try:
+        for f in files: f.write(_npy_header(0))
+        rows = 0
+        for cols in chunks:
+            for f, col in zip(files, cols):
+                f.write(np.asarray(col, dtype=_npy_dtype(np.asarray(col))).tobytes())
+            if not rows: dtypes = [_npy_dtype(np.asarray(c)) for c in cols]
+            rows += len(cols[0])
+        for f, dt in zip(files, dtypes):
+            f.seek(0); f.write(_npy_header(rows, dt))
+    finally:
+        for f in files: f.close()
+    return rows
+
+def write_table(path, header, chunks, fmt="auto"):
+    # returns the number of data rows written
+    if fmt == "auto":
+        fmt = "gz" if path.endswith(".gz") else "npy" if not os.path.splitext(path)[1] else "csv"
+    if fmt == "npy":
+        return _write_npy_columns(path, header, chunks)
+    if fmt == "gz":
+        with gzip.open(path, "wt", compresslevel=6, newline="") as f:
+            return _write_csv(f, header, chunks)
+    with open(path, "w", newline="") as f:
+        return _write_csv(f, header, chunks)
+
+def export_residue_legend(path, N, mod_pair=(19,29), fmt="auto", lo=0):
+    return write_table(path, legend_header(mod_pair), legend_chunks(N, mod_pair, lo), fmt)
+
+def export_twins(path, N, fmt="auto", lo=0):
+    return write_table(path, TWIN_HEADER, twin_chunks(N, lo), fmt)
+
+# ---------- CLI (`vendessimal_prime_toolkit.py export …`) ----------
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py export")
+    ap.add_argument("dataset", choices=["legend", "twins"])
+    ap.add_argument("--N", type=lambda s: int(float(s)), default=3000, help="upper bound (accepts 1e9)")
+    ap.add_argument("--lo", type=int, default=0, help="first value to emit")
+    ap.add_argument("--mod-pair", nargs=2, type=int, default=[19,29])
+    ap.add_argument("--format", choices=["auto", "csv", "gz", "npy"], default="auto")
+    ap.add_argument("--out", type=str, required=True)
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    if args.cache: prime_cache.set_default_cache(args.cache)
+    if args.dataset == "legend":
+        rows = export_residue_legend(args.out, args.N, tuple(args.mod_pair), args.format, args.lo)
+    else:
+        rows = export_twins(args.out, args.N, args.format, args.lo)
+    print(f"{args.out}: {rows} rows")
+    return args.out
@@ -0,0 +1,148 @@
+
+# Vendessimal Grid — vectorized residue-class layers
+# Usage: from vendessimal_grid import residue_grid; idx = residue_grid(3000, 20, (19,29))
+#        from vendessimal_grid import TiledGrid; g = TiledGrid(10**9); g.tiles.shape   # (90745, 551, 20)
+#
+# The class of cell x depends on x mod lcm(m0, m1) only, so a width-w grid repeats every lcm(m0, m1, w)
+# cells (11,020 = 551 rows of 20 for 19/29). residue_grid computes that first period and fills the rest by
+# doubling copies; TiledGrid keeps just the period and exposes the whole grid as a read-only stride-0 view
+# (reps, period rows, w), materializing rows only when asked (np.asarray, slicing, rows()).
+import math
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+CHUNK = 1 << 20                  # cells per pass; bounds the int64 scratch buffers
+
+def grid_shape(N, width=20):
+    return -(-int(N) // width), width
+
+def period_cells(width=20, mod_pair=(19,29)):
+    return math.lcm(mod_pair[0], mod_pair[1], width)
+
+def residue_grid(N, width=20, mod_pair=(19,29), major=0, dtype=np.uint16, pad=0, chunk=CHUNK):
+    # (rows, width) grid of class indices for x = 1…N, row-major like grid_coords/grid_xy.
+    #   major=0: (x % m0)*m1 + (x % m1)   (CLI colouring)
+    #   major=1: (x % m0) + (x % m1)*m0   (bundle colouring)
+    # cells past N (last row) are set to `pad`. Only the first lcm(m0, m1) cells are computed.
+    m0, m1 = mod_pair
+    if m0*m1 - 1 > np.iinfo(dtype).max:
+        raise ValueError(f"{m0}×{m1} classes do not fit in {np.dtype(dtype).name}")
+    rows, width = grid_shape(N, width)
+    out = np.empty((rows, width), dtype=dtype)
+    flat = out.reshape(-1)                               # view, written in place
+    flat[N:] = pad
+    L = min(math.lcm(m0, m1), N)
+    step = np.arange(min(chunk, max(L, 1)), dtype=np.int64)
+    x = np.empty_like(step); a = np.empty_like(step); b = np.empty_like(step)
+    for lo in range(0, L, len(step)):
+        n = min(len(step), L - lo)
+        xs, as_, bs = x[:n], a[:n], b[:n]
+        np.add(step[:n], lo + 1, out=xs)                 # x = lo+1 … lo+n, same arange reused
+        np.remainder(xs, m0, out=as_)
+        np.remainder(xs, m1, out=bs)
+        if major == 0: as_ *= m1
+        else: bs *= m0
+        np.add(as_, bs, out=as_)
+        flat[lo:lo+n] = as_
+    while L < N:                                         # period copies: L stays a multiple of lcm(m0, m1)
+        n = min(L, N - L)
+        flat[L:L+n] = flat[:n]
+        L += n
+    return out
+
+class TiledGrid:
+    # residue_grid(N, …) held as one period: `period` is the (P, width) block of lcm(m0, m1, width) cells,
+    # `tiles` the read-only (reps, P, width) stride-0 view covering every row; memory is independent of N.
+    # np.asarray / slicing / rows() materialize exactly residue_grid's values (pad past N included).
+    ndim = 2
+
+    def __init__(self, N, width=20, mod_pair=(19,29), major=0, dtype=np.uint16, pad=0):
+        self.N, self.width, self.mod_pair, self.pad = int(N), width, tuple(mod_pair), pad
+        self.shape = grid_shape(self.N, width)
+        self.dtype = np.dtype(dtype)
+        self.period = residue_grid(period_cells(width, mod_pair), width, mod_pair, major, dtype)
+        self.period.flags.writeable = False
+        reps = -(-self.shape[0] // len(self.period))
+        self.tiles = as_strided(self.period, (reps,) + self.period.shape, (0,) + self.period.strides,
+                                writeable=False)
+
+    @property
+    def nbytes(self):
+        return self.period.nbytes
+
+    def take(self, rows):
+        # materialized grid rows (any int array)
+        rows = np.asarray(rows, dtype=np.int64)
+        out = self.period[rows % len(self.period)]
+        if self.N % self.width: out[rows == self.shape[0] - 1, self.N % self.width:] = self.pad
+        return out
+
+    def rows(self, r0, r1):
+        return self.take(np.arange(r0, min(r1, self.shape[0])))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _row_index(self, k):
+        # row key → int or int array of just the selected rows (never an index over every row)
+        n = self.shape[0]
+        if isinstance(k, (int, np.integer)): return range(n)[k]
+        if isinstance(k, slice):
+            r = range(n)[k]
+            return np.arange(r.start, r.stop, r.step, dtype=np.int64)
+        k = np.asarray(k)
+        if k.dtype == bool:
+            if k.shape != (n,): raise IndexError(f"boolean row index of shape {k.shape} for {n} rows")
+            return np.flatnonzero(k)
+        k = k.astype(np.int64)
+        if ((k < -n) | (k >= n)).any(): raise IndexError(f"row index out of range for {n} rows")
+        return np.where(k < 0, k + n, k)
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        r = self._row_index(key[0])
+        out = self.take(np.atleast_1d(r))
+        return out[0][key[1:]] if np.ndim(r) == 0 else out[(slice(None),) + key[1:]]
+
+    def __array__(self, dtype=None, copy=None):
+        out = self.rows(0, self.shape[0])
+        return out if dtype is None else out.astype(dtype)
+
+# ---------- one buffer, many widths ----------
+class GridViews:
+    # flat per-layer buffers over x = 1…N padded by max_width-1 cells; every (rows, width) layout is a
+    # read-only reshape view of the same memory (np.shares_memory holds), so a width sweep costs one sieve
+    #   primes:  bool, cell ⇔ x prime (pad False)       classes: residue_grid class indices (pad `pad`)
+    def __init__(self, N, max_width=64, mod_pair=(19,29), major=0, pad=0):
+        import prime_cache
+        self.N, self.max_width, self.mod_pair = int(N), max_width, mod_pair
+        size = self.N + max_width - 1
+        self.primes = np.zeros(size, dtype=bool)
+        for ps in prime_cache.iter_primes(0, self.N + 1):
+            self.primes[ps - 1] = True
+        self.classes = residue_grid(size, 1, mod_pair, major=major).reshape(-1)
+        self.classes[self.N:] = pad
+
+    def view(self, layer, width):
+        if not 1 <= width <= self.max_width:
+            raise ValueError(f"width {width} outside 1…{self.max_width} (raise max_width)")
+        buf = getattr(self, layer)
+        rows, _ = grid_shape(self.N, width)
+        v = buf[:rows*width].reshape(rows, width)
+        v.flags.writeable = False
+        return v
+
+    def cells_per_column(self, width):
+        return self.N // width + (np.arange(width) < self.N % width)
+
+    def column_density(self, widths, chunk=CHUNK):
+        # {width: primes per cell of each column}; all widths from one pass over the prime positions
+        widths = np.asarray(widths, dtype=np.int64)
+        off = np.concatenate(([0], np.cumsum(widths)))
+        counts = np.zeros(off[-1], dtype=np.int64)
+        x0 = np.flatnonzero(self.primes[:self.N])          # x - 1
+        for i in range(0, len(x0), max(1, chunk // len(widths))):
+            cols = x0[i:i + chunk // len(widths), None] % widths[None, :] + off[None, :-1]
+            counts += np.bincount(cols.ravel(), minlength=off[-1])
+        return {int(w): counts[off[k]:off[k+1]] / np.maximum(self.cells_per_column(int(w)), 1)
+                for k, w in enumerate(widths)}
@@ -0,0 +1,128 @@
+
+# Vendessimal Layers — lazy, memoized overlay layers for the toolkit posters (numpy only)
+# Usage: from vendessimal_layers import default_graph; g = default_graph()
+#        g.get("twins", N=10**6); g.get("triad", N=3000, centers=(3,10,17), sigma=2.4, mode="gauss", delta=2.0)
+#
+# Every overlay is a node computed on first request and memoized per parameter set; nodes pull their
+# dependencies through the same graph (twin_xy ← twins, constellation ← twins for (0,2), …). A render asks only for the layers its mode draws — a twin-only poster costs the sieve plus the twin
+# scatter — and later renders in the same process (sweep workers, repeated plot_extended calls) reuse
+# whatever is already there.
+# Memoized arrays are capped at max_bytes, least-recently-used first.
+from collections import OrderedDict
+import numpy as np
+from vendessimal_grid import GridViews, TiledGrid
+from vendessimal_core import (twin_members, constellation_members, euler41_values, grid_coords,
+                              triad_grid, rails_grid, quad_trace)
+from prime_constellations import parse_pattern
+from prime_spf import FEATURED, spf_table, factor_grid, find_thresholds, threshold_markers
+
+W = 20
+MAX_BYTES = 1 << 30
+
+# ---------- nodes ----------
+# name → builder(graph, **params); builders call graph.get for their inputs
+def _rows(N, width=W):
+    return N//width + (1 if N%width else 0)
+
+def _columns(g, N, width=W):
+    return np.ones((_rows(N, width),1)) * np.arange(width)[None,:]
+
+def _residue(g, N, mod_pair, width=W):
+    # one lcm(m0, m1, width) period, tiled read-only over every row (materialized by imshow / np.asarray)
+    return TiledGrid(N, width=width, mod_pair=mod_pair)
+
+def _triad(g, N, centers, sigma, mode, delta, width=W, support=None, dtype="float64"):
+    # one row of windows broadcast over the grid (read-only view); support=k skips cells beyond k·σ
+    return triad_grid(_rows(N, width), width, centers, sigma, delta, mode, support, dtype=np.dtype(dtype))
+
+def _rails(g, N, tau, width=W, dtype="float64"):
+    return rails_grid(_rows(N, width), width, tau=tau, dtype=np.dtype(dtype))
+
+def _twins(g, N):
+    return twin_members(N)
+
+def _twin_xy(g, N, width=W):
+    return grid_coords(g.get("twins", N=N), width=width)
+
+def _constellation(g, N, pattern):
+    offsets = parse_pattern(pattern)
+    return g.get("twins", N=N) if offsets == (0, 2) else constellation_members(N, offsets)
+
+def _constellation_xy(g, N, pattern, width=W):
+    return grid_coords(g.get("constellation", N=N, pattern=parse_pattern(pattern)), width=width)
+
+def _euler41(g, N, width=W):
+    return grid_coords(np.array(euler41_values(N), dtype=np.int64), width=width)
+
+def _quadratic(g, N, coeffs, width=W):
+    return grid_coords(quad_trace(*coeffs, N), width=width)
+
+def _grid_views(g, N, max_width, mod_pair):
+    # one primality + class buffer shared by every width (vendessimal_grid.GridViews)
+    return GridViews(N, max_width=max_width, mod_pair=mod_pair)
+
+def _spf(g, N):
+    return spf_table(N)
+
+def _factors(g, N, width=W):
+    # per-cell factorization (CSR) + Ω grid, from the spf table
+    return factor_grid(N, width, g.get("spf", N=N))
+
+def _thresholds(g, N, width=W, mod_pair=None):
+    # [(row, col, colour, label)] of the 1061–1064 markers, or of every threshold window detected for mod_pair
+    if mod_pair is None:
+        marks = threshold_markers([FEATURED[0]], [FEATURED[1]])
+    else:
+        _, p, c, _ = find_thresholds(N, mod_pair, table=g.get("spf", N=N))
+        marks = threshold_markers(p, c, g.get("spf", N=N))
+    return [grid_coords(v, width=width) + (col, lab) for v, col, lab in marks if 1<=v<=N]
+
+NODES = dict(columns=_columns, residue=_residue, triad=_triad, rails=_rails, twins=_twins, twin_xy=_twin_xy,
+             constellation=_constellation, constellation_xy=_constellation_xy,
+             euler41=_euler41, quadratic=_quadratic, spf=_spf, factors=_factors, thresholds=_thresholds,
+             grid_views=_grid_views)
+
+# ---------- graph ----------
+def _freeze(v):
+    return tuple(_freeze(x) for x in v) if isinstance(v, (list, tuple)) else v
+
+def _nbytes(v):
+    if isinstance(v, (tuple, list)): return sum(_nbytes(x) for x in v)
+    if isinstance(v, GridViews): return v.primes.nbytes + v.classes.nbytes
+    if isinstance(v, np.ndarray) and v.size and v.strides[0] == 0: return _nbytes(v[0])      # broadcast rows
+    return getattr(v, "nbytes", 0)
+
+class LayerGraph:
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.memo = OrderedDict()
+        self.builds = {}                      # name → number of times computed (memo misses)
+
+    def get(self, name, **params):
+        key = (name, tuple(sorted((k, _freeze(v)) for k, v in params.items())))
+        if key in self.memo:
+            self.memo.move_to_end(key); return self.memo[key]
+        val = NODES[name](self, **params)
+        self.builds[name] = self.builds.get(name, 0) + 1
+        self.memo[key] = val
+        total = sum(_nbytes(v) for v in self.memo.values())
+        while total > self.max_bytes and len(self.memo) > 1:
+            _, old = self.memo.popitem(last=False)
+            total -= _nbytes(old)
+        return val
+
+    def put(self, name, val, **params):
+        # seed a node with a precomputed value (e.g. twins shared by a sweep's parent process)
+        self.memo[(name, tuple(sorted((k, _freeze(v)) for k, v in params.items())))] = val
+        return val
+
+    def clear(self):
+        self.memo.clear()
+
+_default = None
+
+def default_graph():
+    # process-wide graph shared by every plot_extended / plot_raster call
+    global _default
+    if _default is None: _default = LayerGraph()
+    return _default
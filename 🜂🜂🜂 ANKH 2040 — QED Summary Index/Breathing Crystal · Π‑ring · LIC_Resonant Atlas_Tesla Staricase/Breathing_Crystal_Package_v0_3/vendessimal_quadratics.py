@@ -0,0 +1,164 @@
+
+# Vendessimal Quadratics — vectorized sweep over prime-producing quadratics f(n) = a·n² + b·n + c
+# Usage: python3 vendessimal_prime_toolkit.py quadratics --a 1 --b 1 --c 1:100000 --n 100 --top 20
+#        python3 vendessimal_prime_toolkit.py --quadratic 1 1 41 --quadratic 1 -79 1601   # grid overlay
+#
+# Every coefficient triple is evaluated at n = 0 … n-1 as one int64 block; primality is prime_mr's: a bit
+# lookup in a wheel bitset below its sieve limit (2²⁴), batched Miller–Rabin above. Per polynomial we report the
+# leading prime run (Euler's n²+n+41 → 40), the prime count / density over the window and the
+# Bateman–Horn (Hardy–Littlewood) prediction C(f)·Σ 1/ln|f(n)|, with
+# C(f) = Π_p (1 − ω(p)/p) / (1 − 1/p), ω(p) = #roots of f mod p (closed form via the discriminant);
+# for n²+n+41, C = 6.645 = 2 × Hardy–Littlewood's 3.3198 (the 1/deg factor lives in ln f(n) ≈ 2 ln n).
+import argparse, math
+import numpy as np
+import prime_cache
+import prime_mr
+import prime_sieve
+
+CHUNK = 1 << 22                  # values evaluated per block
+MAX_VALUE = prime_mr.SIEVE_LIMIT  # |f(n)| below: sieve bitset (≤ 0.6 MB); above: batched Miller–Rabin
+
+# ---------- coefficients / values ----------
+def parse_range(s):
+    # "41" → [41]; "1:100000" → 1 … 100000 (inclusive); "1:99:2" → odd values
+    parts = [int(x) for x in str(s).split(":")]
+    if len(parts) == 1: return np.array(parts, dtype=np.int64)
+    step = parts[2] if len(parts) > 2 else 1
+    return np.arange(parts[0], parts[1] + (1 if step > 0 else -1), step, dtype=np.int64)
+
+def coeff_grid(a, b, c):
+    # cartesian product of coefficient ranges → (P, 3) int64
+    A, B, C = np.meshgrid(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64),
+                          np.asarray(c, dtype=np.int64), indexing="ij")
+    return np.column_stack((A.ravel(), B.ravel(), C.ravel()))
+
+def quad_values(coeffs, n):
+    # (P, 3) coefficients × n → (P, len(n)) int64, Horner form
+    coeffs = np.asarray(coeffs, dtype=np.int64).reshape(-1, 3)
+    n = np.asarray(n, dtype=np.int64)[None, :]
+    return (coeffs[:, :1]*n + coeffs[:, 1:2])*n + coeffs[:, 2:]
+
+def quad_values_float(coeffs, n):
+    # float64 f(n): magnitudes past int64 (Bateman–Horn weights)
+    coeffs = np.asarray(coeffs, dtype=np.int64).reshape(-1, 3).astype(np.float64)
+    n = np.asarray(n, dtype=np.float64)[None, :]
+    return (coeffs[:, :1]*n + coeffs[:, 1:2])*n + coeffs[:, 2:]
+
+def quad_fits(coeffs, n):
+    # (P, len(n)) bool: |a|·n² + |b|·n + |c| < 2⁶³, i.e. quad_values cannot wrap (exact near the edge)
+    coeffs = np.abs(np.asarray(coeffs, dtype=np.int64).reshape(-1, 3))
+    n = np.abs(np.asarray(n, dtype=np.int64))
+    cf, top = coeffs.astype(np.float64), float(n.max()) if n.size else 0.0
+    ok = np.ones((len(coeffs), n.size), dtype=bool)
+    rows = np.flatnonzero((cf[:, 0]*top + cf[:, 1])*top + cf[:, 2] >= 2.0**62)   # bound at max |n| (monotone)
+    if not len(rows): return ok
+    cf, nf = cf[rows], n.astype(np.float64)[None, :]
+    bound = np.zeros(ok.shape); bound[rows] = (cf[:, :1]*nf + cf[:, 1:2])*nf + cf[:, 2:]
+    ok[rows] = bound[rows] < 2.0**62
+    for i, j in np.argwhere((bound >= 2.0**62) & (bound < 2.0**65)).tolist():     # float too coarse here
+        a, b, c = coeffs[i].tolist()
+        m = int(n[j])
+        ok[i, j] = a*m*m + b*m + c < 1 << 63
+    return ok
+
+def trace(a, b, c, N):
+    # f(n) for n ≥ 0 with 1 ≤ f(n) ≤ N, in n order (the Euler-41 trace for (1, 1, 41))
+    a, b, c, N = int(a), int(b), int(c), int(N)
+    if a: n_hi = (abs(b) + math.isqrt(b*b + 4*abs(a)*(N + abs(c))))//(2*abs(a)) + 2
+    elif b: n_hi = (N + abs(c))//abs(b) + 2
+    else: n_hi = 1
+    ns = np.arange(n_hi)
+    v = quad_values((a, b, c), ns)[0]
+    return v[(v >= 1) & (v <= N) & quad_fits((a, b, c), ns)[0]]
+
+# ---------- primality ----------
+def prime_lookup(values):
+    # bool array: |values| prime — sieve bitset up to MAX_VALUE (grown by doubling, clamped there),
+    # Miller–Rabin above
+    v = np.abs(np.asarray(values, dtype=np.int64))
+    if not v.size or int(v.max()) < MAX_VALUE: return prime_mr.sieve_lookup(v)
+    return prime_mr.is_prime_array(v, MAX_VALUE)
+
+# ---------- statistics ----------
+def hl_constant(coeffs, plimit=1000):
+    # Bateman–Horn constant per polynomial, truncated at primes ≤ plimit (0 when f has a fixed divisor)
+    coeffs = np.asarray(coeffs, dtype=np.int64).reshape(-1, 3)
+    a, b, c = coeffs.T
+    logC = np.zeros(len(coeffs))
+    for p in prime_sieve.base_primes(plimit).tolist():
+        if p == 2:
+            w = (c % 2 == 0).astype(np.int64) + ((a + b + c) % 2 == 0)
+        else:
+            qr = np.zeros(p, dtype=np.int64); qr[(np.arange(1, p)**2) % p] = 1     # Legendre symbol + 1 table
+            ap, bp, cp = a % p, b % p, c % p
+            disc = (bp*bp - 4*ap*cp) % p
+            w = np.where(disc == 0, 1, 2*qr[disc])                              # a ≢ 0: 1 + (D/p)
+            w = np.where(ap == 0, np.where(bp != 0, 1, np.where(cp == 0, p, 0)), w)
+        with np.errstate(divide="ignore"):
+            logC += np.log(np.maximum(1 - w/p, 0)) - math.log(1 - 1/p)
+    return np.exp(logC)
+
+def leading_run(flags):
+    # length of the initial all-True stretch of every row
+    return np.where(flags.all(axis=1), flags.shape[1], np.argmin(flags, axis=1))
+
+def sweep(coeffs, n=100, signed=False, plimit=1000, chunk=CHUNK):
+    # per polynomial over n = 0 … n-1: leading prime run, prime count, density, Bateman–Horn expectation
+    coeffs = np.asarray(coeffs, dtype=np.int64).reshape(-1, 3)
+    P, ns = len(coeffs), np.arange(n, dtype=np.int64)
+    run, count, expected = (np.zeros(P, dtype=np.int64), np.zeros(P, dtype=np.int64), np.zeros(P))
+    step = max(1, chunk // max(n, 1))
+    for i in range(0, P, step):
+        v = quad_values(coeffs[i:i+step], ns)
+        fits = quad_fits(coeffs[i:i+step], ns)
+        flags = prime_lookup(np.where(fits, v, 0)) & fits             # wrapped int64 cells: not prime
+        if signed: flags &= v > 0
+        run[i:i+step], count[i:i+step] = leading_run(flags), flags.sum(axis=1)
+        if not fits.all(): v = np.where(fits, v, quad_values_float(coeffs[i:i+step], ns))  # 1/ln f: float past int64
+        m = np.abs(v) if not signed else v
+        expected[i:i+step] = np.where(m >= 2, 1/np.log(np.maximum(m, 2)), 0).sum(axis=1)
+    C = hl_constant(coeffs, plimit)
+    expected *= C
+    return dict(a=coeffs[:, 0], b=coeffs[:, 1], c=coeffs[:, 2], run=run, primes=count,
+                density=count/max(n, 1), hl_constant=C, expected=expected,
+                ratio=np.divide(count, expected, out=np.zeros(P), where=expected > 0))
+
+COLUMNS = ("a", "b", "c", "run", "primes", "density", "hl_constant", "expected", "ratio")
+
+def rank(res, key="run", top=None):
+    # indices sorted by key (descending), ties broken by prime count
+    order = np.lexsort((-res["primes"], -res[key]))
+    return order[:top] if top else order
+
+def write_csv(path, res, order=None):
+    order = np.arange(len(res["a"])) if order is None else order
+    cols = [res[k][order] for k in COLUMNS]
+    fmt = ["%d"]*5 + ["%.6f"]*4
+    np.savetxt(path, np.column_stack(cols), fmt=fmt, delimiter=",", header=",".join(COLUMNS), comments="")
+    return path
+
+# ---------- CLI (`vendessimal_prime_toolkit.py quadratics …`) ----------
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py quadratics")
+    ap.add_argument("--a", type=str, default="1", help="value or inclusive range lo:hi[:step] (negative: --b=-79)")
+    ap.add_argument("--b", type=str, default="1")
+    ap.add_argument("--c", type=str, default="41")
+    ap.add_argument("--n", type=int, default=100, help="evaluate n = 0 … n-1")
+    ap.add_argument("--signed", action="store_true", help="count only positive prime values (default: |f(n)|)")
+    ap.add_argument("--hl-primes", type=int, default=1000, help="truncate the Bateman–Horn product at p ≤ this")
+    ap.add_argument("--sort", choices=["run", "primes", "ratio"], default="run")
+    ap.add_argument("--top", type=int, default=20)
+    ap.add_argument("--out", type=str, default=None, help="CSV of all polynomials (sorted)")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    if args.cache: prime_cache.set_default_cache(args.cache)
+    coeffs = coeff_grid(parse_range(args.a), parse_range(args.b), parse_range(args.c))
+    res = sweep(coeffs, args.n, args.signed, args.hl_primes)
+    order = rank(res, args.sort)
+    if args.out: write_csv(args.out, res, order)
+    print(f"{len(coeffs)} polynomials, n < {args.n}")
+    print(f"{'a':>5} {'b':>6} {'c':>8} {'run':>5} {'primes':>6} {'density':>8} {'C(f)':>8} {'ratio':>6}")
+    for i in order[:args.top]:
+        print(f"{res['a'][i]:>5} {res['b'][i]:>6} {res['c'][i]:>8} {res['run'][i]:>5} {res['primes'][i]:>6} "
+              f"{res['density'][i]:>8.3f} {res['hl_constant'][i]:>8.4f} {res['ratio'][i]:>6.3f}")
+    return res
@@ -0,0 +1,74 @@
+
+# Vendessimal Rails — closed-form √2/√5 rail membership
+# Usage: from vendessimal_rails import rail_mask; m = rail_mask(150, 20, math.sqrt(2), [0,5,10,15], tau=0.55)
+#
+# A rail predicts a column per row, pred(r) = (slope·r/row_unit + b) mod period, and takes every cell
+# whose column c/col_unit lies within tau of pred (circular distance). Members of a row are therefore
+# whole column intervals, so everything below is computed per row, never per cell.
+#   bundle rails: row_unit = col_unit = 1, period = width, |d| ≤ tau
+#   CLI rails:    rows/cols normalised to [0,1] (row_unit = rows-1, col_unit = width-1), period = 1, |d| < tau
+import math
+import numpy as np
+
+def _pred(r, slopes, offsets, row_unit, period):
+    R = np.asarray(r, dtype=float) / row_unit
+    return (slopes[:, None, None]*R[None, None, :] + offsets[None, :, None]) % period   # (slope, b, row)
+
+def rail_intervals(rows, width, slope, offsets=(0.0,), tau=0.6, period=None,
+                   row_unit=1.0, col_unit=1.0, strict=False, row0=0):
+    # (row, lo, hi): inclusive column intervals hit by each rail in rows row0 … row0+rows-1
+    slopes = np.atleast_1d(np.asarray(slope, dtype=float))
+    offsets = np.atleast_1d(np.asarray(offsets, dtype=float))
+    if period is None: period = width / col_unit
+    r = np.arange(row0, row0 + rows, dtype=np.int64)
+    pred = _pred(r, slopes, offsets, row_unit, period)
+    cmax = (width - 1) / col_unit
+    ks = np.arange(math.floor(-tau/period) - 1, math.ceil((cmax + tau)/period) + 1)
+    center = pred[None] + ks[:, None, None, None]*period                 # (k, slope, b, row)
+    if strict:
+        lo = np.floor((center - tau)*col_unit).astype(np.int64) + 1
+        hi = np.ceil((center + tau)*col_unit).astype(np.int64) - 1
+    else:
+        lo = np.ceil((center - tau)*col_unit).astype(np.int64)
+        hi = np.floor((center + tau)*col_unit).astype(np.int64)
+    np.clip(lo, 0, width, out=lo); np.clip(hi, -1, width - 1, out=hi)
+    keep = lo <= hi
+    rr = np.broadcast_to(r, lo.shape)[keep]
+    return rr, lo[keep], hi[keep]
+
+def rail_mask(rows, width, slope, offsets=(0.0,), tau=0.6, **kw):
+    # bool (rows, width); interval ends are scattered into a difference array and prefix-summed
+    rr, lo, hi = rail_intervals(rows, width, slope, offsets, tau, **kw)
+    rr = rr - kw.get("row0", 0)
+    W1 = width + 1
+    diff = np.bincount(rr*W1 + lo, minlength=rows*W1).astype(np.int32)
+    diff -= np.bincount(rr*W1 + hi + 1, minlength=rows*W1).astype(np.int32)
+    return np.cumsum(diff.reshape(rows, W1), axis=1)[:, :width] > 0
+
+def rail_rows(rows, width, slope, offsets=(0.0,), tau=0.6, **kw):
+    # per-row member columns as CSR: cols[indptr[r]:indptr[r+1]]
+    m = rail_mask(rows, width, slope, offsets, tau, **kw)
+    indptr = np.zeros(rows + 1, dtype=np.int64)
+    np.cumsum(m.sum(axis=1), out=indptr[1:])
+    return indptr, np.nonzero(m)[1]
+
+def rail_members(rows, width, slope, offsets=(0.0,), tau=0.6, **kw):
+    # 1-based grid numbers n = row*width + col + 1 on the rails, ascending
+    return np.flatnonzero(rail_mask(rows, width, slope, offsets, tau, **kw)) + 1
+
+def rail_prime_counts(N, width, slope, offsets=(0.0,), tau=0.6, period=None,
+                      row_unit=1.0, col_unit=1.0, strict=False, primes=None):
+    # primes ≤ N on each rail, shape (len(slope), len(offsets)); streams prime chunks
+    if primes is None:
+        import prime_sieve
+        primes = prime_sieve.iter_primes(1, N + 1)
+    slopes = np.atleast_1d(np.asarray(slope, dtype=float))
+    offsets = np.atleast_1d(np.asarray(offsets, dtype=float))
+    if period is None: period = width / col_unit
+    counts = np.zeros((len(slopes), len(offsets)), dtype=np.int64)
+    for ps in primes:
+        r, c = np.divmod(np.asarray(ps, dtype=np.int64) - 1, width)
+        d = (c / col_unit - _pred(r, slopes, offsets, row_unit, period)) % period
+        d = np.minimum(d, period - d)
+        counts += ((d < tau) if strict else (d <= tau)).sum(axis=2)
+    return counts
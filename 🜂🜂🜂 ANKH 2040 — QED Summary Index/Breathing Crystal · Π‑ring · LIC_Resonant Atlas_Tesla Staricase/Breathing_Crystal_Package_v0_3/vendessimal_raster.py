@@ -0,0 +1,129 @@
+
+# Vendessimal Raster — headless numpy compositor for the grid and its overlays
+# Usage: python3 vendessimal_prime_toolkit.py --N 10000000 --render raster --out grid.png
+#
+# Each grid cell becomes a (cell_h × cell_w) pixel block. Layers are composited straight into an RGBA
+# buffer: colormapped layers go through a 256-entry LUT with imshow's normalisation, alpha layers are
+# blended "over" the buffer with Agg's integer blender (byte-identical to imshow), point layers stamp square / ring markers at cell centres. Cost is linear in
+# cells + points; matplotlib is only touched to read colormap tables, and the PNG is written with zlib.
+import struct, zlib
+import numpy as np
+
+# ---------- colour ----------
+def colormap_lut(name, n=256):
+    from matplotlib import colormaps          # colormap tables only, no pyplot / figure machinery
+    return colormaps[name].resampled(n)(np.arange(n), bytes=True)
+
+def to_rgba(color, alpha=1.0):
+    from matplotlib.colors import to_rgba as _to_rgba
+    return np.array(_to_rgba(color, alpha), dtype=np.float32)
+
+def apply_lut(values, lut, vmin=None, vmax=None):
+    # same mapping as imshow's Normalize + Colormap: x*N, top edge folded into the last entry
+    v = np.asarray(values, dtype=np.float64)
+    vmin = v.min() if vmin is None else vmin
+    vmax = v.max() if vmax is None else vmax
+    x = (v - vmin) / (vmax - vmin) if vmax > vmin else np.zeros_like(v)
+    i = (x*len(lut)).astype(np.int64)
+    np.clip(i, 0, len(lut) - 1, out=i)
+    return lut[i]
+
+# ---------- canvas ----------
+def blend_over(dst, src, alpha):
+    # Agg's plain-RGBA blender (what matplotlib's Agg backend uses), in integer math so results match
+    # imshow byte for byte. dst (…,4) uint8 in place, src (…,3|4) uint8, alpha (…) 0–255.
+    a = dst[..., 3].astype(np.int64)
+    alpha = np.asarray(alpha, dtype=np.int64)
+    r = dst[..., :3].astype(np.int64)*a[..., None]
+    na = ((alpha + a) << 8) - alpha*a
+    live = alpha > 0
+    nz = np.where(na > 0, na, 1)
+    rgb = (((src[..., :3].astype(np.int64) << 8) - r)*alpha[..., None] + (r << 8)) // nz[..., None]
+    dst[..., :3] = np.where(live[..., None], rgb, dst[..., :3])
+    dst[..., 3] = np.where(live, na >> 8, a)
+
+def alpha_byte(alpha):
+    return int(alpha*255)                     # matplotlib truncates artist alpha to a byte
+
+class Canvas:
+    # cell layers are composited at cell resolution; the first point layer (or save) upscales once
+    def __init__(self, rows, width, cell_px=(4, 4), background="white"):
+        self.rows, self.width = rows, width
+        self.ch, self.cw = cell_px
+        self.cells = np.empty((rows, width, 4), dtype=np.uint8)
+        self.cells[:] = np.round(to_rgba(background)*255).astype(np.uint8)
+        self.pix = None
+
+    def _pixels(self):
+        if self.pix is None:
+            self.pix = np.repeat(np.repeat(self.cells, self.ch, axis=0), self.cw, axis=1)
+        return self.pix
+
+    def blend_cells(self, rgba, alpha=1.0):
+        # rgba: (rows, width, 4) uint8; per-cell alpha = layer alpha × colormap alpha
+        rgba = np.asarray(rgba, dtype=np.uint8)
+        ab = alpha_byte(alpha)
+        for r0 in range(0, self.rows, 1 << 16):                 # bounded int64 scratch for tall grids
+            src = rgba[r0:r0 + (1 << 16)]
+            a = src[..., 3].astype(np.int64)*ab // 255 if ab < 255 else src[..., 3]
+            if self.pix is None:
+                blend_over(self.cells[r0:r0 + len(src)], src, a)
+            else:
+                up = lambda x: np.repeat(np.repeat(x, self.ch, axis=0), self.cw, axis=1)
+                blend_over(self.pix[r0*self.ch:(r0 + len(src))*self.ch], up(src), up(a))
+
+    def colormap(self, values, cmap="viridis", alpha=1.0, vmin=None, vmax=None):
+        self.blend_cells(apply_lut(values, colormap_lut(cmap), vmin, vmax), alpha)
+
+    def points(self, rows, cols, color, size=3, alpha=1.0, ring=0):
+        # square markers of `size` px centred on cells; ring>0 draws only a border that many px thick
+        rows = np.asarray(rows, dtype=np.int64); cols = np.asarray(cols, dtype=np.int64)
+        if len(rows) == 0: return
+        pix = self._pixels()
+        rgba = np.round(to_rgba(color)*255).astype(np.uint8)
+        off = np.arange(size) - size//2
+        dy, dx = np.meshgrid(off, off, indexing="ij")
+        if ring:
+            edge = (np.abs(dy) > size//2 - ring) | (np.abs(dx) > size//2 - ring)
+            dy, dx = dy[edge], dx[edge]
+        y = (rows*self.ch + self.ch//2)[:, None] + dy.ravel()[None, :]
+        x = (cols*self.cw + self.cw//2)[:, None] + dx.ravel()[None, :]
+        ok = (y >= 0) & (y < pix.shape[0]) & (x >= 0) & (x < pix.shape[1])
+        y, x = y[ok], x[ok]
+        px = pix[y, x]
+        blend_over(px, np.broadcast_to(rgba, px.shape), alpha_byte(alpha))
+        pix[y, x] = px
+
+    def to_uint8(self):
+        return self._pixels()
+
+    def save(self, path):
+        write_png(path, self.to_uint8())
+        return path
+
+# ---------- PNG ----------
+def _chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+
+def encode_png(rgba, level=6):
+    h, w = rgba.shape[:2]
+    comp = zlib.compressobj(level)
+    parts = []
+    for i in range(0, h, 1024):                                 # scanlines in blocks, filter byte 0
+        block = rgba[i:i+1024].reshape(-1, 4*w)
+        raw = np.zeros((len(block), 1 + 4*w), dtype=np.uint8)
+        raw[:, 1:] = block
+        parts.append(comp.compress(raw.tobytes()))
+    return (b"\x89PNG\r\n\x1a\n" + _chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 6, 0, 0, 0))
+            + _chunk(b"IDAT", b"".join(parts) + comp.flush()) + _chunk(b"IEND", b""))
+
+def write_png(path, rgba, level=6):
+    with open(path, "wb") as f:
+        f.write(encode_png(rgba, level))
+    return path
+
+def cell_px_for(rows, width, figsize=(16, 9), dpi=150, max_aspect=8):
+    # cell block size matching the data area of the matplotlib poster at this dpi (≥ 1 px); once rows
+    # outgrow the figure height, cells stay at most max_aspect times wider than tall
+    ch = max(1, round(figsize[1]*dpi*0.77 / rows))
+    return ch, max(1, min(round(figsize[0]*dpi*0.62 / width), max_aspect*ch))
@@ -0,0 +1,217 @@
+
+# Vendessimal Render — plotting layer of the toolkits (matplotlib posters + headless raster)
+# Usage: imported on first use by vendessimal_prime_toolkit.plot_extended / plot_raster (both copies);
+#        compute lives in vendessimal_core, which never imports matplotlib. pyplot is imported inside the
+#        matplotlib renderers, so --render raster only touches matplotlib's colormap tables.
+import math
+import numpy as np
+from vendessimal_core import (residue_grid, twin_primes_upto, euler_41_trace, grid_coords, grid_xy, triad_grid,
+                              rail_members)
+from vendessimal_layers import default_graph
+from prime_constellations import parse_pattern, pattern_name
+from prime_spf import FEATURED, factor_labels
+
+QUAD_COLORS = ['cyan', 'magenta', 'springgreen', 'tomato', 'deepskyblue', 'gold']
+
+def _twin_xy(g, N, W, twins, pattern=None):
+    # twins: sorted member array (twin_members); precomputed by sweeps / workers
+    # pattern: constellation drawn in place of the twin layer ("triplet", (0,4,6,10), …)
+    if pattern is not None: return g.get("constellation_xy", N=N, pattern=parse_pattern(pattern), width=W)
+    return g.get("twin_xy", N=N, width=W) if twins is None else grid_coords(twins, width=W)
+
+def plot_raster(N=3000, mod_pair=(19,29),
+                centers=(3,10,17), sigma=2.4, mode='gauss', delta=2.0,
+                rails_tau=0.55, twin_alpha=0.75,
+                outpath="vendessimal_extended.png",
+                twin_only=False, dpi=150, cell_px=None, twins=None, quadratics=(), layers=None, pattern=None,
+                triad_support=None, float32=False, auto_thresholds=False):
+    # headless twin of plot_extended: data area only (no axes, title or colorbar), linear in cells
+    from vendessimal_raster import Canvas, cell_px_for
+    g = layers or default_graph()
+    W=20
+    rows = N//W + (1 if N%W else 0)
+    cv = Canvas(rows, W, cell_px or cell_px_for(rows, W, (8,10) if twin_only else (16,9), dpi),
+                background='k' if twin_only else 'white')
+    marker = lambda s: max(1, round(math.sqrt(s)*dpi/72))        # scatter s (pt²) → square side in px
+    Y, X = _twin_xy(g, N, W, twins, pattern)
+    if twin_only:
+        cv.points(Y, X, '#ffee99', size=marker(10))
+        return cv.save(outpath or "vendessimal_twin_layer.png")
+
+    dt = "float32" if float32 else "float64"
+    cv.colormap(g.get("residue", N=N, mod_pair=mod_pair, width=W), 'viridis')
+    cv.colormap(g.get("triad", N=N, centers=centers, sigma=sigma, mode=mode, delta=delta, width=W,
+                      support=triad_support, dtype=dt), 'autumn', alpha=0.18)
+    cv.colormap(g.get("rails", N=N, tau=rails_tau, width=W, dtype=dt), 'cool', alpha=0.12)
+    cv.points(Y, X, 'yellow', size=marker(8), alpha=twin_alpha)
+    Ye, Xe = g.get("euler41", N=N, width=W)
+    cv.points(Ye, Xe, 'white', size=marker(14), ring=1)
+    for q, col in zip(quadratics, QUAD_COLORS*len(quadratics)):
+        Yq, Xq = g.get("quadratic", N=N, coeffs=q, width=W)
+        cv.points(Yq, Xq, col, size=marker(14), ring=1)
+    for r, c, col, _ in g.get("thresholds", N=N, width=W, mod_pair=tuple(mod_pair) if auto_thresholds else None):
+        cv.points([r], [c], col, size=marker(120), ring=2)
+    return cv.save(outpath or "vendessimal_extended.png")
+
+def plot_extended(N=3000, mod_pair=(19,29),
+                  centers=(3,10,17), sigma=2.4, mode='gauss', delta=2.0,
+                  rails_tau=0.55, twin_alpha=0.75,
+                  breath_sec=6, timeline=(7,9,12,17),
+                  outpath="vendessimal_extended.png",
+                  twin_only=False, threshold_inset=False, render='mpl', twins=None, quadratics=(), layers=None,
+                  pattern=None, triad_support=None, float32=False, auto_thresholds=False):
+    # each mode pulls only the layers it draws from the (memoized) layer graph
+    # triad_support=k: triad windows evaluated within k·σ only; float32: triad/rails layers in float32
+    # auto_thresholds: mark every detected threshold window for mod_pair instead of 1061–1064 (prime_spf)
+    if render == 'raster' and not threshold_inset:              # the inset is text-only: stays on matplotlib
+        return plot_raster(N=N, mod_pair=mod_pair, centers=centers, sigma=sigma, mode=mode, delta=delta,
+                           rails_tau=rails_tau, twin_alpha=twin_alpha, outpath=outpath, twin_only=twin_only,
+                           twins=twins, quadratics=quadratics, layers=layers, pattern=pattern,
+                           triad_support=triad_support, float32=float32, auto_thresholds=auto_thresholds)
+    import matplotlib.pyplot as plt
+    g = layers or default_graph()
+
+    W=20
+    rows = N//W + (1 if N%W else 0)
+
+    if threshold_inset:
+        # Minimal inset image focusing 1061–1064 numbers in a small canvas (no grid layers)
+        fig = plt.figure(figsize=(6,3), dpi=150)
+        ax = plt.gca()
+        for i,val in enumerate([1061,1062,1063,1064]):
+            ax.text(i+1, 1, str(val), fontsize=20, fontweight='bold',
+                    color=('lime' if val==1061 else 'orange' if val==1063 else 'red' if val==1064 else 'w'))
+        ax.set_xlim(0.5, 4.5); ax.set_ylim(0.5, 1.5)
+        ax.axis('off')
+        ax.set_title(f"Prime‑Schwelle: 1061 | 1062 | 1063 (prime) | 1064 = {factor_labels([FEATURED[1]])[0]}")
+        outpath = outpath if outpath else "prime_threshold_1061_1064.png"
+        plt.tight_layout()
+        plt.savefig(outpath, bbox_inches='tight')
+        return outpath
+
+    Y, X = _twin_xy(g, N, W, twins, pattern)
+
+    if twin_only:
+        # black background with only twins (sieve + twin scatter, nothing else)
+        fig = plt.figure(figsize=(8,10), dpi=150)
+        ax = plt.gca()
+        ax.set_facecolor('k')
+        ax.scatter(X, Y, s=10, c='#ffee99', alpha=1.0, marker='s')
+        ax.set_xlim(-1, W)
+        ax.set_ylim(rows, -1)
+        layer = "Twin Primes" if pattern is None else f"{pattern_name(pattern).capitalize()} Constellation"
+        ax.set_title(f"Vendessimal Prime Grid — {layer} Overlay (≤{N})")
+        ax.set_xlabel("Column (1–20)"); ax.set_ylabel("Row (step of 20)")
+        outpath = outpath if outpath else "vendessimal_twin_layer.png"
+        plt.tight_layout()
+        plt.savefig(outpath, bbox_inches='tight')
+        return outpath
+
+    # Base data: residue index combining mod 19/29 for color
+    idx = g.get("residue", N=N, mod_pair=mod_pair, width=W)
+
+    fig = plt.figure(figsize=(16,9), dpi=150)
+    ax = plt.gca()
+    im = ax.imshow(idx, cmap='viridis', aspect='auto', interpolation='nearest')
+    ax.set_xlabel("Column (×20)"); ax.set_ylabel("Row")
+    cb = plt.colorbar(im, ax=ax)
+    cb.set_label("Residue index (mod 19 / mod 29)")
+
+    # Triad overlay
+    dt = "float32" if float32 else "float64"
+    tmask = g.get("triad", N=N, centers=centers, sigma=sigma, mode=mode, delta=delta, width=W,
+                  support=triad_support, dtype=dt)
+    ax.imshow(tmask, cmap='autumn', alpha=0.18, aspect='auto', interpolation='nearest')
+
+    # Rails overlay
+    rmask = g.get("rails", N=N, tau=rails_tau, width=W, dtype=dt)
+    ax.imshow(rmask, cmap='cool', alpha=0.12, aspect='auto', interpolation='nearest')
+
+    # Twins
+    ax.scatter(X, Y, s=8, c='yellow', alpha=twin_alpha, marker='s', edgecolor='k', linewidths=0.2)
+
+    # Euler-41
+    Ye, Xe = g.get("euler41", N=N, width=W)
+    if len(Ye):
+        ax.scatter(Xe, Ye, s=14, facecolors='none', edgecolors='white', linewidths=0.8, label='Euler(n^2+n+41)')
+
+    # Further quadratics a·n²+b·n+c (same trace style, one colour each)
+    for (a, b, c), col in zip(quadratics, QUAD_COLORS*len(quadratics)):
+        Yq, Xq = g.get("quadratic", N=N, coeffs=(a, b, c), width=W)
+        ax.scatter(Xq, Yq, s=14, facecolors='none', edgecolors=col, linewidths=0.8, label=f'{a}n^2{b:+d}n{c:+d}')
+
+    # 1061–1064 (or every detected window)
+    for r, c, col, lab in g.get("thresholds", N=N, width=W, mod_pair=tuple(mod_pair) if auto_thresholds else None):
+        ax.scatter([c],[r], s=120, facecolors='none', edgecolors=col, linewidths=1.8)
+        ax.text(c+0.25, r-0.25, lab, color=col, fontsize=8, ha='left', va='bottom')
+
+    title = f"Vendessimal Prime Grid (1…{N}) — triad σ={sigma}, rails τ={rails_tau} | timeline {timeline} × {breath_sec}s"
+    ax.set_title(title)
+
+    plt.tight_layout()
+    if not outpath: outpath = "vendessimal_extended.png"
+    plt.savefig(outpath, bbox_inches='tight')
+    return outpath
+
+def plot_width_sweep(N=3000, widths=(19,20,29,30,38), mod_pair=(19,29), outpath="vendessimal_widths.png",
+                     layers=None):
+    # side-by-side layouts of one sieve: primes in class colour per width, column densities underneath
+    import matplotlib.pyplot as plt
+    g = layers or default_graph()
+    gv = g.get("grid_views", N=N, max_width=max(widths), mod_pair=mod_pair)
+    dens = gv.column_density(widths)
+    ncls = mod_pair[0]*mod_pair[1]
+    fig, axes = plt.subplots(2, len(widths), figsize=(3.2*len(widths), 10), dpi=150, squeeze=False,
+                             gridspec_kw=dict(height_ratios=[4, 1]))
+    for k, w in enumerate(widths):
+        ax, bx = axes[0, k], axes[1, k]
+        ax.set_facecolor('k')
+        img = np.ma.masked_where(~gv.view("primes", w), gv.view("classes", w))
+        ax.imshow(img, cmap='viridis', vmin=0, vmax=ncls-1, aspect='auto', interpolation='nearest')
+        ax.set_title(f"width {w}"); ax.set_xlabel("Column")
+        if k == 0: ax.set_ylabel("Row")
+        bx.bar(np.arange(w), dens[w], color='#3b7dd8', width=0.9)
+        bx.set_xlim(-0.5, w-0.5); bx.set_xlabel("Column")
+        if k == 0: bx.set_ylabel("prime density")
+    fig.suptitle(f"Vendessimal Prime Grid (1…{N}) — width sweep {tuple(widths)}, classes mod {mod_pair[0]}/{mod_pair[1]}")
+    plt.tight_layout()
+    plt.savefig(outpath, bbox_inches='tight')
+    return outpath
+
+def plot_overlays(N=3000, width=20, mod_pair=(19,29),
+                  triad_cfg=dict(centers=(3.5,10,16.5), sigma=2.2, delta=2.0, mode='gauss'),
+                  rails_tau=0.55,
+                  outpath="vendessimal_extended.png"):
+    # the prime_suite_bundle poster (vendessimal_prime_toolkit.plot_extended of the bundle copy)
+    import matplotlib.pyplot as plt
+    rows=(N+width-1)//width
+    A=residue_grid(rows*width, width, mod_pair, major=1)
+    M=triad_grid(rows,width,**triad_cfg)
+    fig=plt.figure(figsize=(14,8)); ax=plt.gca()
+    img=ax.imshow(A, cmap='viridis', origin='upper', interpolation='nearest', aspect='auto')
+    ax.imshow(np.ones_like(M), cmap='gray', alpha=1-M*0.65, origin='upper', interpolation='nearest', aspect='auto')
+    # overlays
+    ys,xs=grid_xy(twin_primes_upto(N).to_array(),width)
+    ax.scatter(xs, ys, s=10, marker='s', edgecolor='gold', facecolor='none', linewidths=0.8, label='twin primes')
+    rails2=rail_members(rows,width, math.sqrt(2), [0,5,10,15], tau=rails_tau)
+    rails5=rail_members(rows,width, math.sqrt(5), [0,5,10,15], tau=rails_tau)
+    for nset,col in [(rails2,'white'), (rails5,'orange')]:
+        ys,xs=grid_xy(nset[nset<=N],width)
+        ax.scatter(xs, ys, s=4, color=col, alpha=0.8, label=f'rail {"√2" if col=="white" else "√5"}')
+    e41=euler_41_trace(N)
+    xs=[]; ys=[]
+    for v in e41:
+        r,c=grid_xy(v,width); xs.append(c); ys.append(r)
+    ax.scatter(xs, ys, s=24, marker='P', color='#ffdd55', edgecolor='black', linewidths=0.3, label='Euler n²+n+41')
+    # 1061/1063/1064
+    for value, txt, col in [(1061,'1061 (prime)','lime'), (1063,'1063 (prime)','lime'),
+                            (1064,f'1064 = {factor_labels([FEATURED[1]])[0]}','red')]:
+        r,c=grid_xy(value,width); ax.scatter([c],[r], s=100, marker='o', color='none', edgecolor=col, linewidths=2.0)
+        ax.text(c+0.3, r-0.3, txt, color=col, fontsize=8, weight='bold')
+    ax.set_title(f"Vendessimal Prime Grid (1…{N}) — extended overlays")
+    ax.set_xlabel("Column (×20)"); ax.set_ylabel("Row")
+    ax.set_xlim(-0.5, width-0.5); ax.set_ylim(rows-0.5, -0.5)
+    ax.grid(True, color='w', alpha=0.15, ls=':', lw=0.5)
+    cbar=plt.colorbar(img, ax=ax, fraction=0.025, pad=0.02); cbar.set_label("Residue index")
+    ax.legend(loc='upper right', fontsize=8, framealpha=0.85)
+    plt.tight_layout(); fig.savefig(outpath, dpi=180); plt.close(fig); return outpath
@@ -0,0 +1,144 @@
+
+# Vendessimal Stats — how primes spread over the mod-pair class lattice (n % m0, n % m1), streamed
+# Usage: python3 vendessimal_prime_toolkit.py stats --N 1e9 --workers 8 --out stats_19_29
+#        python3 vendessimal_prime_toolkit.py stats --N 1e11 --mod-pair 7 11 --checkpoints 4 --out stats_7_11
+#
+# Primes stream segment by segment from prime_cache (or the sieve); each prime's class index
+# (p % m0)·m1 + p % m1 goes through a residue → class table as uint16 and is counted with bincount, so
+# memory is O(m0·m1) whatever N is. [0, N] is cut into aligned chunks handled by a process pool; every
+# chunk also reports its counts at the log-spaced checkpoints it contains, and the parent prefix-sums
+# them into running-convergence curves. Dirichlet: primes not dividing m0·m1 fill the φ(m0)·φ(m1)
+# coprime classes equally, so chi-square is taken over those classes (z = (obs − exp)/√exp per class).
+# Output directory: classes.csv, convergence.csv, heatmap.png (z per class, m0 rows × m1 columns).
+import argparse, math, os, sys, time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import prime_cache
+
+# ---------- class lattice ----------
+def class_table(mod_pair):
+    # uint16 class index of every residue mod lcm(m0, m1)
+    m0, m1 = mod_pair
+    if m0*m1 > 1 << 16: raise ValueError("m0·m1 must fit uint16 class indices")
+    r = np.arange(math.lcm(m0, m1))
+    return ((r % m0)*m1 + r % m1).astype(np.uint16)
+
+def coprime_classes(mod_pair):
+    m0, m1 = mod_pair
+    c = np.arange(m0*m1)
+    g = np.gcd(c // m1, m0) == 1
+    return g & (np.gcd(c % m1, m1) == 1)
+
+def count_classes(lo, hi, mod_pair, checkpoints=(), cache=None):
+    # class counts of the primes in [lo, hi) and at each checkpoint in (lo, hi] (counts of [lo, cp])
+    if cache: prime_cache.set_default_cache(cache)
+    table, L, ncls = class_table(mod_pair), math.lcm(*mod_pair), mod_pair[0]*mod_pair[1]
+    counts = np.zeros(ncls, dtype=np.int64)
+    cps, snaps = sorted(checkpoints), []
+    for ps in prime_cache.iter_primes(lo, hi):
+        cls = table[ps % L]
+        while cps and cps[0] <= ps[-1]:
+            cut = np.searchsorted(ps, cps[0], side="right")
+            snaps.append((cps.pop(0), counts + np.bincount(cls[:cut], minlength=ncls)))
+        counts += np.bincount(cls, minlength=ncls)
+    snaps += [(cp, counts.copy()) for cp in cps]              # checkpoints past the last prime of the chunk
+    return counts, snaps
+
+# ---------- statistics ----------
+def chi_square(counts, mod_pair):
+    # over the coprime classes: (chi², dof, z per class (NaN elsewhere))
+    live = coprime_classes(mod_pair)
+    obs = counts[live].astype(np.float64)
+    exp = obs.sum()/max(live.sum(), 1)
+    z = np.full(len(counts), np.nan)
+    if exp > 0: z[live] = (obs - exp)/math.sqrt(exp)
+    return (float(np.nansum(z**2)) if exp > 0 else 0.0), int(live.sum()) - 1, z
+
+def max_abs(z):
+    return float(np.nanmax(np.abs(z))) if np.isfinite(z).any() else 0.0
+
+def log_checkpoints(N, per_decade=10, start=1000):
+    k = np.arange(math.ceil(per_decade*math.log10(start)), math.floor(per_decade*math.log10(N)) + 1)
+    cps = np.unique(np.round(10.0**(k/per_decade)).astype(np.int64))
+    return sorted(set(cps[(cps >= start) & (cps < N)].tolist()) | {int(N)})
+
+def run_stats(N, mod_pair=(19,29), workers=None, chunks=None, per_decade=10, cache=None, log=sys.stdout):
+    N = int(N)
+    workers = workers or os.cpu_count() or 1
+    nchunks = chunks or (1 if N < 10**7 else 4*workers)
+    edges = sorted({0, N + 1} | {(N + 1)*i//nchunks//30*30 for i in range(1, nchunks)})
+    cps = log_checkpoints(N, per_decade)
+    jobs = [(lo, hi, [c for c in cps if lo < c + 1 <= hi]) for lo, hi in zip(edges[:-1], edges[1:])]
+    t0 = time.perf_counter()
+    if workers == 1 or len(jobs) == 1:
+        parts = [count_classes(lo, hi, mod_pair, c) for lo, hi, c in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futs = [pool.submit(count_classes, lo, hi, mod_pair, c, cache) for lo, hi, c in jobs]
+            parts = []
+            for i, f in enumerate(futs, 1):
+                parts.append(f.result())
+                print(f"[{i}/{len(jobs)}] ≤ {jobs[i-1][1] - 1}", file=log, flush=True)
+    total, curve = np.zeros(mod_pair[0]*mod_pair[1], dtype=np.int64), []
+    for counts, snaps in parts:                               # chunks are in order: prefix sums
+        for cp, c in snaps:
+            chi2, dof, z = chi_square(total + c, mod_pair)
+            curve.append(dict(N=cp, primes=int((total + c).sum()), chi2=chi2, dof=dof,
+                              chi2_per_dof=chi2/max(dof, 1), max_abs_z=max_abs(z)))
+        total += counts
+    chi2, dof, z = chi_square(total, mod_pair)
+    return dict(N=N, mod_pair=tuple(mod_pair), counts=total, chi2=chi2, dof=dof, z=z, curve=curve,
+                seconds=time.perf_counter() - t0)
+
+# ---------- output ----------
+def write_classes_csv(path, res):
+    m0, m1 = res["mod_pair"]
+    live = coprime_classes(res["mod_pair"])
+    exp = res["counts"][live].sum()/max(live.sum(), 1)
+    with open(path, "w") as f:
+        f.write(f"class,mod_{m0},mod_{m1},count,expected,z\n")
+        for c, (n, z) in enumerate(zip(res["counts"].tolist(), res["z"].tolist())):
+            e = exp if live[c] else 0.0
+            f.write(f"{c},{c // m1},{c % m1},{n},{e:.3f},{'' if math.isnan(z) else f'{z:.4f}'}\n")
+    return path
+
+def write_convergence_csv(path, res):
+    with open(path, "w") as f:
+        f.write("N,primes,chi2,dof,chi2_per_dof,max_abs_z\n")
+        for r in res["curve"]:
+            f.write(f"{r['N']},{r['primes']},{r['chi2']:.4f},{r['dof']},{r['chi2_per_dof']:.6f},{r['max_abs_z']:.4f}\n")
+    return path
+
+def write_heatmap(path, res, cell_px=12, zmax=None):
+    # m0 × m1 z-score lattice, symmetric diverging colours; non-coprime classes dark
+    from vendessimal_raster import apply_lut, colormap_lut, write_png
+    m0, m1 = res["mod_pair"]
+    z = res["z"].reshape(m0, m1)
+    zmax = zmax or max(max_abs(z), 1e-9)
+    rgba = apply_lut(np.nan_to_num(np.clip(z, -zmax, zmax)), colormap_lut("coolwarm"), -zmax, zmax)
+    rgba[np.isnan(z)] = (24, 24, 24, 255)
+    return write_png(path, np.repeat(np.repeat(rgba, cell_px, axis=0), cell_px, axis=1))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py stats")
+    ap.add_argument("--N", type=lambda s: int(float(s)), default=10**7, help="upper bound (accepts 1e11)")
+    ap.add_argument("--mod-pair", nargs=2, type=int, default=[19,29])
+    ap.add_argument("--workers", type=int, default=None, help="default: os.cpu_count()")
+    ap.add_argument("--chunks", type=int, default=None, help="range chunks (default: 4 per worker)")
+    ap.add_argument("--checkpoints", type=int, default=10, help="convergence checkpoints per decade")
+    ap.add_argument("--out", type=str, default=None, help="output dir (default: stats_<m0>_<m1>)")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    if args.cache: prime_cache.set_default_cache(args.cache)
+    mod_pair = tuple(args.mod_pair)
+    res = run_stats(args.N, mod_pair, args.workers, args.chunks, args.checkpoints, args.cache)
+    out = args.out or f"stats_{mod_pair[0]}_{mod_pair[1]}"
+    os.makedirs(out, exist_ok=True)
+    write_classes_csv(os.path.join(out, "classes.csv"), res)
+    write_convergence_csv(os.path.join(out, "convergence.csv"), res)
+    write_heatmap(os.path.join(out, "heatmap.png"), res)
+    zmax = max_abs(res["z"])
+    print(f"N={res['N']} primes={int(res['counts'].sum())} classes={mod_pair[0]*mod_pair[1]} "
+          f"chi2={res['chi2']:.1f} dof={res['dof']} (chi2/dof={res['chi2']/max(res['dof'], 1):.3f}) "
+          f"max|z|={zmax:.2f}  [{res['seconds']:.1f}s] → {out}/")
+    return res
@@ -0,0 +1,108 @@
+
+# Vendessimal Sweep — render a parameter grid of plot_extended variants on a process pool
+# Usage: python3 vendessimal_prime_toolkit.py sweep --N 100000 --outdir sweep \
+#            --grid '{"mod_pair": [[19,29],[7,11]], "sigma": [1.8,2.4], "rails_tau": [0.3,0.55], "mode": ["gauss","hard"]}'
+#        (--grid also takes a path to a JSON file)
+#
+# Twin primes are sieved once in the parent and published through shared memory; every worker imports
+# matplotlib once and renders many jobs. Progress goes to stdout, outputs are listed in manifest.json.
+import argparse, itertools, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import numpy as np
+
+SWEEP_KEYS = ("mod_pair", "centers", "sigma", "mode", "delta", "rails_tau", "twin_alpha",
+              "breath_sec", "timeline", "twin_only")
+
+def expand_grid(grid):
+    # {"sigma": [1.8, 2.4], "mode": "hard", ...} → list of job dicts (cartesian product, scalars fixed)
+    unknown = set(grid) - set(SWEEP_KEYS)
+    if unknown: raise ValueError(f"unknown sweep keys: {sorted(unknown)}")
+    keys = sorted(grid)
+    axes = [v if isinstance(v, list) else [v] for v in (grid[k] for k in keys)]
+    jobs = []
+    for combo in itertools.product(*axes):
+        job = dict(zip(keys, combo))
+        for k in ("mod_pair", "centers", "timeline"):
+            if k in job: job[k] = tuple(job[k])
+        jobs.append(job)
+    return jobs
+
+def job_name(job):
+    parts = []
+    for k in sorted(job):
+        v = job[k]
+        v = "-".join(f"{x:g}" for x in v) if isinstance(v, tuple) else f"{v:g}" if isinstance(v, float) else str(v)
+        parts.append(f"{k}{v}")
+    return "_".join(parts) or "default"
+
+# ---------- workers ----------
+_twins = _shm = None
+
+def _attach(name, n):
+    global _twins, _shm
+    try:
+        _shm = shared_memory.SharedMemory(name=name, track=False)       # Python ≥ 3.13
+    except TypeError:
+        _shm = shared_memory.SharedMemory(name=name)                    # workers share the parent's tracker
+    _twins = np.ndarray((n,), dtype=np.int64, buffer=_shm.buf)
+
+def _init(name, n, cache):
+    import matplotlib; matplotlib.use("Agg")
+    if cache:
+        import prime_cache; prime_cache.set_default_cache(cache)
+    _attach(name, n)
+
+def _render(N, job, outpath, render):
+    import vendessimal_prime_toolkit as vpt
+    import matplotlib.pyplot as plt
+    t0 = time.perf_counter()
+    vpt.plot_extended(N=N, outpath=outpath, render=render, twins=_twins, **job)
+    plt.close("all")
+    return time.perf_counter() - t0
+
+# ---------- driver ----------
+def run_sweep(N, jobs, outdir, workers=None, render="mpl", cache=None, log=sys.stdout):
+    import vendessimal_prime_toolkit as vpt
+    os.makedirs(outdir, exist_ok=True)
+    twins = vpt.twin_members(N)
+    shm = shared_memory.SharedMemory(create=True, size=max(twins.nbytes, 1))
+    try:
+        np.ndarray(twins.shape, dtype=np.int64, buffer=shm.buf)[:] = twins
+        manifest, t0 = [], time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init,
+                                 initargs=(shm.name, len(twins), cache)) as pool:
+            futs = {}
+            for job in jobs:
+                out = os.path.join(outdir, job_name(job) + ".png")
+                futs[pool.submit(_render, N, job, out, render)] = (job, out)
+            for i, fut in enumerate(as_completed(futs), 1):
+                job, out = futs[fut]
+                sec = fut.result()
+                manifest.append(dict(params={k: list(v) if isinstance(v, tuple) else v for k, v in job.items()},
+                                     N=N, render=render, out=out, seconds=round(sec, 3)))
+                print(f"[{i}/{len(jobs)}] {out} ({sec:.2f}s)", file=log, flush=True)
+        manifest.sort(key=lambda m: m["out"])
+        path = os.path.join(outdir, "manifest.json")
+        with open(path, "w") as f:
+            json.dump(dict(N=N, jobs=len(jobs), wall_seconds=round(time.perf_counter() - t0, 3),
+                           outputs=manifest), f, indent=2)
+        return path
+    finally:
+        shm.close(); shm.unlink()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py sweep")
+    ap.add_argument("--N", type=int, default=3000)
+    ap.add_argument("--grid", type=str, required=True, help="JSON object (or path to one) of parameter lists")
+    ap.add_argument("--outdir", type=str, default="sweep")
+    ap.add_argument("--workers", type=int, default=None, help="default: os.cpu_count()")
+    ap.add_argument("--render", choices=["mpl","raster"], default="mpl")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    grid = json.load(open(args.grid)) if os.path.exists(args.grid) else json.loads(args.grid)
+    if args.cache:
+        import prime_cache; prime_cache.set_default_cache(args.cache)
+    path = run_sweep(args.N, expand_grid(grid), args.outdir, args.workers, args.render, args.cache)
+    print(path)
+    return path
@@ -0,0 +1,219 @@
+
+# Vendessimal Tiles — lazy multi-resolution tile pyramid (DeepZoom or XYZ) of the vendessimal grid
+# Usage: python3 vendessimal_prime_toolkit.py tiles --N 1e9 --serve 8000            # browse, tiles on demand
+#        python3 vendessimal_prime_toolkit.py tiles --N 1e6 --outdir pyr --layout xyz  # static pyramid
+#
+# The full-resolution image draws every cell as cell_px × cell_px pixels: primes in their mod-pair class
+# colour, composites dark. Each coarser level halves both axes; once a pixel covers several cells it shows
+# aggregated statistics instead — brightness = prime density relative to 1/ln n, colour = mean residue class
+# of the primes in the block. A fine tile only sieves the number range it covers (prime_cache / prime_sieve,
+# streamed in chunks); levels with ≥ BASE cells per pixel add up per-(BASE×BASE cell) block counts instead,
+# which are sieved once per band of rows and kept, so the sieve covers each range once for all coarse
+# levels. Rendered tiles are kept in an LRU of hot tiles (shared by the server threads under a lock).
+import argparse, math, os, threading
+from collections import OrderedDict
+import numpy as np
+import prime_cache
+from vendessimal_raster import colormap_lut, encode_png
+
+TILE = 256
+BASE = 64                        # cells per side of a cached count block (coarse levels sum these)
+BAND = 1024                      # block rows sieved (and cached) together
+
+class TilePyramid:
+    def __init__(self, N, width=20, mod_pair=(19,29), cell_px=4, tile=TILE, cmap="viridis", lru_tiles=512):
+        if cell_px & (cell_px - 1): raise ValueError("cell_px must be a power of two")
+        self.N, self.W, self.mod_pair = int(N), width, mod_pair
+        self.R = -(-self.N // width)
+        self.cp, self.T = cell_px, tile
+        self.full_h, self.full_w = self.R*cell_px, width*cell_px
+        self.max_level = math.ceil(math.log2(max(self.full_h, self.full_w, 1)))      # DeepZoom numbering
+        self.max_zoom = max(0, math.ceil(math.log2(max(self.full_h, self.full_w) / tile)))  # XYZ numbering
+        self.lut = colormap_lut(cmap)
+        self.lru = OrderedDict(); self.lru_tiles = lru_tiles
+        self.bands = {}                                   # band → (primes, class sums) per BASE×BASE block
+        self.lock = threading.Lock()
+
+    # ---------- geometry ----------
+    def level_size(self, f):
+        # (height, width) in pixels at downscale factor f (power of two)
+        return -(-self.full_h // f), -(-self.full_w // f)
+
+    def tiles_at(self, f):
+        h, w = self.level_size(f)
+        return -(-h // self.T), -(-w // self.T)
+
+    def dz_factor(self, level): return 1 << (self.max_level - level)
+    def xyz_factor(self, z): return 1 << (self.max_zoom - z)
+
+    # ---------- statistics ----------
+    def _sieve_counts(self, r0, r1, g):
+        # (prime count, sum of prime class indices) per g×g cell block of rows [r0, r1), from the sieve
+        ny, nx = -(-(r1 - r0) // g), -(-self.W // g)
+        lo, hi = r0*self.W + 1, min(r1*self.W, self.N) + 1
+        primes = np.zeros(ny*nx, dtype=np.int64); csum = np.zeros(ny*nx, dtype=np.float64)
+        m0, m1 = self.mod_pair
+        for ps in prime_cache.iter_primes(lo, hi):
+            row, col = np.divmod(ps - 1, self.W)
+            k = ((row - r0)//g)*nx + col//g
+            primes += np.bincount(k, minlength=ny*nx)
+            csum += np.bincount(k, weights=(ps % m0)*m1 + ps % m1, minlength=ny*nx)
+        return primes.reshape(ny, nx), csum.reshape(ny, nx)
+
+    def _base_counts(self, b0, b1):
+        # BASE×BASE block counts of block rows [b0, b1), sieved once per BAND and kept
+        parts = []
+        for band in range(b0 // BAND, -(-b1 // BAND)):
+            with self.lock:
+                counts = self.bands.get(band)
+            if counts is None:
+                counts = self._sieve_counts(band*BAND*BASE, min((band + 1)*BAND*BASE, self.R), BASE)
+                with self.lock: self.bands[band] = counts
+            parts.append(counts)
+        off = b0 - (b0 // BAND)*BAND
+        return tuple(np.concatenate(a)[off:off + b1 - b0] for a in zip(*parts))
+
+    def _pooled_counts(self, r0, r1, g):
+        # g ≥ BASE (both powers of two, r0 a multiple of g): sum k×k groups of the cached base blocks
+        k = g // BASE
+        return tuple(np.add.reduceat(np.add.reduceat(a, np.arange(0, a.shape[0], k), axis=0),
+                                     np.arange(0, a.shape[1], k), axis=1)
+                     for a in self._base_counts(r0 // BASE, -(-r1 // BASE)))
+
+    def _block_stats(self, r0, r1, g):
+        # per (g×g cell block) of rows [r0, r1): cells ≤ N, prime count, sum of prime class indices
+        ny, nx = -(-(r1 - r0) // g), -(-self.W // g)
+        primes, csum = self._pooled_counts(r0, r1, g) if g >= BASE else self._sieve_counts(r0, r1, g)
+        by0 = r0 + np.arange(ny)*g; by1 = np.minimum(by0 + g, r1)
+        bx0 = np.arange(nx)*g;      bx1 = np.minimum(bx0 + g, self.W)
+        cells = (by1 - by0)[:, None]*(bx1 - bx0)[None, :]
+        last = self.N - (self.R - 1)*self.W                                     # cells in the (short) last row
+        short = (by0 <= self.R - 1) & (self.R - 1 < by1)
+        cells -= short[:, None]*np.maximum(bx1 - np.maximum(bx0, last), 0)[None, :]
+        center = (np.arange(ny)[:, None]*g + r0 + g/2)*self.W + np.arange(nx)[None, :]*g
+        return cells, primes, csum, np.maximum(center, 3.0)
+
+    def _colour(self, cells, primes, csum, center, g):
+        ncls = self.mod_pair[0]*self.mod_pair[1]
+        rgba = np.zeros(cells.shape + (4,), dtype=np.uint8)
+        mean_cls = np.divide(csum, primes, out=np.zeros_like(csum), where=primes > 0)
+        hue = self.lut[np.clip((mean_cls/max(ncls - 1, 1)*len(self.lut)).astype(np.int64), 0, len(self.lut) - 1)]
+        if g == 1:
+            rgba[:] = (24, 24, 24, 255)                                           # composite
+            rgba[primes > 0] = hue[primes > 0]
+        else:
+            rel = primes/np.maximum(cells, 1)*np.log(center)                     # ≈ 1 on average (PNT)
+            shade = np.clip(rel/2, 0, 1)[..., None]
+            rgba[..., :3] = (hue[..., :3]*shade).astype(np.uint8)
+            rgba[..., 3] = 255
+        rgba[cells == 0] = 0
+        return rgba
+
+    # ---------- tiles ----------
+    def tile_rgba(self, f, x, y):
+        key = (f, x, y)
+        with self.lock:
+            if key in self.lru:
+                self.lru.move_to_end(key); return self.lru[key]
+        h, w = self.level_size(f)
+        py0, py1 = y*self.T, min((y + 1)*self.T, h)
+        px0, px1 = x*self.T, min((x + 1)*self.T, w)
+        if py0 >= py1 or px0 >= px1: raise IndexError(f"tile {x},{y} outside level f={f}")
+        g, u = max(f // self.cp, 1), max(self.cp // f, 1)     # cells per stat pixel, pixels per stat pixel
+        sy0, sy1 = py0 // u, -(-py1 // u)
+        r0, r1 = sy0*g, min(sy1*g, self.R)
+        stats = self._block_stats(r0, r1, g)
+        img = self._colour(*stats, g)
+        img = np.repeat(np.repeat(img, u, axis=0), u, axis=1)
+        img = img[py0 - sy0*u:py1 - sy0*u, px0:px1]
+        with self.lock:
+            self.lru[key] = img
+            if len(self.lru) > self.lru_tiles: self.lru.popitem(last=False)
+        return img
+
+    def tile_png(self, f, x, y, pad=False):
+        img = self.tile_rgba(f, x, y)
+        if pad and img.shape[:2] != (self.T, self.T):                             # XYZ wants full tiles
+            full = np.zeros((self.T, self.T, 4), dtype=np.uint8)
+            full[:img.shape[0], :img.shape[1]] = img
+            img = full
+        return encode_png(img)
+
+    def dzi_xml(self):
+        return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" Format="png" Overlap="0" '
+                f'TileSize="{self.T}">\n  <Size Width="{self.full_w}" Height="{self.full_h}"/>\n</Image>\n')
+
+    # ---------- output ----------
+    def write(self, outdir, layout="dz", name="vendessimal", max_level=None):
+        # static pyramid; max_level caps the finest DZ level / XYZ zoom written
+        os.makedirs(outdir, exist_ok=True)
+        count = 0
+        if layout == "dz":
+            with open(os.path.join(outdir, name + ".dzi"), "w") as f: f.write(self.dzi_xml())
+            top = self.max_level if max_level is None else min(max_level, self.max_level)
+            for level in range(top + 1):
+                f = self.dz_factor(level)
+                d = os.path.join(outdir, f"{name}_files", str(level)); os.makedirs(d, exist_ok=True)
+                ty, tx = self.tiles_at(f)
+                for y in range(ty):
+                    for x in range(tx):
+                        with open(os.path.join(d, f"{x}_{y}.png"), "wb") as fh: fh.write(self.tile_png(f, x, y))
+                        count += 1
+        else:
+            top = self.max_zoom if max_level is None else min(max_level, self.max_zoom)
+            for z in range(top + 1):
+                f = self.xyz_factor(z)
+                ty, tx = self.tiles_at(f)
+                for x in range(tx):
+                    d = os.path.join(outdir, str(z), str(x)); os.makedirs(d, exist_ok=True)
+                    for y in range(ty):
+                        with open(os.path.join(d, f"{y}.png"), "wb") as fh: fh.write(self.tile_png(f, x, y, pad=True))
+                        count += 1
+        return count
+
+    def serve(self, port=8000, name="vendessimal"):
+        # lazy tile server: /<name>.dzi, /<name>_files/<level>/<x>_<y>.png, /<z>/<x>/<y>.png
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        pyr = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = self.path.strip("/").split("/")
+                try:
+                    if parts == [name + ".dzi"]:
+                        body, ctype = pyr.dzi_xml().encode(), "application/xml"
+                    elif len(parts) == 3 and parts[0] == f"{name}_files":
+                        x, y = map(int, parts[2][:-4].split("_"))
+                        body, ctype = pyr.tile_png(pyr.dz_factor(int(parts[1])), x, y), "image/png"
+                    elif len(parts) == 3 and parts[2].endswith(".png"):
+                        z, x, y = int(parts[0]), int(parts[1]), int(parts[2][:-4])
+                        body, ctype = pyr.tile_png(pyr.xyz_factor(z), x, y, pad=True), "image/png"
+                    else:
+                        raise IndexError(self.path)
+                except (IndexError, ValueError):
+                    self.send_error(404); return
+                self.send_response(200)
+                self.send_header("Content-Type", ctype); self.send_header("Content-Length", str(len(body)))
+                self.end_headers(); self.wfile.write(body)
+        srv = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        print(f"serving http://127.0.0.1:{port}/{name}.dzi (max DZ level {self.max_level})")
+        srv.serve_forever()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py tiles")
+    ap.add_argument("--N", type=lambda s: int(float(s)), default=3000, help="upper bound (accepts 1e9)")
+    ap.add_argument("--width", type=int, default=20)
+    ap.add_argument("--mod-pair", nargs=2, type=int, default=[19,29])
+    ap.add_argument("--cell-px", type=int, default=4)
+    ap.add_argument("--layout", choices=["dz","xyz"], default="dz")
+    ap.add_argument("--outdir", type=str, default=None, help="write a static pyramid here")
+    ap.add_argument("--max-level", type=int, default=None, help="finest level to write (DZ level / XYZ zoom)")
+    ap.add_argument("--serve", type=int, default=None, metavar="PORT", help="serve tiles lazily over HTTP")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    if args.cache: prime_cache.set_default_cache(args.cache)
+    pyr = TilePyramid(args.N, args.width, tuple(args.mod_pair), args.cell_px)
+    if args.serve is not None:
+        return pyr.serve(args.serve)
+    n = pyr.write(args.outdir or "vendessimal_tiles", args.layout, max_level=args.max_level)
+    print(f"{args.outdir or 'vendessimal_tiles'}: {n} tiles")
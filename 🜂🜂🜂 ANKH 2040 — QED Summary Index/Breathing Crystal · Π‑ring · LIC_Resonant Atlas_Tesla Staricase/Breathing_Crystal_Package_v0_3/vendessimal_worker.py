@@ -0,0 +1,108 @@
+
+# Vendessimal Worker — long-lived render worker fed newline-delimited JSON jobs on stdin
+# Usage: python3 vendessimal_prime_toolkit.py worker --workers 4 < jobs.ndjson > results.ndjson
+#        echo '{"N": 5000, "twin_only": true, "out": "tw.png"}' | python3 vendessimal_prime_toolkit.py worker
+#
+# A job mirrors the poster options: keys are the long flags with '_' or '-' ("mod_pair": [7, 11],
+# "rails_tau": 0.3, "twin_only": true, "quadratic": [[1, -79, 1601]], "widths": [19, 20, 29]) and go
+# through the same argparse parser as the command line; {"argv": [...]} passes raw arguments; "id" is
+# echoed back. Workers import matplotlib once, warm Agg and the font cache with a throwaway figure and keep
+# their layer graph (sieve, twins, grids …) and the prime cache between jobs. One JSON line per finished
+# job goes to stdout: {"id", "out", "seconds", "ok"} or {"id", "ok": false, "error"}; with several
+# workers lines arrive in completion order.
+import argparse, contextlib, io, json, sys, threading, time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# ---------- job → argv ----------
+def job_argv(job):
+    if "argv" in job: return [str(a) for a in job["argv"]]
+    argv = []
+    for key, val in job.items():
+        if key == "id" or val is None or val is False: continue
+        flag = "--" + key.replace("_", "-")
+        if val is True: argv.append(flag)
+        elif isinstance(val, list) and val and isinstance(val[0], list):     # repeatable (--quadratic)
+            for item in val: argv += [flag] + [str(x) for x in item]
+        elif isinstance(val, list): argv += [flag] + [str(x) for x in val]
+        else: argv += [flag, str(val)]
+    return argv
+
+# ---------- worker side ----------
+def warm(cache=None):
+    import matplotlib; matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import vendessimal_render  # noqa: F401  (plotting layer + layer graph)
+    if cache:
+        import prime_cache; prime_cache.set_default_cache(cache)
+    fig = plt.figure(figsize=(2, 1)); fig.text(0.5, 0.5, "warm"); fig.savefig(io.BytesIO(), format="png")
+    plt.close("all")
+
+def run_job(job):
+    import matplotlib.pyplot as plt
+    import vendessimal_prime_toolkit as vpt
+    t0, err = time.perf_counter(), io.StringIO()
+    try:
+        with contextlib.redirect_stderr(err):                 # argparse errors go into the result line
+            args = vpt.build_parser().parse_args(job_argv(job))
+        out = vpt.run_args(args)
+        return dict(id=job.get("id"), ok=True, out=out, seconds=round(time.perf_counter() - t0, 4))
+    except SystemExit:
+        return dict(id=job.get("id"), ok=False, error=(err.getvalue().strip().splitlines() or ["bad options"])[-1])
+    except Exception as e:
+        return dict(id=job.get("id"), ok=False, error=f"{type(e).__name__}: {e}")
+    finally:
+        plt.close("all")
+
+# ---------- driver ----------
+def _jobs(stream):
+    for n, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith("#"): continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield dict(id=n, _error=f"line {n}: {e}"); continue
+        if not isinstance(job, dict):
+            yield dict(id=n, _error=f"line {n}: job must be a JSON object"); continue
+        job.setdefault("id", n)
+        yield job
+
+def _result(fut, jid):
+    # a job's result line even when the pool broke (worker killed → BrokenProcessPool) or the call raised
+    try:
+        return fut.result()
+    except BaseException as e:
+        return dict(id=jid, ok=False, error=f"{type(e).__name__}: {e}")
+
+def serve(stream=sys.stdin, out=sys.stdout, workers=1, cache=None):
+    lock = threading.Lock()
+    done = dict(ok=0, failed=0)
+    def emit(res):
+        with lock:
+            done["ok" if res["ok"] else "failed"] += 1
+            out.write(json.dumps(res) + "\n"); out.flush()
+    if workers == 1:
+        warm(cache)
+        for job in _jobs(stream):
+            emit(dict(id=job["id"], ok=False, error=job["_error"]) if "_error" in job else run_job(job))
+        return done
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm, initargs=(cache,)) as pool:
+        for job in _jobs(stream):
+            if "_error" in job:
+                emit(dict(id=job["id"], ok=False, error=job["_error"])); continue
+            try:
+                fut = pool.submit(run_job, job)
+            except BrokenProcessPool as e:                   # pool already broken: report and keep reading
+                emit(dict(id=job["id"], ok=False, error=f"{type(e).__name__}: {e}")); continue
+            fut.add_done_callback(lambda f, jid=job["id"]: emit(_result(f, jid)))
+    return done
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="vendessimal_prime_toolkit.py worker")
+    ap.add_argument("--workers", type=int, default=1, help="parallel render processes")
+    ap.add_argument("--cache", type=str, default=None, help="prime/twin bitset cache dir (default: $VENDESSIMAL_CACHE)")
+    args = ap.parse_args(argv)
+    done = serve(sys.stdin, sys.stdout, args.workers, args.cache)
+    print(f"worker: {done['ok']} ok, {done['failed']} failed", file=sys.stderr)
+    return done